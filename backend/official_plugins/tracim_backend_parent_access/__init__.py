@@ -1,3 +1,5 @@
+import typing
+
 from pluggy import PluginManager
 
 from tracim_backend.exceptions import RoleAlreadyExistError
@@ -5,6 +7,7 @@
 from tracim_backend.lib.core.userworkspace import RoleApi
 from tracim_backend.lib.utils.request import TracimContext
 from tracim_backend.models.data import UserRoleInWorkspace
+from tracim_backend.models.data import Workspace
 from tracim_backend.models.tracim_session import TracimSession
 
 
@@ -47,6 +50,40 @@ def on_user_role_in_workspace_created(
                     pass
             current_workspace = current_workspace.parent
 
+    @hookimpl
+    def on_user_roles_in_workspace_bulk_modified(
+        self,
+        workspace: Workspace,
+        created_roles: typing.Dict[int, int],
+        modified_roles: typing.Dict[int, int],
+        deleted_roles: typing.Dict[int, int],
+        context: TracimContext,
+    ) -> None:
+        """
+        Set new members as members of all parent of this workspace with default workspace
+        default_user_role
+        """
+        rapi = RoleApi(session=context.dbsession, config=context.app_config, current_user=None)
+        current_workspace = workspace.parent
+        while current_workspace:
+            if not current_workspace.is_deleted:
+                member_ids = {
+                    user_id
+                    for (user_id,) in context.dbsession.query(UserRoleInWorkspace.user_id).filter(
+                        UserRoleInWorkspace.workspace_id == current_workspace.workspace_id
+                    )
+                }
+                rapi.bulk_update_workspace_members(
+                    current_workspace,
+                    {
+                        user_id: current_workspace.default_user_role.level
+                        for user_id in created_roles
+                        if user_id not in member_ids
+                    },
+                    with_notif=True,
+                )
+            current_workspace = current_workspace.parent
+
 
 def register_tracim_plugin(plugin_manager: PluginManager):
     plugin_manager.register(ParentAccessPlugin())
@@ -151,6 +151,9 @@
             "user_update = tracim_backend.command.user:UpdateUserCommand",
             "user delete = tracim_backend.command.cleanup:DeleteUserCommand",
             "user anonymize = tracim_backend.command.cleanup:AnonymizeUserCommand",
+            "user rebuild-stats = tracim_backend.command.user:RebuildUserStatsCommand",
+            # share
+            "share delete-disabled = tracim_backend.command.cleanup:DeleteDisabledSharesCommand",
             # db
             "db_init = tracim_backend.command.database:InitializeDBCommand",
             "db_delete = tracim_backend.command.database:DeleteDBCommand",
@@ -5,10 +5,12 @@
 import sys
 import warnings
 
+from hapic.data import HapicFile
 from hapic.ext.pyramid import PyramidContext
 from preview_generator.preview.builder.office__libreoffice import LO_MIMETYPES
 from pyramid.config import Configurator
 from pyramid.request import Request
+from pyramid.response import Response
 from pyramid.router import Router
 import pyramid_beaker
 from pyramid_multiauth import MultiAuthenticationPolicy
@@ -52,6 +54,7 @@
 from tracim_backend.lib.utils.authorization import TRACIM_DEFAULT_PERM
 from tracim_backend.lib.utils.authorization import AcceptAllAuthorizationPolicy
 from tracim_backend.lib.utils.cors import add_cors_support
+from tracim_backend.lib.utils.file_response import get_file_response
 from tracim_backend.lib.utils.logger import logger
 from tracim_backend.lib.utils.request import TracimRequest
 from tracim_backend.lib.utils.utils import sliced_dict
@@ -155,6 +158,9 @@ def doom_request_transaction(self, exc: Exception, *args, **kwargs) -> None:
     global_exception_caught = doom_request_transaction
     local_exception_caught = doom_request_transaction
 
+    def get_file_response(self, file_response: HapicFile, http_code: int) -> Response:
+        return get_file_response(file_response, http_code)
+
 
 def web(global_config: OrderedDict, **local_settings) -> Router:
     """ This function returns a Pyramid WSGI application.
@@ -1,4 +1,6 @@
+import json
 import os
+import threading
 import typing
 from xml.sax.saxutils import escape
 
@@ -7,6 +9,8 @@
 from caldav.lib.namespace import ns
 from colour import Color
 import requests
+from sqlalchemy import inspect
+from sqlalchemy.event import listen
 from sqlalchemy.orm import Session
 
 from tracim_backend import ApplicationApi
@@ -20,7 +24,11 @@
 from tracim_backend.exceptions import CannotCreateAgendaResource
 from tracim_backend.exceptions import WorkspaceAgendaDisabledException
 from tracim_backend.lib.core.plugins import hookimpl
+from tracim_backend.lib.core.user import UserApi
 from tracim_backend.lib.core.workspace import WorkspaceApi
+from tracim_backend.lib.rq import RqQueueName
+from tracim_backend.lib.rq import get_rq_queue2
+from tracim_backend.lib.rq.worker import worker_context
 from tracim_backend.lib.utils.logger import logger
 from tracim_backend.lib.utils.request import TracimContext
 from tracim_backend.models.auth import User
@@ -65,10 +73,28 @@
 """
 
 
+# INFO - properties of radicale collections as stored by the radicale multifilesystem storage
+RADICALE_PROPS_FILENAME = ".Radicale.props"
+RADICALE_DISPLAYNAME_PROP = "D:displayname"
+RADICALE_CALENDAR_DESCRIPTION_PROP = "C:calendar-description"
+
+
 class CalendarDescription(ValuedBaseElement):
     tag = ns("C", "calendar-description")
 
 
+# INFO - one http session per thread to reuse connections to radicale, recreated
+# after a fork as connections can't be shared between processes.
+_http_sessions = threading.local()
+
+
+def get_radicale_http_session() -> requests.Session:
+    if getattr(_http_sessions, "process_id", None) != os.getpid():
+        _http_sessions.session = requests.Session()
+        _http_sessions.process_id = os.getpid()
+    return _http_sessions.session
+
+
 class AgendaApi(object):
     def __init__(self, session: Session, current_user: typing.Optional[User], config: CFG) -> None:
         self._user = current_user
@@ -77,7 +103,7 @@ def __init__(self, session: Session, current_user: typing.Optional[User], config
 
     def _check_collection_exist(self, url) -> bool:
         try:
-            response = requests.get(url)
+            response = get_radicale_http_session().get(url)
         except requests.exceptions.ConnectionError as exc:
             logger.error(
                 self,
@@ -110,7 +136,7 @@ def create_collection(self, url, name, description, type: AgendaResourceType):
         else:
             raise ()
         try:
-            response = requests.request("mkcol", url, data=body.encode("utf-8"))
+            response = get_radicale_http_session().request("mkcol", url, data=body.encode("utf-8"))
         except requests.exceptions.ConnectionError as exc:
             raise AgendaServerConnectionError() from exc
         if not response.status_code == 201:
@@ -139,6 +165,7 @@ def update_collection_props(self, url, name, description, type: AgendaResourceTy
     def _update_agenda_props(self, url, name, description):
         try:
             caldav_client = caldav.DAVClient(username="tracim", password="tracim", url=url)
+            caldav_client.session = get_radicale_http_session()
             agenda = caldav.objects.Calendar(client=caldav_client, url=url)
             props = agenda.get_properties([caldav.dav.DisplayName(), CalendarDescription()])
             # TODO - G.M - 2019-04-11 - Rewrote this better, we need to verify
@@ -159,6 +186,7 @@ def _update_agenda_props(self, url, name, description):
     def _update_addressbook_props(self, url, name, description):
         try:
             caldav_client = caldav.DAVClient(username="tracim", password="tracim", url=url)
+            caldav_client.session = get_radicale_http_session()
             addressbook = caldav.objects.Calendar(client=caldav_client, url=url)
             props = addressbook.get_properties([caldav.dav.DisplayName()])
             # TODO - G.M - 2019-04-11 - Rewrote this better, we need to verify
@@ -277,13 +305,9 @@ def ensure_workspace_agenda_exists(self, workspace: Workspace) -> bool:
                 type=AgendaResourceType.addressbook,
             )
             result = True
-        for role in workspace.roles:
-            self._create_workspace_symlinks(
-                workspace.workspace_id, role.user_id, resource_type=AgendaResourceType.calendar
-            )
-            self._create_workspace_symlinks(
-                workspace.workspace_id, role.user_id, resource_type=AgendaResourceType.addressbook
-            )
+        self.reconcile_workspace_symlinks(
+            {(workspace.workspace_id, role.user_id): True for role in workspace.roles}
+        )
         return result
 
     def ensure_user_agenda_exists(self, user: User) -> bool:
@@ -334,6 +358,94 @@ def ensure_user_agenda_exists(self, user: User) -> bool:
         )
         return result
 
+    def user_agenda_is_up_to_date(self, user: User) -> bool:
+        """
+        Check, from radicale local storage only, that the user agenda and addressbook
+        exist with up-to-date properties and that their symlinks exist.
+        """
+        for resource_type in (AgendaResourceType.calendar, AgendaResourceType.addressbook):
+            collection_path = self._config.RADICALE__USER_AGENDA_PATH_PATTERN.format(
+                resource_type_dir=self.get_resource_type_dir(resource_type),
+                user_subdir=self._config.RADICALE__USER_SUBDIR,
+                user_id=user.user_id,
+            )
+            if not self._local_collection_is_up_to_date(
+                collection_path, user.display_name, "", resource_type
+            ):
+                return False
+            if not os.path.islink(
+                self._get_symlink_path("user", user.user_id, user.user_id, resource_type)
+            ):
+                return False
+        return True
+
+    def workspace_agenda_is_up_to_date(self, workspace: Workspace) -> bool:
+        """
+        Check, from radicale local storage only, that the workspace agenda and addressbook
+        exist with up-to-date properties and that symlinks of all members exist.
+        """
+        for resource_type in (AgendaResourceType.calendar, AgendaResourceType.addressbook):
+            collection_path = self._config.RADICALE__WORKSPACE_AGENDA_PATH_PATTERN.format(
+                resource_type_dir=self.get_resource_type_dir(resource_type),
+                workspace_subdir=self._config.RADICALE__WORKSPACE_SUBDIR,
+                workspace_id=workspace.workspace_id,
+            )
+            if not self._local_collection_is_up_to_date(
+                collection_path, workspace.label, workspace.description, resource_type
+            ):
+                return False
+            for role in workspace.roles:
+                if not os.path.islink(
+                    self._get_symlink_path(
+                        "space", workspace.workspace_id, role.user_id, resource_type
+                    )
+                ):
+                    return False
+        return True
+
+    def _local_collection_is_up_to_date(
+        self,
+        collection_path: str,
+        name: typing.Optional[str],
+        description: typing.Optional[str],
+        resource_type: AgendaResourceType,
+    ) -> bool:
+        collection_dir = "{local_path}{collection_path}".format(
+            local_path=self._config.RADICALE__LOCAL_PATH_STORAGE, collection_path=collection_path
+        )
+        if not os.path.isdir(collection_dir):
+            return False
+        try:
+            with open(os.path.join(collection_dir, RADICALE_PROPS_FILENAME)) as props_file:
+                props = json.load(props_file)
+        except (OSError, ValueError):
+            return False
+        # INFO - same comparison as update_collection_props(): None and "" are equivalent
+        if (props.get(RADICALE_DISPLAYNAME_PROP) or "") != (name or ""):
+            return False
+        if resource_type == AgendaResourceType.calendar and (
+            props.get(RADICALE_CALENDAR_DESCRIPTION_PROP) or ""
+        ) != (description or ""):
+            return False
+        return True
+
+    def _get_symlink_path(
+        self, owner_type: str, owner_id: int, dest_user_id: int, resource_type: AgendaResourceType
+    ) -> str:
+        user_resource_dir = self._config.RADICALE__USER_RESOURCE_DIR_PATTERN.format(
+            user_id=dest_user_id
+        )
+        user_resource = self._config.RADICALE__USER_RESOURCE_PATTERN.format(
+            owner_type=owner_type, owner_id=owner_id, resource_type=resource_type.value,
+        )
+        user_resource_path = self._config.RADICALE__USER_RESOURCE_PATH_PATTERN.format(
+            user_resource_dir=user_resource_dir, user_resource=user_resource
+        )
+        return "{local_path}{user_resource_path}".format(
+            local_path=self._config.RADICALE__LOCAL_PATH_STORAGE,
+            user_resource_path=user_resource_path,
+        )
+
     def get_resource_type_dir(self, resource_type: AgendaResourceType) -> typing.Optional[str]:
         if resource_type == AgendaResourceType.calendar:
             return self._config.RADICALE__CALENDAR_DIR
@@ -400,62 +512,45 @@ def _create_user_symlinks(
                 symlink_path,
             )
 
-    def _delete_workspace_symlinks(
-        self, workspace_id: int, dest_user_id: int, resource_type: AgendaResourceType
-    ):
-        user_resource_dir = self._config.RADICALE__USER_RESOURCE_DIR_PATTERN.format(
-            user_id=dest_user_id
-        )
-        user_resource = self._config.RADICALE__USER_RESOURCE_PATTERN.format(
-            owner_type="space", owner_id=workspace_id, resource_type=resource_type.value,
-        )
-        user_resource_path = self._config.RADICALE__USER_RESOURCE_PATH_PATTERN.format(
-            user_resource_dir=user_resource_dir, user_resource=user_resource
-        )
-        symlink_path = "{local_path}{user_resource_path}".format(
-            local_path=self._config.RADICALE__LOCAL_PATH_STORAGE,
-            user_resource_path=user_resource_path,
-        )
-        os.remove(symlink_path)
-
-    def _create_workspace_symlinks(
-        self, workspace_id: int, dest_user_id: int, resource_type: AgendaResourceType
-    ):
-        resource_type_dir = self.get_resource_type_dir(resource_type)
+    def _get_workspace_agenda_local_path(
+        self, workspace_id: int, resource_type: AgendaResourceType
+    ) -> str:
         workspace_agenda_path = self._config.RADICALE__WORKSPACE_AGENDA_PATH_PATTERN.format(
-            resource_type_dir=resource_type_dir,
+            resource_type_dir=self.get_resource_type_dir(resource_type),
             workspace_subdir=self._config.RADICALE__WORKSPACE_SUBDIR,
             workspace_id=workspace_id,
         )
-        user_resource_dir = self._config.RADICALE__USER_RESOURCE_DIR_PATTERN.format(
-            user_id=dest_user_id
-        )
-        user_resource = self._config.RADICALE__USER_RESOURCE_PATTERN.format(
-            owner_type="space", owner_id=workspace_id, resource_type=resource_type.value,
-        )
-        os.makedirs(
-            "{local_path}/{user_resource_dir}".format(
-                local_path=self._config.RADICALE__LOCAL_PATH_STORAGE,
-                user_resource_dir=user_resource_dir,
-            ),
-            exist_ok=True,
-        )
-
-        user_ressource_path = self._config.RADICALE__USER_RESOURCE_PATH_PATTERN.format(
-            user_resource_dir=user_resource_dir, user_resource=user_resource,
-        )
-        symlink_path = "{local_path}{user_resource_path}".format(
+        return "{local_path}{workspace_agenda_path}".format(
             local_path=self._config.RADICALE__LOCAL_PATH_STORAGE,
-            user_resource_path=user_ressource_path,
+            workspace_agenda_path=workspace_agenda_path,
         )
-        if not os.path.islink(symlink_path):
-            os.symlink(
-                "{local_path}{workspace_agenda_path}".format(
-                    local_path=self._config.RADICALE__LOCAL_PATH_STORAGE,
-                    workspace_agenda_path=workspace_agenda_path,
-                ),
-                symlink_path,
-            )
+
+    def reconcile_workspace_symlinks(
+        self, symlinks: typing.Dict[typing.Tuple[int, int], bool]
+    ) -> None:
+        """
+        Create (True) or remove (False) the calendar and addressbook symlinks of each
+        (workspace_id, user_id) in one pass, links already in the wanted state are skipped.
+        """
+        known_dirs = set()  # type: typing.Set[str]
+        for (workspace_id, user_id), must_exist in sorted(symlinks.items()):
+            for resource_type in (AgendaResourceType.calendar, AgendaResourceType.addressbook):
+                symlink_path = self._get_symlink_path("space", workspace_id, user_id, resource_type)
+                is_link = os.path.islink(symlink_path)
+                if not must_exist:
+                    if is_link:
+                        os.remove(symlink_path)
+                    continue
+                target_path = self._get_workspace_agenda_local_path(workspace_id, resource_type)
+                if is_link:
+                    if os.readlink(symlink_path) == target_path:
+                        continue
+                    os.remove(symlink_path)
+                symlink_dir = os.path.dirname(symlink_path)
+                if symlink_dir not in known_dirs:
+                    os.makedirs(symlink_dir, exist_ok=True)
+                    known_dirs.add(symlink_dir)
+                os.symlink(target_path, symlink_path)
 
     def get_user_agendas(
         self,
@@ -543,53 +638,146 @@ def get_user_agendas(
         return user_agendas
 
 
+class WorkspaceSymlinksReconciliation(object):
+    """
+    Workspace agenda symlinks to create (True) or remove (False) for each
+    (workspace_id, user_id) modified in a session.
+
+    They are reconciled in one pass once the session is committed: nothing is written
+    for rolled back transactions and a link modified several times is only written once.
+    """
+
+    SESSION_INFO_KEY = "agenda_workspace_symlinks_reconciliation"
+
+    def __init__(self, config: CFG) -> None:
+        self._config = config
+        self.symlinks = {}  # type: typing.Dict[typing.Tuple[int, int], bool]
+
+    @classmethod
+    def for_session(cls, session: Session, config: CFG) -> "WorkspaceSymlinksReconciliation":
+        reconciliation = session.info.get(cls.SESSION_INFO_KEY)
+        if reconciliation is None:
+            reconciliation = cls(config)
+            session.info[cls.SESSION_INFO_KEY] = reconciliation
+            listen(session, "after_commit", reconciliation.apply)
+            listen(session, "after_rollback", reconciliation.discard)
+        return reconciliation
+
+    def apply(self, session: Session) -> None:
+        symlinks, self.symlinks = self.symlinks, {}
+        if not symlinks:
+            return
+        agenda_api = AgendaApi(current_user=None, session=session, config=self._config)
+        try:
+            agenda_api.reconcile_workspace_symlinks(symlinks)
+        except Exception as exc:
+            logger.error(self, "Something went wrong during agenda symlinks reconciliation")
+            logger.exception(self, exc)
+
+    def discard(self, session: Session) -> None:
+        self.symlinks = {}
+
+
 class AgendaHooks:
+    """
+    Keep radicale agendas in sync with users and workspaces.
+
+    Radicale is reached after the commit through a RQ job when jobs are processed
+    asynchronously, and directly otherwise.
+    """
+
     def ensure_workspace_agenda_exists(
         self, workspace: Workspace, context: TracimContext, create_event: bool
     ):
         app_lib = ApplicationApi(app_list=app_list)
         if app_lib.exist(AGENDA__APP_SLUG):
             if workspace.agenda_enabled:
-                agenda_api = AgendaApi(
-                    current_user=None, session=context.dbsession, config=context.app_config
-                )
-                try:
-                    agenda_already_exists = agenda_api.ensure_workspace_agenda_exists(workspace)
-                    if create_event and agenda_already_exists:
-                        logger.warning(
-                            self,
-                            "workspace {} is just created but its own agenda already exists !!".format(
-                                workspace.workspace_id
-                            ),
+                if context.app_config.JOBS__PROCESSING_MODE == CFG.CST.ASYNC:
+                    queue = get_rq_queue2(context.app_config, RqQueueName.AGENDA)
+                    workspace_id = workspace.workspace_id
+
+                    def sync_via_rq_worker(session: Session, flush_context=None) -> None:
+                        queue.enqueue(
+                            self._ensure_workspace_agenda_exists_from_id, workspace_id, create_event
                         )
-                except AgendaServerConnectionError as exc:
-                    logger.error(self, "Cannot connect to agenda server")
-                    logger.exception(self, exc)
-                except Exception as exc:
-                    logger.error(self, "Something goes wrong during agenda create/update")
-                    logger.exception(self, exc)
+
+                    listen(context.dbsession, "after_commit", sync_via_rq_worker, once=True)
+                else:
+                    self._ensure_workspace_agenda_exists(workspace, context, create_event)
+
+    def _ensure_workspace_agenda_exists_from_id(self, workspace_id: int, create_event: bool):
+        """Is exclusively made to be used inside a RQ DatabaseWorker()."""
+        with worker_context() as context:
+            workspace_api = WorkspaceApi(
+                current_user=None, session=context.dbsession, config=context.app_config
+            )
+            self._ensure_workspace_agenda_exists(
+                workspace_api.get_one(workspace_id), context, create_event
+            )
+
+    def _ensure_workspace_agenda_exists(
+        self, workspace: Workspace, context: TracimContext, create_event: bool
+    ):
+        agenda_api = AgendaApi(
+            current_user=None, session=context.dbsession, config=context.app_config
+        )
+        try:
+            agenda_already_exists = agenda_api.ensure_workspace_agenda_exists(workspace)
+            if create_event and agenda_already_exists:
+                logger.warning(
+                    self,
+                    "workspace {} is just created but its own agenda already exists !!".format(
+                        workspace.workspace_id
+                    ),
+                )
+        except AgendaServerConnectionError as exc:
+            logger.error(self, "Cannot connect to agenda server")
+            logger.exception(self, exc)
+        except Exception as exc:
+            logger.error(self, "Something goes wrong during agenda create/update")
+            logger.exception(self, exc)
 
     def ensure_user_agenda_exists(self, user: User, context: TracimContext, create_event: bool):
         app_lib = ApplicationApi(app_list=app_list)
         if app_lib.exist(AGENDA__APP_SLUG):
-            agenda_api = AgendaApi(
+            if context.app_config.JOBS__PROCESSING_MODE == CFG.CST.ASYNC:
+                queue = get_rq_queue2(context.app_config, RqQueueName.AGENDA)
+                user_id = user.user_id
+
+                def sync_via_rq_worker(session: Session, flush_context=None) -> None:
+                    queue.enqueue(self._ensure_user_agenda_exists_from_id, user_id, create_event)
+
+                listen(context.dbsession, "after_commit", sync_via_rq_worker, once=True)
+            else:
+                self._ensure_user_agenda_exists(user, context, create_event)
+
+    def _ensure_user_agenda_exists_from_id(self, user_id: int, create_event: bool):
+        """Is exclusively made to be used inside a RQ DatabaseWorker()."""
+        with worker_context() as context:
+            user_api = UserApi(
                 current_user=None, session=context.dbsession, config=context.app_config
             )
-            try:
-                agenda_already_exists = agenda_api.ensure_user_agenda_exists(user)
-                if agenda_already_exists and create_event:
-                    logger.warning(
-                        self,
-                        "user {} has just been created but their own agenda already exists".format(
-                            user.user_id
-                        ),
-                    )
-            except AgendaServerConnectionError as exc:
-                logger.error(self, "Cannot connect to the agenda server")
-                logger.exception(self, exc)
-            except Exception as exc:
-                logger.error(self, "Something went wrong during agenda create/update")
-                logger.exception(self, exc)
+            self._ensure_user_agenda_exists(user_api.get_one(user_id), context, create_event)
+
+    def _ensure_user_agenda_exists(self, user: User, context: TracimContext, create_event: bool):
+        agenda_api = AgendaApi(
+            current_user=None, session=context.dbsession, config=context.app_config
+        )
+        try:
+            agenda_already_exists = agenda_api.ensure_user_agenda_exists(user)
+            if agenda_already_exists and create_event:
+                logger.warning(
+                    self,
+                    "user {} has just been created but their own agenda already exists".format(
+                        user.user_id
+                    ),
+                )
+        except AgendaServerConnectionError as exc:
+            logger.error(self, "Cannot connect to the agenda server")
+            logger.exception(self, exc)
+        except Exception as exc:
+            logger.error(self, "Something went wrong during agenda create/update")
+            logger.exception(self, exc)
 
     @hookimpl
     def on_workspace_created(self, workspace: Workspace, context: TracimContext) -> None:
@@ -597,7 +785,14 @@ def on_workspace_created(self, workspace: Workspace, context: TracimContext) ->
 
     @hookimpl
     def on_workspace_modified(self, workspace: Workspace, context: TracimContext) -> None:
-
+        # INFO - agenda only depends on these workspace properties
+        attribute_state = inspect(workspace).attrs
+        if not (
+            attribute_state.label.history.has_changes()
+            or attribute_state.description.history.has_changes()
+            or attribute_state.agenda_enabled.history.has_changes()
+        ):
+            return
         self.ensure_workspace_agenda_exists(workspace, context, create_event=False)
 
     @hookimpl
@@ -613,44 +808,47 @@ def on_user_modified(self, user: User, context: TracimContext) -> None:
         # TODO - G.M - 04-04-2018 - [auth]
         # Check if this is already needed with new auth system
         user.ensure_auth_token(validity_seconds=context.app_config.USER__AUTH_TOKEN__VALIDITY)
+        # INFO - agenda only depends on the user display name, do not reach radicale
+        # for other modifications (connection status, auth token…)
+        if not inspect(user).attrs.display_name.history.has_changes():
+            return
         self.ensure_user_agenda_exists(user, context, create_event=False)
 
-    @hookimpl
-    def on_user_role_in_workspace_deleted(
-        self, role: UserRoleInWorkspace, context: TracimContext
+    def _queue_workspace_symlinks(
+        self,
+        workspace_id: int,
+        user_ids: typing.Iterable[int],
+        must_exist: bool,
+        context: TracimContext,
     ) -> None:
         app_lib = ApplicationApi(app_list=app_list)
         if app_lib.exist(AGENDA__APP_SLUG):
-            agenda_api = AgendaApi(
-                current_user=None, session=context.dbsession, config=context.app_config
-            )
-            agenda_api._delete_workspace_symlinks(
-                workspace_id=role.workspace_id,
-                dest_user_id=role.user_id,
-                resource_type=AgendaResourceType.calendar,
-            )
-            agenda_api._delete_workspace_symlinks(
-                workspace_id=role.workspace_id,
-                dest_user_id=role.user_id,
-                resource_type=AgendaResourceType.addressbook,
+            reconciliation = WorkspaceSymlinksReconciliation.for_session(
+                context.dbsession, context.app_config
             )
+            for user_id in user_ids:
+                reconciliation.symlinks[(workspace_id, user_id)] = must_exist
+
+    @hookimpl
+    def on_user_role_in_workspace_deleted(
+        self, role: UserRoleInWorkspace, context: TracimContext
+    ) -> None:
+        self._queue_workspace_symlinks(role.workspace_id, [role.user_id], False, context)
 
     @hookimpl
     def on_user_role_in_workspace_created(
         self, role: UserRoleInWorkspace, context: TracimContext
     ) -> None:
-        app_lib = ApplicationApi(app_list=app_list)
-        if app_lib.exist(AGENDA__APP_SLUG):
-            agenda_api = AgendaApi(
-                current_user=None, session=context.dbsession, config=context.app_config
-            )
-            agenda_api._create_workspace_symlinks(
-                workspace_id=role.workspace_id,
-                dest_user_id=role.user_id,
-                resource_type=AgendaResourceType.calendar,
-            )
-            agenda_api._create_workspace_symlinks(
-                workspace_id=role.workspace_id,
-                dest_user_id=role.user_id,
-                resource_type=AgendaResourceType.addressbook,
-            )
+        self._queue_workspace_symlinks(role.workspace_id, [role.user_id], True, context)
+
+    @hookimpl
+    def on_user_roles_in_workspace_bulk_modified(
+        self,
+        workspace: Workspace,
+        created_roles: typing.Dict[int, int],
+        modified_roles: typing.Dict[int, int],
+        deleted_roles: typing.Dict[int, int],
+        context: TracimContext,
+    ) -> None:
+        self._queue_workspace_symlinks(workspace.workspace_id, deleted_roles, False, context)
+        self._queue_workspace_symlinks(workspace.workspace_id, created_roles, True, context)
@@ -213,6 +213,7 @@ def download_file(self, context, request: TracimRequest, hapic_data=None):
                 default_filename=content.file_name,
                 force_download=hapic_data.query.force_download,
                 last_modified=content.updated,
+                etag=api.get_revision_file_etag(content.revision),
             )
         except CannotGetDepotFileDepotCorrupted as exc:
             raise TracimFileNotFound(
@@ -257,6 +258,8 @@ def download_revisions_file(self, context, request: TracimRequest, hapic_data=No
                 default_filename=default_filename,
                 force_download=hapic_data.query.force_download,
                 last_modified=revision.updated,
+                etag=api.get_revision_file_etag(revision),
+                immutable=True,
             )
         except CannotGetDepotFileDepotCorrupted as exc:
             raise TracimFileNotFound(
@@ -365,6 +368,7 @@ def preview_pdf_full_revision(self, context, request: TracimRequest, hapic_data=
             filename=hapic_data.path.filename,
             default_filename=default_filename,
             force_download=hapic_data.query.force_download,
+            immutable=True,
         )
 
     @hapic.with_api_doc(tags=[SWAGGER_TAG__CONTENT_FILE_ENDPOINTS])
@@ -400,6 +404,7 @@ def preview_pdf_revision(self, context, request: TracimRequest, hapic_data=None)
             default_filename=default_filename,
             page_number=hapic_data.query.page,
             force_download=hapic_data.query.force_download,
+            immutable=True,
         )
 
     # jpg
@@ -520,6 +525,7 @@ def sized_preview_jpg_revision(self, context, request: TracimRequest, hapic_data
             height=hapic_data.path.height,
             width=hapic_data.path.width,
             force_download=hapic_data.query.force_download,
+            immutable=True,
         )
 
     @hapic.with_api_doc(tags=[SWAGGER_TAG__CONTENT_FILE_ENDPOINTS])
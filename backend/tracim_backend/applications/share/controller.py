@@ -228,9 +228,10 @@ def guest_download_file(self, context, request: TracimRequest, hapic_data=None)
         else:
             password = None
         api.check_password(content_share, password=password)
-        content = ContentApi(
-            current_user=None, session=request.dbsession, config=app_config
-        ).get_one(content_share.content_id, content_type=content_type_list.Any_SLUG)
+        content_api = ContentApi(current_user=None, session=request.dbsession, config=app_config)
+        content = content_api.get_one(
+            content_share.content_id, content_type=content_type_list.Any_SLUG
+        )
         workspace_api = WorkspaceApi(
             current_user=None, session=request.dbsession, config=app_config
         )
@@ -246,6 +247,7 @@ def guest_download_file(self, context, request: TracimRequest, hapic_data=None)
                 default_filename=content.file_name,
                 force_download=True,
                 last_modified=content.updated,
+                etag=content_api.get_revision_file_etag(content.revision),
             )
         except CannotGetDepotFileDepotCorrupted as exc:
             raise TracimFileNotFound(
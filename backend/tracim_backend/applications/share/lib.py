@@ -177,6 +177,27 @@ def disable_content_share(self, content: Content, share_id: int) -> ContentShare
         self.save(content_share=content_share_to_disable)
         return content_share_to_disable
 
+    def delete_disabled_content_shares(self, disabled_before: datetime, limit: int) -> int:
+        """
+        Delete (at most limit) content shares disabled before given date,
+        to be called repeatedly to purge all of them by batches.
+        :return: number of deleted content shares
+        """
+        share_ids = [
+            share_id
+            for (share_id,) in self._session.query(ContentShare.share_id)
+            .filter(ContentShare.enabled == False)  # noqa: E712
+            .filter(ContentShare.disabled < disabled_before)
+            .limit(limit)
+        ]
+        if not share_ids:
+            return 0
+        return (
+            self._session.query(ContentShare)
+            .filter(ContentShare.share_id.in_(share_ids))
+            .delete(synchronize_session=False)
+        )
+
     def frontend_url(self, content_share: ContentShare) -> str:
         frontend_ui_base_url = get_frontend_ui_base_url(config=self._config)
         return FRONTEND_SHARED_CONTENT_LINK_PATTERN.format(
@@ -9,6 +9,7 @@
 from sqlalchemy import DateTime
 from sqlalchemy import Enum
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import Sequence
 from sqlalchemy import Unicode
@@ -114,3 +115,8 @@ def validate_password(self, cleartext_password: typing.Optional[str]) -> bool:
         if not self.password:
             return False
         return self._validate_hash(self.password, cleartext_password)
+
+
+Index("idx__content_shares__share_token", ContentShare.share_token, unique=True)
+Index("idx__content_shares__content_id__enabled", ContentShare.content_id, ContentShare.enabled)
+Index("idx__content_shares__disabled", ContentShare.disabled)
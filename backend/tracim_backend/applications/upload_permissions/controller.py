@@ -213,6 +213,7 @@ def guest_upload_file(self, context, request: TracimRequest, hapic_data=None) ->
             message=hapic_data.forms.message,
             files=upload_files.files,
             do_notify=app_config.EMAIL__NOTIFICATION__ACTIVATED,
+            tm=request.tm,
         )
         return
 
@@ -1,5 +1,7 @@
 import cgi
 from datetime import datetime
+import itertools
+import os
 from smtplib import SMTPException
 from smtplib import SMTPRecipientsRefused
 import typing
@@ -37,13 +39,14 @@
 from tracim_backend.models.context_models import ContentInContext
 from tracim_backend.models.context_models import WorkspaceInContext
 from tracim_backend.models.data import ActionDescription
+from tracim_backend.models.data import Content
 from tracim_backend.models.data import ContentNamespaces
 from tracim_backend.models.data import Workspace
-from tracim_backend.models.revision_protection import new_revision
 
 FRONTEND_UPLOAD_PERMISSION_LINK_PATTERN = (
     "{frontend_ui_base_url}guest-upload/{upload_permission_token}"
 )
+UPLOAD_FILES_BATCH_SIZE = 50
 
 
 class UploadPermissionLib(object):
@@ -209,6 +212,29 @@ def disable_upload_permission(
         self.save(upload_permission=upload_permission_to_disable)
         return upload_permission_to_disable
 
+    def delete_disabled_upload_permissions(self, disabled_before: datetime, limit: int) -> int:
+        """
+        Delete (at most limit) upload permissions disabled before given date,
+        to be called repeatedly to purge all of them by batches.
+        :return: number of deleted upload permissions
+        """
+        upload_permission_ids = [
+            upload_permission_id
+            for (upload_permission_id,) in self._session.query(
+                UploadPermission.upload_permission_id
+            )
+            .filter(UploadPermission.enabled == False)  # noqa: E712
+            .filter(UploadPermission.disabled < disabled_before)
+            .limit(limit)
+        ]
+        if not upload_permission_ids:
+            return 0
+        return (
+            self._session.query(UploadPermission)
+            .filter(UploadPermission.upload_permission_id.in_(upload_permission_ids))
+            .delete(synchronize_session=False)
+        )
+
     def frontend_url(self, upload_permission: UploadPermission) -> str:
         frontend_ui_base_url = get_frontend_ui_base_url(config=self._config)
         return FRONTEND_UPLOAD_PERMISSION_LINK_PATTERN.format(
@@ -243,9 +269,18 @@ def upload_files(
         upload_permission: UploadPermission,
         uploader_username: str,
         message: typing.Optional[str],
-        files: typing.List[cgi.FieldStorage],
+        files: typing.Iterable[cgi.FieldStorage],
         do_notify: bool = False,
+        tm: typing.Optional[transaction.TransactionManager] = None,
+        batch_size: int = UPLOAD_FILES_BATCH_SIZE,
     ) -> typing.List[ContentInContext]:
+        """
+        Create one file content (with a comment) per uploaded file, in an upload folder.
+        Files are processed by batches of batch_size: quota is checked once per batch and,
+        if a transaction manager is given, each batch is committed so already uploaded files
+        are kept if the upload is interrupted.
+        Notification is sent once, after the last batch is committed.
+        """
         content_api = ContentApi(
             config=self._config,
             current_user=upload_permission.author,
@@ -275,7 +310,6 @@ def upload_files(
                 filename=folder_label, workspace=upload_permission.workspace
             )
 
-        created_contents = []
         if message:
             comment_message = _("Message from {username}: {message}").format(
                 username=uploader_username, message=message
@@ -283,28 +317,29 @@ def upload_files(
         else:
             comment_message = _("Uploaded by {username}.").format(username=uploader_username)
 
-        for _file in files:
-            content = content_api.create(
-                filename=_file.filename,
-                content_type_slug=content_type_list.File.slug,
-                workspace=upload_permission.workspace,
-                parent=upload_folder,
-                do_notify=False,
-                content_namespace=ContentNamespaces.UPLOAD,
-            )
-            content_api.save(content, ActionDescription.CREATION)
-            with new_revision(session=self._session, tm=transaction.manager, content=content):
-                content_api.update_file_data(
-                    content,
-                    new_filename=_file.filename,
-                    new_mimetype=_file.type,
-                    new_content=_file.file,
+        created_contents = []  # type: typing.List[Content]
+        files_iterator = iter(files)
+        while True:
+            batch = list(itertools.islice(files_iterator, batch_size))
+            if not batch:
+                break
+            workspace = upload_permission.workspace
+            batch_content_length = sum(self._get_file_size(_file) for _file in batch)
+            content_api.check_workspace_size_limitation(batch_content_length, workspace)
+            content_api.check_owner_size_limitation(batch_content_length, workspace)
+            for _file in batch:
+                created_contents.append(
+                    self._create_uploaded_file_content(
+                        content_api, workspace, upload_folder, _file, comment_message
+                    )
                 )
-            content_api.create_comment(
-                parent=content, content=comment_message, do_save=True, do_notify=False
-            )
-            created_contents.append(content_api.get_content_in_context(content))
+            if tm:
+                tm.commit()
+                tm.begin()
 
+        created_contents_in_context = [
+            content_api.get_content_in_context(content) for content in created_contents
+        ]
         if do_notify:
             workspace_lib = WorkspaceApi(
                 config=self._config, current_user=upload_permission.author, session=self._session
@@ -315,8 +350,44 @@ def upload_files(
                     upload_permission.workspace
                 ),
                 uploader_message=message,
-                uploaded_contents=created_contents,
+                uploaded_contents=created_contents_in_context,
                 uploader_email=upload_permission.email,
             )
 
-        return created_contents
+        return created_contents_in_context
+
+    def _create_uploaded_file_content(
+        self,
+        content_api: ContentApi,
+        workspace: Workspace,
+        upload_folder: Content,
+        _file: cgi.FieldStorage,
+        comment_message: str,
+    ) -> Content:
+        # INFO - file data is set on the creation revision: only one revision is created
+        with self._session.no_autoflush:
+            content = content_api.create(
+                filename=_file.filename,
+                content_type_slug=content_type_list.File.slug,
+                workspace=workspace,
+                parent=upload_folder,
+                do_notify=False,
+                content_namespace=ContentNamespaces.UPLOAD,
+            )
+            content_api.update_file_data(
+                content,
+                new_filename=_file.filename,
+                new_mimetype=_file.type,
+                new_content=_file.file,
+            )
+        content_api.save(content, ActionDescription.CREATION, do_notify=False)
+        content_api.create_comment(
+            parent=content, content=comment_message, do_save=True, do_notify=False
+        )
+        return content
+
+    def _get_file_size(self, _file: cgi.FieldStorage) -> int:
+        _file.file.seek(0, os.SEEK_END)
+        size = _file.file.tell()
+        _file.file.seek(0)
+        return size
@@ -8,6 +8,7 @@
 from sqlalchemy import DateTime
 from sqlalchemy import Enum
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import Sequence
 from sqlalchemy import Unicode
@@ -116,3 +117,12 @@ def validate_password(self, cleartext_password: typing.Optional[str]) -> bool:
         if not self.password:
             return False
         return self._validate_hash(self.password, cleartext_password)
+
+
+Index("idx__upload_permissions__token", UploadPermission.token, unique=True)
+Index(
+    "idx__upload_permissions__workspace_id__enabled",
+    UploadPermission.workspace_id,
+    UploadPermission.enabled,
+)
+Index("idx__upload_permissions__disabled", UploadPermission.disabled)
@@ -1,16 +1,20 @@
 # -*- coding: utf-8 -*-
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+import enum
 
 import plaster
 from pyramid.scripting import AppEnvironment
+from sqlalchemy.orm import selectinload
 
 from tracim_backend.applications.agenda.lib import AgendaApi
 from tracim_backend.command import AppContextCommand
 from tracim_backend.exceptions import AgendaServerConnectionError
 from tracim_backend.exceptions import CannotCreateAgendaResource
 from tracim_backend.lib.core.user import UserApi
-from tracim_backend.lib.core.workspace import WorkspaceApi
 from tracim_backend.lib.utils.logger import logger
+from tracim_backend.models.auth import User
+from tracim_backend.models.data import Workspace
 from tracim_backend.wsgi import CALDAV_APP_NAME
 from tracim_backend.wsgi import caldav_app
 
@@ -37,12 +41,54 @@ def _get_server(self, config_uri: str):
         return loader.get_wsgi_server(name=CALDAV_APP_NAME)
 
 
+class AgendaSyncResult(enum.Enum):
+    UP_TO_DATE = "up_to_date"
+    CREATED = "created"
+    UPDATED = "updated"
+    ERROR = "error"
+
+
 class CaldavSyncCommand(AppContextCommand):
     def get_description(self) -> str:
         return "synchronize tracim with radicale"
 
     def get_parser(self, prog_name: str) -> argparse.ArgumentParser:
         parser = super().get_parser(prog_name)
+        parser.add_argument(
+            "--workers",
+            help="number of agendas synchronized in parallel",
+            dest="workers",
+            type=int,
+            default=4,
+        )
+        parser.add_argument(
+            "--batch-size",
+            help="number of users/workspaces loaded at once",
+            dest="batch_size",
+            type=int,
+            default=100,
+        )
+        parser.add_argument(
+            "--from-user-id",
+            help="resume users synchronization from this user id",
+            dest="from_user_id",
+            type=int,
+            default=0,
+        )
+        parser.add_argument(
+            "--from-workspace-id",
+            help="resume workspaces synchronization from this workspace id",
+            dest="from_workspace_id",
+            type=int,
+            default=0,
+        )
+        parser.add_argument(
+            "--force",
+            help="synchronize all agendas, even those which look up-to-date in radicale storage",
+            dest="force",
+            action="store_true",
+            default=False,
+        )
         return parser
 
     def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvironment) -> None:
@@ -51,59 +97,103 @@ def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvir
         self._session = app_context["request"].dbsession
         self._app_config = app_context["registry"].settings["CFG"]
         self._user_api = UserApi(current_user=None, session=self._session, config=self._app_config)
-        self._workspace_api = WorkspaceApi(
-            current_user=None, force_role=True, session=self._session, config=self._app_config
-        )
         self._agenda_api = AgendaApi(
             current_user=None, session=self._session, config=self._app_config
         )
+        self._force = parsed_args.force
+
+        # INFO - radicale is reached by a bounded pool of threads, objects given to them are
+        # fully loaded before, so that threads do not use the database session.
+        with ThreadPoolExecutor(max_workers=parsed_args.workers) as executor:
+            self._sync_users_agendas(executor, parsed_args.batch_size, parsed_args.from_user_id)
+            self._sync_workspaces_agendas(
+                executor, parsed_args.batch_size, parsed_args.from_workspace_id
+            )
 
+    def _sync_users_agendas(
+        self, executor: ThreadPoolExecutor, batch_size: int, from_user_id: int
+    ) -> None:
         # INFO - G.M - 2019-03-13 - check users agendas
-        users = self._user_api.get_all()
+        nb_user_agendas = 0
         nb_error_agenda_access = 0
-        for user in users:
-            try:
-                already_exist = self._agenda_api.ensure_user_agenda_exists(user)
-                if not already_exist:
+        last_user_id = from_user_id - 1
+        while True:
+            users = (
+                self._user_api.base_query()
+                .filter(User.user_id > last_user_id)
+                .order_by(User.user_id)
+                .limit(batch_size)
+                .all()
+            )
+            if not users:
+                break
+            results = executor.map(self._sync_user_agenda, users)
+            for user, result in zip(users, results):
+                if result == AgendaSyncResult.CREATED:
                     print("New created agenda for user {}".format(user))
-            except CannotCreateAgendaResource as exc:
-                nb_error_agenda_access += 1
-                print("Cannot create agenda for user {}".format(user.user_id))
-                logger.exception(self, exc)
-            except AgendaServerConnectionError as exc:
-                nb_error_agenda_access += 1
-                print("Cannot access to agenda server: connection error.")
-                logger.exception(self, exc)
-            except Exception as exc:
-                nb_error_agenda_access += 1
-                print("Something goes wrong during agenda create/update")
-                logger.exception(self, exc)
-        nb_user_agendas = len(users)
-        nb_verified_user_agenda = len(users) - nb_error_agenda_access
+                elif result == AgendaSyncResult.ERROR:
+                    nb_error_agenda_access += 1
+            nb_user_agendas += len(users)
+            last_user_id = users[-1].user_id
+            print("users agenda synchronized up to user id {}".format(last_user_id))
+        nb_verified_user_agenda = nb_user_agendas - nb_error_agenda_access
         print("{}/{} users agenda verified".format(nb_verified_user_agenda, nb_user_agendas))
 
+    def _sync_user_agenda(self, user: User) -> AgendaSyncResult:
+        if not self._force and self._agenda_api.user_agenda_is_up_to_date(user):
+            return AgendaSyncResult.UP_TO_DATE
+        try:
+            already_exist = self._agenda_api.ensure_user_agenda_exists(user)
+        except CannotCreateAgendaResource as exc:
+            print("Cannot create agenda for user {}".format(user.user_id))
+            logger.exception(self, exc)
+            return AgendaSyncResult.ERROR
+        except AgendaServerConnectionError as exc:
+            print("Cannot access to agenda server: connection error.")
+            logger.exception(self, exc)
+            return AgendaSyncResult.ERROR
+        except Exception as exc:
+            print("Something goes wrong during agenda create/update")
+            logger.exception(self, exc)
+            return AgendaSyncResult.ERROR
+        return AgendaSyncResult.UPDATED if already_exist else AgendaSyncResult.CREATED
+
+    def _sync_workspaces_agendas(
+        self, executor: ThreadPoolExecutor, batch_size: int, from_workspace_id: int
+    ) -> None:
         # # INFO - G.M - 2019-03-13 - check workspaces agendas
-        workspaces = self._workspace_api.get_all()
-        nb_error_agenda_access = 0
-        nb_workspaces = 0
+        workspace_query = self._session.query(Workspace).filter(
+            Workspace.is_deleted == False  # noqa: E712
+        )
+        nb_workspace_without_agenda_enabled = workspace_query.filter(
+            Workspace.agenda_enabled == False  # noqa: E712
+        ).count()
         nb_agenda_enabled_workspace = 0
-        for workspace in workspaces:
-            nb_workspaces += 1
-            if workspace.agenda_enabled:
-                nb_agenda_enabled_workspace += 1
-                try:
-                    already_exist = self._agenda_api.ensure_workspace_agenda_exists(workspace)
-                    if not already_exist:
-                        print("New created agenda for workspace {}".format(workspace.workspace_id))
-                except CannotCreateAgendaResource as exc:
-                    print("Cannot create agenda for workspace {}".format(workspace.workspace_id))
-                    logger.exception(self, exc)
-                except AgendaServerConnectionError as exc:
+        nb_error_agenda_access = 0
+        last_workspace_id = from_workspace_id - 1
+        while True:
+            workspaces = (
+                workspace_query.filter(
+                    Workspace.agenda_enabled == True,  # noqa: E712
+                    Workspace.workspace_id > last_workspace_id,
+                )
+                .options(selectinload(Workspace.roles))
+                .order_by(Workspace.workspace_id)
+                .limit(batch_size)
+                .all()
+            )
+            if not workspaces:
+                break
+            results = executor.map(self._sync_workspace_agenda, workspaces)
+            for workspace, result in zip(workspaces, results):
+                if result == AgendaSyncResult.CREATED:
+                    print("New created agenda for workspace {}".format(workspace.workspace_id))
+                elif result == AgendaSyncResult.ERROR:
                     nb_error_agenda_access += 1
-                    print("Cannot access to agenda server: connection error.")
-                    logger.exception(self, exc)
+            nb_agenda_enabled_workspace += len(workspaces)
+            last_workspace_id = workspaces[-1].workspace_id
+            print("workspaces agenda synchronized up to workspace id {}".format(last_workspace_id))
         nb_verified_workspace_agenda = nb_agenda_enabled_workspace - nb_error_agenda_access
-        nb_workspace_without_agenda_enabled = nb_workspaces - nb_agenda_enabled_workspace
         print(
             "{}/{} workspace agenda verified ({} workspace without agenda feature enabled)".format(
                 nb_verified_workspace_agenda,
@@ -111,3 +201,22 @@ def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvir
                 nb_workspace_without_agenda_enabled,
             )
         )
+
+    def _sync_workspace_agenda(self, workspace: Workspace) -> AgendaSyncResult:
+        if not self._force and self._agenda_api.workspace_agenda_is_up_to_date(workspace):
+            return AgendaSyncResult.UP_TO_DATE
+        try:
+            already_exist = self._agenda_api.ensure_workspace_agenda_exists(workspace)
+        except CannotCreateAgendaResource as exc:
+            print("Cannot create agenda for workspace {}".format(workspace.workspace_id))
+            logger.exception(self, exc)
+            return AgendaSyncResult.ERROR
+        except AgendaServerConnectionError as exc:
+            print("Cannot access to agenda server: connection error.")
+            logger.exception(self, exc)
+            return AgendaSyncResult.ERROR
+        except Exception as exc:
+            print("Something goes wrong during agenda create/update")
+            logger.exception(self, exc)
+            return AgendaSyncResult.ERROR
+        return AgendaSyncResult.UPDATED if already_exist else AgendaSyncResult.CREATED
@@ -1,4 +1,6 @@
 import argparse
+from datetime import datetime
+from datetime import timedelta
 import traceback
 import typing
 
@@ -6,6 +8,8 @@
 
 from tracim_backend import UserDoesNotExist
 from tracim_backend.applications.agenda.models import AgendaResourceType
+from tracim_backend.applications.share.lib import ShareLib
+from tracim_backend.applications.upload_permissions.lib import UploadPermissionLib
 from tracim_backend.apps import AGENDA__APP_SLUG
 from tracim_backend.command import AppContextCommand
 from tracim_backend.exceptions import AgendaNotFoundError
@@ -420,3 +424,62 @@ def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvir
                     )
                 )
                 print("~~~~~~~~~~")
+
+
+class DeleteDisabledSharesCommand(AppContextCommand):
+    def get_description(self) -> str:
+        return """Remove content shares and upload permissions disabled for a long time from the database"""
+
+    def get_parser(self, prog_name: str) -> argparse.ArgumentParser:
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            "--days",
+            help="delete shares and upload permissions disabled for more than this number of days (default: 30)",
+            dest="days",
+            type=int,
+            default=30,
+        )
+        parser.add_argument(
+            "--batch-size",
+            help="number of rows deleted by transaction (default: 500)",
+            dest="batch_size",
+            type=int,
+            default=500,
+        )
+        return parser
+
+    def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvironment) -> None:
+        self._session = app_context["request"].dbsession
+        self._app_config = app_context["registry"].settings["CFG"]
+        tm = app_context["request"].tm
+        share_lib = ShareLib(
+            session=self._session, current_user=None, config=self._app_config, show_disabled=True
+        )
+        upload_permission_lib = UploadPermissionLib(
+            session=self._session, current_user=None, config=self._app_config, show_disabled=True
+        )
+        # INFO - content shares are disabled with a local date, upload permissions
+        # with an utc one.
+        delete_functions = [
+            (
+                "content shares",
+                share_lib.delete_disabled_content_shares,
+                datetime.now() - timedelta(days=parsed_args.days),
+            ),
+            (
+                "upload permissions",
+                upload_permission_lib.delete_disabled_upload_permissions,
+                datetime.utcnow() - timedelta(days=parsed_args.days),
+            ),
+        ]
+        for label, delete_function, disabled_before in delete_functions:
+            deleted_count = 0
+            while True:
+                batch_deleted_count = delete_function(disabled_before, parsed_args.batch_size)
+                # INFO - commit each batch to keep transactions (and locks) short
+                tm.commit()
+                tm.begin()
+                if not batch_deleted_count:
+                    break
+                deleted_count += batch_deleted_count
+            print("{} disabled {} deleted.".format(deleted_count, label))
@@ -17,6 +17,7 @@
 from tracim_backend.command import AppContextCommand
 from tracim_backend.exceptions import TracimException
 from tracim_backend.lib.core.user import UserApi
+from tracim_backend.lib.core.user_stats import UserStatsLib
 from tracim_backend.lib.utils.utils import password_generator
 from tracim_backend.models.auth import Profile
 from tracim_backend.models.auth import UserCreationType
@@ -204,3 +205,32 @@ def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvir
             print("User not updated.")
             raise exc
         print("User updated")
+
+
+class RebuildUserStatsCommand(AppContextCommand):
+    def get_description(self) -> str:
+        return """Rebuild user profile counters (followers, leaders and authored revisions)"""
+
+    def get_parser(self, prog_name: str) -> argparse.ArgumentParser:
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            "--batch-size",
+            help="number of users updated by transaction (default: 500)",
+            dest="batch_size",
+            type=int,
+            default=500,
+        )
+        return parser
+
+    def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvironment) -> None:
+        self._session = app_context["request"].dbsession
+        tm = app_context["request"].tm
+
+        def commit_batch() -> None:
+            tm.commit()
+            tm.begin()
+
+        rebuilt_count = UserStatsLib(self._session).rebuild_all_user_stats(
+            batch_size=parsed_args.batch_size, on_batch=commit_batch
+        )
+        print("Counters of {} users rebuilt.".format(rebuilt_count))
@@ -65,6 +65,21 @@ def __init__(self, slug: str, depot_storage_backend: str):
         self.depot_storage_backend = depot_storage_backend
 
 
+class FileOffloadMode(Enum):
+    """
+    How file transfers are delegated to the front web server: response
+    contains a header with the (mapped) path of the file instead of its content.
+    """
+
+    DISABLED = ("disabled", None)
+    X_ACCEL_REDIRECT = ("x-accel-redirect", "X-Accel-Redirect")  # nginx
+    X_SENDFILE = ("x-sendfile", "X-Sendfile")  # apache (mod_xsendfile), lighttpd
+
+    def __init__(self, slug: str, header_name: typing.Optional[str]):
+        self.slug = slug
+        self.header_name = header_name
+
+
 def create_target_langage(value: str) -> typing.Tuple[str, str]:
     code, display = value.split(":")
     return (code, display)
@@ -377,6 +392,18 @@ def _load_global_config(self) -> None:
         ###
         default_sqlalchemy_url = self.here_macro_replace("sqlite:///%(here)s/tracim.sqlite")
         self.SQLALCHEMY__URL = self.get_raw_config("sqlalchemy.url", default_sqlalchemy_url)
+        self.DATABASE__REPLICA_URLS = string_to_unique_item_list(
+            self.get_raw_config("database.replica_urls", ""),
+            separator=",",
+            cast_func=str,
+            do_strip=True,
+        )
+        self.DATABASE__READ_YOUR_WRITES_DELAY = int(
+            self.get_raw_config("database.read_your_writes_delay", "10")
+        )
+        self.DATABASE__CONNECTION_HOLD_WARNING_THRESHOLD = float(
+            self.get_raw_config("database.connection_hold_warning_threshold", "10")
+        )
         self.DEFAULT_LANG = self.get_raw_config("default_lang", DEFAULT_FALLBACK_LANG)
         backend_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         tracim_folder = os.path.dirname(backend_folder)
@@ -457,6 +484,9 @@ def _load_global_config(self) -> None:
             self.get_raw_config("user.self_registration.enabled", "False")
         )
         self.USER__ONLINE_TIMEOUT = int(self.get_raw_config("user.online_timeout", 10))
+        self.USER__CONNECTION_STATUS_BATCH_DELAY = float(
+            self.get_raw_config("user.connection_status_batch_delay", "0.5")
+        )
         default_user_custom_properties_path = self.here_macro_replace(
             "%(here)s/tracim_backend/templates/user_custom_properties/default/"
         )
@@ -580,6 +610,17 @@ def __load_uploaded_files_config(self) -> None:
         self.UPLOADED_FILES__STORAGE__S3__STORAGE_CLASS = self.get_raw_config(
             "uploaded_files.storage.s3.storage_class"
         )
+        # Offload parameters
+        self.UPLOADED_FILES__OFFLOAD__MODE = self.get_raw_config(
+            "uploaded_files.offload.mode", FileOffloadMode.DISABLED.slug
+        )
+        self.UPLOADED_FILES__OFFLOAD__LOCAL_STORAGE_INTERNAL_PATH = self.get_raw_config(
+            "uploaded_files.offload.local_storage_internal_path",
+            self.UPLOADED_FILES__STORAGE__LOCAL__STORAGE_PATH,
+        )
+        self.UPLOADED_FILES__OFFLOAD__PREVIEW_CACHE_INTERNAL_PATH = self.get_raw_config(
+            "uploaded_files.offload.preview_cache_internal_path", self.PREVIEW_CACHE_DIR
+        )
 
     def _load_live_messages_config(self) -> None:
         self.LIVE_MESSAGES__CONTROL_ZMQ_URI = self.get_raw_config(
@@ -1141,6 +1182,28 @@ def _check_uploaded_files_config_validity(self) -> None:
                     self.UPLOADED_FILES__STORAGE__STORAGE_TYPE
                 ),
             )
+        file_offload_mode_slugs = [offload_mode.slug for offload_mode in list(FileOffloadMode)]
+        if self.UPLOADED_FILES__OFFLOAD__MODE not in file_offload_mode_slugs:
+            file_offload_mode_str_list = ", ".join(
+                ['"{}"'.format(slug) for slug in file_offload_mode_slugs]
+            )
+            raise ConfigurationError(
+                'ERROR uploaded_files.offload.mode given "{}" is invalid,'
+                "valids values are {}.".format(
+                    self.UPLOADED_FILES__OFFLOAD__MODE, file_offload_mode_str_list
+                )
+            )
+        if self.UPLOADED_FILES__OFFLOAD__MODE != FileOffloadMode.DISABLED.slug:
+            self.check_mandatory_param(
+                "UPLOADED_FILES__OFFLOAD__LOCAL_STORAGE_INTERNAL_PATH",
+                self.UPLOADED_FILES__OFFLOAD__LOCAL_STORAGE_INTERNAL_PATH,
+                when_str="if file offload is enabled",
+            )
+            self.check_mandatory_param(
+                "UPLOADED_FILES__OFFLOAD__PREVIEW_CACHE_INTERNAL_PATH",
+                self.UPLOADED_FILES__OFFLOAD__PREVIEW_CACHE_INTERNAL_PATH,
+                when_str="if file offload is enabled",
+            )
 
     def _check_live_messages_config_validity(self) -> None:
         self.check_mandatory_param(
@@ -4,6 +4,7 @@
 import os
 import typing
 
+from depot.fields.upload import UploadedFile
 from depot.io.utils import FileIntent
 from hapic.data import HapicFile
 from preview_generator.exception import UnsupportedMimeType
@@ -45,6 +46,7 @@
 from tracim_backend.exceptions import UnallowedSubContent
 from tracim_backend.exceptions import WorkspacesDoNotMatch
 from tracim_backend.lib.core.notifications import NotifierFactory
+from tracim_backend.lib.core.storage import DepotFileWriter
 from tracim_backend.lib.core.storage import StorageLib
 from tracim_backend.lib.core.userworkspace import RoleApi
 from tracim_backend.lib.core.workspace import WorkspaceApi
@@ -547,8 +549,24 @@ def get_one(
         if parent:
             base_request = base_request.filter(Content.parent_id == parent.content_id)
 
+        cache_key = (
+            "content",
+            content_id,
+            content_type,
+            workspace.workspace_id if workspace else None,
+            parent.content_id if parent else None,
+            ignore_content_state_filter,
+            self._user_id,
+            self._show_archived,
+            self._show_deleted,
+            self._show_temporary,
+            self._show_active,
+            self._force_show_all_types,
+            self._disable_user_workspaces_filter,
+            tuple(self.namespaces_filter or ()),
+        )
         try:
-            content = base_request.one()
+            content = self._session.get_cached_result(cache_key, base_request.one)
         except NoResultFound as exc:
             # TODO - G.M - 2018-07-16 - Add better support for all different
             # error case who can happened here
@@ -670,6 +688,7 @@ def get_one_page_pdf_preview(
         filename: str,
         default_filename: str,
         force_download: bool = None,
+        immutable: bool = False,
     ):
         return StorageLib(self._config).get_one_page_pdf_preview(
             depot_file=revision.depot_file,
@@ -678,6 +697,9 @@ def get_one_page_pdf_preview(
             page_number=page_number,
             original_file_extension=revision.file_extension,
             force_download=force_download,
+            last_modified=revision.updated,
+            etag=self.get_revision_file_etag(revision, "pdf", page_number),
+            immutable=immutable,
         )
 
     def get_full_pdf_preview(
@@ -686,6 +708,7 @@ def get_full_pdf_preview(
         filename: str,
         default_filename: str,
         force_download: bool = None,
+        immutable: bool = False,
     ):
         return StorageLib(self._config).get_full_pdf_preview(
             depot_file=revision.depot_file,
@@ -693,8 +716,18 @@ def get_full_pdf_preview(
             default_filename=default_filename,
             original_file_extension=revision.file_extension,
             force_download=force_download,
+            last_modified=revision.updated,
+            etag=self.get_revision_file_etag(revision, "pdf"),
+            immutable=immutable,
         )
 
+    def get_revision_file_etag(self, revision: ContentRevisionRO, *variant: typing.Any) -> str:
+        """
+        Strong ETag of a file (raw file or preview) of a revision: a revision file never
+        changes, so revision identity (and variant of preview) is enough.
+        """
+        return "-".join(str(part) for part in ("revision", revision.revision_id) + variant)
+
     def get_jpg_preview_allowed_dim(self) -> PreviewAllowedDim:
         """
         Get jpg preview allowed dimensions and strict bool param.
@@ -712,6 +745,7 @@ def get_jpeg_preview(
         width: int = None,
         height: int = None,
         force_download: bool = False,
+        immutable: bool = False,
     ) -> HapicFile:
         """
         Get jpg preview of revision of content
@@ -722,6 +756,7 @@ def get_jpeg_preview(
         :param width: width in pixel
         :param height: height in pixel
         :param force_download: should the file by downloaded
+        :param immutable: preview is requested by revision, allow caching it
         :return: preview_path as string
         """
         if not width and not height:
@@ -749,6 +784,11 @@ def get_jpeg_preview(
             height=height,
             original_file_extension=revision.file_extension,
             force_download=force_download,
+            last_modified=revision.updated,
+            etag=self.get_revision_file_etag(
+                revision, "jpg", page_number, "{}x{}".format(width, height)
+            ),
+            immutable=immutable,
         )
 
     def get_all_query(
@@ -1517,7 +1557,11 @@ def update_content(
         return item
 
     def update_file_data(
-        self, item: Content, new_filename: str, new_mimetype: str, new_content: bytes
+        self,
+        item: Content,
+        new_filename: str,
+        new_mimetype: str,
+        new_content: typing.Union[bytes, typing.BinaryIO, UploadedFile],
     ) -> Content:
         if not self.is_editable(item):
             raise ContentInNotEditableState(
@@ -1552,16 +1596,27 @@ def update_file_data(
             )
         item.file_name = new_filename
         item.file_mimetype = new_mimetype
-        item.depot_file = FileIntent(new_content, new_filename, new_mimetype)
+        if isinstance(new_content, UploadedFile):
+            # INFO - file already stored in depot (streamed upload), no need to store it again
+            item.depot_file = new_content
+        else:
+            item.depot_file = FileIntent(new_content, new_filename, new_mimetype)
         item.revision_type = ActionDescription.REVISION
         return item
 
+    def get_depot_file_writer(self, filename: str, mimetype: str) -> DepotFileWriter:
+        """
+        Get a file-like object to stream a new file to depot,
+        the resulting UploadedFile can be given to update_file_data.
+        """
+        return StorageLib(self._config).get_depot_file_writer(filename, mimetype)
+
     def check_upload_size(self, content_length: int, workspace: Workspace) -> None:
-        self._check_size_length_limitation(content_length)
+        self.check_size_length_limitation(content_length)
         self.check_workspace_size_limitation(content_length, workspace)
         self.check_owner_size_limitation(content_length, workspace)
 
-    def _check_size_length_limitation(self, content_length: int) -> None:
+    def check_size_length_limitation(self, content_length: int) -> None:
         # INFO - G.M - 2019-08-23 - 0 mean no size limit
         if self._config.LIMITATION__CONTENT_LENGTH_FILE_SIZE == 0:
             return
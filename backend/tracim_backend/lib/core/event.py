@@ -39,8 +39,8 @@
 from tracim_backend.lib.core.userworkspace import RoleApi
 from tracim_backend.lib.core.workspace import WorkspaceApi
 from tracim_backend.lib.rq import RqQueueName
-from tracim_backend.lib.rq import get_redis_connection
-from tracim_backend.lib.rq import get_rq_queue
+from tracim_backend.lib.rq import enqueue_jobs
+from tracim_backend.lib.rq import get_rq_queue2
 from tracim_backend.lib.rq.worker import worker_context
 from tracim_backend.lib.utils.logger import logger
 from tracim_backend.lib.utils.request import TracimContext
@@ -449,8 +449,9 @@ def publish(session: TracimSession, flush_context=None) -> None:
             message_builder = message_builder_class(
                 context=session.context
             )  # type: BaseLiveMessageBuilder
-            for event in session.context.pending_events:
-                message_builder.publish_messages_for_event(event.event_id)
+            message_builder.publish_messages_for_events(
+                [event.event_id for event in session.context.pending_events]
+            )
             session.context.pending_events = []
 
         sqlalchemy_event.listen(db_session, commit_event, publish)
@@ -606,6 +607,52 @@ def on_user_role_in_workspace_deleted(
     ) -> None:
         self._create_role_event(OperationType.DELETED, role, context)
 
+    @hookimpl
+    def on_user_roles_in_workspace_bulk_modified(
+        self,
+        workspace: Workspace,
+        created_roles: Dict[int, int],
+        modified_roles: Dict[int, int],
+        deleted_roles: Dict[int, int],
+        context: TracimContext,
+    ) -> None:
+        current_user = context.safe_current_user()
+        event_api = EventApi(current_user, context.dbsession, self._config)
+        for user_id in created_roles:
+            event_api.create_messages_history_for_user(
+                user_id=user_id,
+                workspace_ids=[workspace.workspace_id],
+                max_messages_count=context.app_config.WORKSPACE__JOIN__MAX_MESSAGES_HISTORY_COUNT,
+            )
+        workspace_api = WorkspaceApi(
+            session=context.dbsession, config=self._config, show_deleted=True, current_user=None,
+        )
+        workspace_in_context = workspace_api.get_workspace_with_context(workspace)
+
+        def members_field(roles: Dict[int, int]) -> List[JsonDict]:
+            return [
+                {"user_id": user_id, "role": WorkspaceRoles.get_role_from_level(role_level).slug}
+                for user_id, role_level in roles.items()
+            ]
+
+        fields = {
+            Event.WORKSPACE_FIELD: EventApi.workspace_without_description_schema.dump(
+                workspace_in_context
+            ).data,
+            Event.MEMBERS_FIELD: {
+                "created": members_field(created_roles),
+                "modified": members_field(modified_roles),
+                "deleted": members_field(deleted_roles),
+            },
+        }
+        event_api.create_event(
+            entity_type=EntityType.WORKSPACE_MEMBER,
+            operation=OperationType.MODIFIED,
+            additional_fields=fields,
+            entity_subtype=Event.WORKSPACE_MEMBERS_BULK_SUBTYPE,
+            context=context,
+        )
+
     def _create_role_event(
         self, operation: OperationType, role: UserRoleInWorkspace, context: TracimContext
     ) -> None:
@@ -904,6 +951,19 @@ def _get_members_and_administrators_ids(
     return receiver_ids
 
 
+def _get_workspace_member_event_receiver_ids(
+    event: Event, session: TracimSession, config: CFG
+) -> Set[int]:
+    """
+    Return administrators + members of the event's workspace + users whose role was modified
+    """
+    receiver_ids = _get_members_and_administrators_ids(event, session, config)
+    # INFO - bulk events: removed members must know they left the workspace
+    members = event.fields.get(Event.MEMBERS_FIELD) or {}
+    receiver_ids.update(member["user_id"] for member in members.get("deleted", []))
+    return receiver_ids
+
+
 def _get_workspace_event_receiver_ids(
     event: Event, session: TracimSession, config: CFG
 ) -> Set[int]:
@@ -960,7 +1020,7 @@ class BaseLiveMessageBuilder(abc.ABC):
     _get_receiver_ids_callables = {
         EntityType.USER: _get_user_event_receiver_ids,
         EntityType.WORKSPACE: _get_workspace_event_receiver_ids,
-        EntityType.WORKSPACE_MEMBER: _get_members_and_administrators_ids,
+        EntityType.WORKSPACE_MEMBER: _get_workspace_member_event_receiver_ids,
         EntityType.CONTENT: _get_content_event_receiver_ids,
         EntityType.WORKSPACE_SUBSCRIPTION: _get_workspace_subscription_event_receiver_ids,
         EntityType.REACTION: _get_content_event_receiver_ids,
@@ -997,6 +1057,10 @@ def context(self) -> Generator[TracimContext, None, None]:
     def publish_messages_for_event(self, event_id: int) -> None:
         pass
 
+    def publish_messages_for_events(self, event_ids: List[int]) -> None:
+        for event_id in event_ids:
+            self.publish_messages_for_event(event_id)
+
     def _publish_messages_for_event(self, event_id: int) -> None:
         with self.context() as context:
             session = context.dbsession
@@ -1030,8 +1094,7 @@ def context(self) -> Generator[TracimContext, None, None]:
             yield context
 
     def publish_messages_for_event(self, event_id: int) -> None:
-        redis_connection = get_redis_connection(self._config)
-        queue = get_rq_queue(redis_connection, RqQueueName.EVENT)
+        queue = get_rq_queue2(self._config, RqQueueName.EVENT)
         logger.debug(
             self,
             "publish event(id={}) asynchronously to RQ queue {}".format(
@@ -1040,6 +1103,21 @@ def publish_messages_for_event(self, event_id: int) -> None:
         )
         queue.enqueue(self._publish_messages_for_event, event_id)
 
+    def publish_messages_for_events(self, event_ids: List[int]) -> None:
+        if not event_ids:
+            return
+        logger.debug(
+            self,
+            "publish events(ids={}) asynchronously to RQ queue {}".format(
+                event_ids, RqQueueName.EVENT
+            ),
+        )
+        enqueue_jobs(
+            self._config,
+            RqQueueName.EVENT,
+            [(self._publish_messages_for_event, (event_id,)) for event_id in event_ids],
+        )
+
 
 class SyncLiveMessageBuilder(BaseLiveMessageBuilder):
     """"Live message building + sending executed in tracim web application."""
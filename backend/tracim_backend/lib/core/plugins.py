@@ -115,10 +115,12 @@ def init_plugin_manager(app_config: CFG) -> pluggy.PluginManager:
     from tracim_backend.lib.core.event import EventPublisher
     from tracim_backend.lib.search.search_factory import SearchFactory
     import tracim_backend.lib.core.mention as mention
+    import tracim_backend.lib.core.user_stats as user_stats
 
     plugin_manager.register(EventBuilder(app_config))
     plugin_manager.register(EventPublisher(app_config))
     mention.register_tracim_plugin(plugin_manager)
+    user_stats.register_tracim_plugin(plugin_manager)
     search_api = SearchFactory.get_search_lib(session=None, config=app_config, current_user=None)
     search_api.register_plugins(plugin_manager)
 
@@ -1,11 +1,14 @@
 import typing
 
+from sqlalchemy import case
+from sqlalchemy import func
 from sqlalchemy.orm import Query
 from sqlalchemy.orm.exc import NoResultFound
 
 from tracim_backend.exceptions import ReactionAlreadyExistError
 from tracim_backend.exceptions import ReactionNotFound
 from tracim_backend.models.auth import User
+from tracim_backend.models.context_models import ReactionSummary
 from tracim_backend.models.data import Content
 from tracim_backend.models.reaction import Reaction
 from tracim_backend.models.tracim_session import TracimSession
@@ -57,6 +60,32 @@ def get_all(
         query = query.order_by(Reaction.reaction_id)
         return query.all()
 
+    def get_summaries(
+        self, content_ids: typing.List[int], user_id: typing.Optional[int] = None
+    ) -> typing.List[ReactionSummary]:
+        """
+        Return reactions of given contents aggregated by value, with one query.
+        Summaries are ordered by content id, then by first reaction of each value.
+        :param user_id: user for which user_reacted is computed
+        """
+        if not content_ids:
+            return []
+        user_reacted = func.max(case([(Reaction.author_id == user_id, 1)], else_=0))
+        query = (
+            self._session.query(
+                Reaction.content_id, Reaction.value, func.count(Reaction.reaction_id), user_reacted,
+            )
+            .filter(Reaction.content_id.in_(content_ids))
+            .group_by(Reaction.content_id, Reaction.value)
+            .order_by(Reaction.content_id, func.min(Reaction.reaction_id))
+        )
+        return [
+            ReactionSummary(
+                content_id=content_id, value=value, count=count, user_reacted=bool(reacted)
+            )
+            for content_id, value, count, reacted in query
+        ]
+
     def create(self, user: User, content: Content, value: str, do_save: bool) -> Reaction:
         query = self.base_filter(
             query=self._base_query(),
@@ -2,10 +2,13 @@
 from datetime import datetime
 import os
 import tempfile
+import threading
 import typing
+from urllib.parse import quote
 
 from depot.fields.upload import UploadedFile
 from depot.io.interfaces import StoredFile
+from depot.io.utils import FileIntent
 from depot.manager import DepotManager
 import filelock
 from hapic.data import HapicFile
@@ -15,15 +18,127 @@
 
 from tracim_backend.config import CFG
 from tracim_backend.config import DepotFileStorageType
+from tracim_backend.config import FileOffloadMode
 from tracim_backend.exceptions import CannotGetDepotFileDepotCorrupted
 from tracim_backend.exceptions import PageOfPreviewNotFound
 from tracim_backend.exceptions import PreviewGeneratorPassthroughError
 from tracim_backend.exceptions import TracimFileNotFound
 from tracim_backend.exceptions import TracimUnavailablePreviewType
 from tracim_backend.exceptions import UnavailablePreview
+from tracim_backend.lib.utils.file_response import TracimFile
 from tracim_backend.lib.utils.logger import logger
+from tracim_backend.models.types import UPLOADED_FILE_FILTERS
 
 TEMPORARY_PREFIX = "tracim-revision-content"
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class DepotFileWriter:
+    """
+    Write-only file-like object storing written data as a new depot file.
+
+    Data is not buffered: it is sent through a pipe to a background thread
+    which stores it in depot while it is written, so uploading a big file
+    does not need memory or a temporary file of the size of the file.
+    Writing blocks while depot is slower than the sender.
+    Once closed, stored file is available as an UploadedFile
+    which can be set directly as the depot_file of a revision.
+    """
+
+    def __init__(self, depot_name: str, filename: str, content_type: str) -> None:
+        self.depot_name = depot_name
+        self.filename = filename
+        self.content_type = content_type
+        self.content_length = 0
+        self.uploaded_file = None  # type: typing.Optional[UploadedFile]
+        self._error = None  # type: typing.Optional[Exception]
+        read_fd, write_fd = os.pipe()
+        self._reader = os.fdopen(read_fd, "rb")
+        self._writer = os.fdopen(write_fd, "wb")
+        self._thread = threading.Thread(target=self._store, daemon=True)
+        self._thread.start()
+
+    def _store(self) -> None:
+        try:
+            self.uploaded_file = UploadedFile(
+                FileIntent(self._reader, self.filename, self.content_type), self.depot_name
+            )
+            self.uploaded_file._apply_filters(UPLOADED_FILE_FILTERS)
+        except Exception as exc:
+            self._error = exc
+            # INFO - drain the pipe so that the writer never blocks on a failed upload
+            while self._reader.read(STREAM_CHUNK_SIZE):
+                pass
+        finally:
+            self._reader.close()
+
+    def write(self, data: bytes) -> None:
+        if self._error:
+            raise self._error
+        self._writer.write(data)
+        self.content_length += len(data)
+
+    def close(self) -> UploadedFile:
+        """
+        End the upload and wait for depot to store all the data.
+        :return: the stored file
+        """
+        if not self._writer.closed:
+            self._writer.close()
+        self._thread.join()
+        if self._error:
+            raise self._error
+        return self.uploaded_file
+
+    def abort(self) -> None:
+        """
+        End the upload and delete already stored data.
+        """
+        try:
+            self.close()
+        except Exception:
+            logger.warning(self, "Error while aborting upload to depot", exc_info=True)
+        if self.uploaded_file:
+            self.uploaded_file.depot.delete(self.uploaded_file.file_id)
+            self.uploaded_file = None
+
+
+class SpooledDepotFileWriter(DepotFileWriter):
+    """
+    DepotFileWriter for depot storages which need to know the whole
+    file before storing it (e.g. s3 storage reads non-seekable streams in memory):
+    data is stored in a temporary file which is given to depot on close.
+    """
+
+    def __init__(self, depot_name: str, filename: str, content_type: str) -> None:
+        self.depot_name = depot_name
+        self.filename = filename
+        self.content_type = content_type
+        self.content_length = 0
+        self.uploaded_file = None  # type: typing.Optional[UploadedFile]
+        self._temp_file = tempfile.NamedTemporaryFile(prefix=TEMPORARY_PREFIX)
+
+    def write(self, data: bytes) -> None:
+        self._temp_file.write(data)
+        self.content_length += len(data)
+
+    def close(self) -> UploadedFile:
+        if self.uploaded_file is None and not self._temp_file.closed:
+            try:
+                self._temp_file.seek(0)
+                self.uploaded_file = UploadedFile(
+                    FileIntent(self._temp_file, self.filename, self.content_type), self.depot_name,
+                )
+                self.uploaded_file._apply_filters(UPLOADED_FILE_FILTERS)
+            finally:
+                self._temp_file.close()
+        return self.uploaded_file
+
+    def abort(self) -> None:
+        self._temp_file.close()
+        if self.uploaded_file:
+            self.uploaded_file.depot.delete(self.uploaded_file.file_id)
+            self.uploaded_file = None
 
 
 class StorageLib:
@@ -37,6 +152,57 @@ def __init__(self, app_config: CFG) -> None:
             app_config.UPLOADED_FILES__STORAGE__STORAGE_NAME
         )
         self.preview_manager = PreviewManager(app_config.PREVIEW_CACHE_DIR, create_folder=True)
+        self.offload_mode = next(
+            offload_mode
+            for offload_mode in FileOffloadMode
+            if offload_mode.slug == app_config.UPLOADED_FILES__OFFLOAD__MODE
+        )
+
+    def _get_offload_header(
+        self, file_path: str, directory: str, internal_directory: str
+    ) -> typing.Optional[typing.Tuple[str, str]]:
+        """
+        Get the header allowing the front web server to send the file itself,
+        if file offload is enabled.
+        :param file_path: path of the file to send
+        :param directory: real directory containing the file
+        :param internal_directory: path given to the front web server instead of directory
+        :return: (header name, internal path) or None if file can't be offloaded
+        """
+        if self.offload_mode == FileOffloadMode.DISABLED:
+            return None
+        relative_path = os.path.relpath(os.path.realpath(file_path), os.path.realpath(directory))
+        if relative_path.startswith(os.pardir):
+            return None
+        internal_path = "{}/{}".format(internal_directory.rstrip("/"), relative_path)
+        if self.offload_mode == FileOffloadMode.X_ACCEL_REDIRECT:
+            # INFO - X-Accel-Redirect value is an uri
+            internal_path = quote(internal_path)
+        return (self.offload_mode.header_name, internal_path)
+
+    def _get_preview_offload_header(
+        self, preview_path: str
+    ) -> typing.Optional[typing.Tuple[str, str]]:
+        return self._get_offload_header(
+            preview_path,
+            self.app_config.PREVIEW_CACHE_DIR,
+            self.app_config.UPLOADED_FILES__OFFLOAD__PREVIEW_CACHE_INTERNAL_PATH,
+        )
+
+    def get_depot_file_writer(self, filename: str, content_type: str) -> DepotFileWriter:
+        """
+        Get a file-like object to store a new uploaded file in depot chunk by chunk,
+        see DepotFileWriter.
+        """
+        if self.app_config.UPLOADED_FILES__STORAGE__STORAGE_TYPE == DepotFileStorageType.S3.slug:
+            writer_class = SpooledDepotFileWriter
+        else:
+            writer_class = DepotFileWriter
+        return writer_class(
+            depot_name=self.app_config.UPLOADED_FILES__STORAGE__STORAGE_NAME,
+            filename=filename,
+            content_type=content_type,
+        )
 
     def _get_depot_file(self, depot_file) -> StoredFile:
         if depot_file is None:
@@ -58,6 +224,9 @@ def get_raw_file(
         default_filename: str,
         force_download: bool = None,
         last_modified: datetime = None,
+        etag: typing.Optional[str] = None,
+        immutable: bool = False,
+        cache_max_age: typing.Optional[int] = None,
     ) -> HapicFile:
         """
         Helper to translate depot file into hapic file with
@@ -68,6 +237,9 @@ def get_raw_file(
         :param default_filename: if filename is empty or is "raw", use this name.
         :param force_download: active or desactive attachment mode for file
         :param last_modified: last modified date of the file.
+        :param etag: identifier of the file content (e.g. from its revision)
+        :param immutable: file url always return same content, allow caching it.
+        :param cache_max_age: allow caching file for this duration (in seconds).
         :return: the file as full provided HapicFile
         """
         file = self._get_depot_file(depot_file)
@@ -75,13 +247,32 @@ def get_raw_file(
         # "raw", where filename returned will be a custom one.
         if not filename or filename == "raw":
             filename = default_filename
-        return HapicFile(
-            file_object=file,
+        if self.app_config.UPLOADED_FILES__STORAGE__STORAGE_TYPE == DepotFileStorageType.LOCAL.slug:
+            # INFO - serve local file by path: allow to seek into it for range requests
+            file.close()
+            file_path = file._file_path
+            file_object = None
+            offload_header = self._get_offload_header(
+                file_path,
+                self.app_config.UPLOADED_FILES__STORAGE__LOCAL__STORAGE_PATH,
+                self.app_config.UPLOADED_FILES__OFFLOAD__LOCAL_STORAGE_INTERNAL_PATH,
+            )
+        else:
+            file_path = None
+            file_object = file
+            offload_header = None
+        return TracimFile(
+            file_path=file_path,
+            file_object=file_object,
             mimetype=file.content_type,
             filename=filename,
             as_attachment=force_download,
             content_length=file.content_length,
             last_modified=last_modified or None,
+            etag=etag,
+            immutable=immutable,
+            cache_max_age=cache_max_age,
+            offload_header=offload_header,
         )
 
     def get_filepath(
@@ -158,6 +349,8 @@ def get_jpeg_preview(
         height: int = None,
         force_download: bool = None,
         last_modified: datetime = None,
+        etag: typing.Optional[str] = None,
+        immutable: bool = False,
     ) -> HapicFile:
         """
         Helper to get HapicFile jpeg preview for controller
@@ -182,11 +375,14 @@ def get_jpeg_preview(
         # "raw", where filename returned will a custom one.
         if not filename or filename == "raw":
             filename = default_filename
-        return HapicFile(
+        return TracimFile(
             file_path=jpg_preview_path,
             filename=filename,
             as_attachment=force_download,
             last_modified=last_modified,
+            etag=etag,
+            immutable=immutable,
+            offload_header=self._get_preview_offload_header(jpg_preview_path),
         )
 
     def get_one_page_pdf_preview(
@@ -198,6 +394,8 @@ def get_one_page_pdf_preview(
         original_file_extension: str = "",
         force_download: bool = None,
         last_modified: datetime = None,
+        etag: typing.Optional[str] = None,
+        immutable: bool = False,
     ) -> HapicFile:
         """
         Helper to get one page pdf preview for controller
@@ -218,11 +416,14 @@ def get_one_page_pdf_preview(
         # "raw", where filename returned will a custom one.
         if not filename or filename == "raw":
             filename = default_filename
-        return HapicFile(
+        return TracimFile(
             file_path=pdf_preview_path,
             filename=filename,
             as_attachment=force_download,
             last_modified=last_modified,
+            etag=etag,
+            immutable=immutable,
+            offload_header=self._get_preview_offload_header(pdf_preview_path),
         )
 
     def get_full_pdf_preview(
@@ -233,6 +434,8 @@ def get_full_pdf_preview(
         original_file_extension: str = "",
         force_download: bool = None,
         last_modified: datetime = None,
+        etag: typing.Optional[str] = None,
+        immutable: bool = False,
     ) -> HapicFile:
         """
         Helper to get Full pdf preview for controller
@@ -247,11 +450,14 @@ def get_full_pdf_preview(
         # "raw", where filename returned will a custom one.
         if not filename or filename == "raw":
             filename = default_filename
-        return HapicFile(
+        return TracimFile(
             file_path=pdf_preview_path,
             filename=filename,
             as_attachment=force_download,
             last_modified=last_modified,
+            etag=etag,
+            immutable=immutable,
+            offload_header=self._get_preview_offload_header(pdf_preview_path),
         )
 
     def _preview_manager_page_format(self, page_number: int) -> int:
@@ -1,5 +1,7 @@
 import typing
 
+from sqlakeyset import Page
+from sqlakeyset import get_page
 from sqlalchemy import and_
 from sqlalchemy.orm import Query
 from sqlalchemy.orm.exc import NoResultFound
@@ -70,11 +72,16 @@ def get_one(
         return tag
 
     def get_all(
-        self, workspace_id: typing.Optional[int] = None, content_id: typing.Optional[int] = None,
+        self,
+        workspace_id: typing.Optional[int] = None,
+        content_id: typing.Optional[int] = None,
+        tag_ids: typing.Optional[typing.List[int]] = None,
     ) -> typing.List[Tag]:
         query = self.base_filter(
             self._base_query(), workspace_id=workspace_id, content_id=content_id
         )
+        if tag_ids is not None:
+            query = query.filter(Tag.tag_id.in_(tag_ids))
         query = query.order_by(Tag.tag_id)
         return query.all()
 
@@ -121,6 +128,37 @@ def add_tag_to_content(
             self._session.flush()
         return tag
 
+    def add_tags_to_contents(
+        self,
+        user: User,
+        contents: typing.List[Content],
+        tags: typing.List[Tag],
+        do_save: bool = True,
+    ) -> typing.List[TagOnContent]:
+        """
+        Add each given tag to each given content, in one flush.
+        Tags already on a content are ignored.
+        :return: the created content tags
+        """
+        if not contents or not tags:
+            return []
+        existing_content_tags = set(
+            self._session.query(TagOnContent.tag_id, TagOnContent.content_id).filter(
+                TagOnContent.tag_id.in_([tag.tag_id for tag in tags]),
+                TagOnContent.content_id.in_([content.content_id for content in contents]),
+            )
+        )
+        content_tags = [
+            TagOnContent(author=user, tag=tag, content=content)
+            for tag in tags
+            for content in contents
+            if (tag.tag_id, content.content_id) not in existing_content_tags
+        ]
+        self._session.add_all(content_tags)
+        if do_save:
+            self._session.flush()
+        return content_tags
+
     def add(self, user: User, workspace: Workspace, tag_name: str, do_save: bool):
         tag = Tag(author=user, workspace=workspace, tag_name=tag_name)
         self._session.add(tag)
@@ -147,11 +185,25 @@ def delete(self, tag: Tag, do_save: bool) -> None:
         if do_save:
             self._session.flush()
 
-    def get_contents(self, tag: Tag) -> typing.List[Content]:
-        """Return the list of contents which include the given tag."""
-        return (
-            self._session.query(Content)
-            .filter(TagOnContent.content_id == Content.content_id)
+    def get_contents(
+        self,
+        tag: Tag,
+        content_query: typing.Optional[Query] = None,
+        count: typing.Optional[int] = None,
+        page_token: typing.Optional[str] = None,
+    ) -> Page:
+        """
+        Return the contents which include the given tag, ordered by content id.
+        :param content_query: query of contents to filter, all contents by default
+        :param count: the number of elements per page, all contents are returned if not given
+        :param page_token: the page token of this paged request
+        """
+        query = (
+            (content_query or self._session.query(Content))
+            .join(TagOnContent, TagOnContent.content_id == Content.id)
             .filter(TagOnContent.tag_id == tag.tag_id)
-            .all()
+            .order_by(Content.content_id)
         )
+        if count:
+            return get_page(query, per_page=count, page=page_token or False)
+        return Page(query.all())
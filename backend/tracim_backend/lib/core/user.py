@@ -6,6 +6,7 @@
 from smtplib import SMTPRecipientsRefused
 import typing as typing
 
+from depot.fields.upload import UploadedFile
 from depot.io.utils import FileIntent
 from hapic.data import HapicFile
 from marshmallow import ValidationError
@@ -70,10 +71,12 @@
 from tracim_backend.exceptions import WrongUserPassword
 from tracim_backend.lib.core.content import ContentApi
 from tracim_backend.lib.core.storage import StorageLib
+from tracim_backend.lib.core.user_stats import UserStatsLib
 from tracim_backend.lib.mail_notifier.notifier import get_email_manager
 from tracim_backend.lib.utils.image_process import ImageRatio
 from tracim_backend.lib.utils.image_process import ImageSize
 from tracim_backend.lib.utils.image_process import crop_image
+from tracim_backend.lib.utils.image_process import resize_image
 from tracim_backend.lib.utils.logger import logger
 from tracim_backend.lib.utils.utils import DEFAULT_NB_ITEM_PAGINATION
 from tracim_backend.models.auth import AuthType
@@ -81,6 +84,8 @@
 from tracim_backend.models.auth import User
 from tracim_backend.models.auth import UserConnectionStatus
 from tracim_backend.models.auth import UserCreationType
+from tracim_backend.models.auth import UserImageType
+from tracim_backend.models.auth import UserImageVariant
 from tracim_backend.models.context_models import AboutUser
 from tracim_backend.models.context_models import ContentInContext
 from tracim_backend.models.context_models import UserInContext
@@ -99,6 +104,13 @@
 COVER_RATIO = ImageRatio(35, 4)
 DEFAULT_AVATAR_SIZE = ImageSize(100, 100)
 DEFAULT_COVER_SIZE = ImageSize(1300, 150)
+# INFO - sizes rendered when an image is set, first one is the default one.
+# It should match sizes used by the frontend.
+AVATAR_SIZES = (DEFAULT_AVATAR_SIZE, ImageSize(50, 50), ImageSize(30, 30))
+COVER_SIZES = (DEFAULT_COVER_SIZE,)
+# INFO - urls of user images do not change with the image: allow clients to cache them
+# only for a while, then revalidate them with etag.
+USER_IMAGE_CACHE_MAX_AGE = 86400  # 1 day, in seconds
 
 
 class UserApi(object):
@@ -189,6 +201,30 @@ def get_one_by_username(self, username: str) -> User:
             ) from exc
         return user
 
+    def get_many(
+        self,
+        user_ids: typing.Iterable[int] = (),
+        emails: typing.Iterable[str] = (),
+        usernames: typing.Iterable[str] = (),
+    ) -> typing.List[User]:
+        """
+        Get users having one of the given ids, emails or usernames, in one query
+        :return: found users, unknown ids, emails and usernames are ignored
+        """
+        filters = []
+        user_ids = list(user_ids)
+        emails = [email.lower() for email in emails]
+        usernames = list(usernames)
+        if user_ids:
+            filters.append(User.user_id.in_(user_ids))
+        if emails:
+            filters.append(User.email.in_(emails))
+        if usernames:
+            filters.append(User.username.in_(usernames))
+        if not filters:
+            return []
+        return self.base_query().filter(or_(*filters)).all()
+
     def get_current_user(self) -> User:
         """
         Get current_user
@@ -950,6 +986,7 @@ def create_user(
         creation_author: typing.Optional[User] = None,
         do_save: bool = True,
         do_notify: bool = True,
+        notify_after_commit: bool = False,
     ) -> User:
         if do_notify and not self._config.EMAIL__NOTIFICATION__ACTIVATED:
             raise NotificationDisabledCantCreateUserWithInvitation(
@@ -984,7 +1021,10 @@ def create_user(
             try:
                 email_manager = get_email_manager(self._config, self._session)
                 email_manager.notify_created_account(
-                    new_user, password=password, origin_user=self._user
+                    new_user,
+                    password=password,
+                    origin_user=self._user,
+                    send_after_commit=notify_after_commit,
                 )
             # FIXME - G.M - 2018-11-02 - hack: accept bad recipient user creation
             # this should be fixed to find a solution to allow "fake" email but
@@ -1237,23 +1277,21 @@ def get_about_user(self, user_id: int) -> AboutUser:
         """
         Return general user informations.
         """
-        followers_count = self.get_followers_count(user_id)
-        leaders_count = self.get_leaders_count(user_id)
         user = self.get_one(user_id)
-
-        content_revisions_infos = ContentApi(
-            self._session, self._user, self._config
-        ).get_authored_content_revisions_infos(user_id)
+        # INFO - counters are denormalized, see UserStatsLib
+        user_stats = UserStatsLib(self._session).get_user_stats(user_id)
 
         return AboutUser(
             user_id=user.user_id,
             public_name=user.public_name,
             username=user.username,
-            followers_count=followers_count,
-            leaders_count=leaders_count,
+            followers_count=user_stats["followers_count"],
+            leaders_count=user_stats["leaders_count"],
             created=user.created,
-            authored_content_revisions_count=content_revisions_infos.count,
-            authored_content_revisions_space_count=content_revisions_infos.space_count,
+            authored_content_revisions_count=user_stats["authored_content_revisions_count"],
+            authored_content_revisions_space_count=user_stats[
+                "authored_content_revisions_space_count"
+            ],
             has_avatar=user.has_avatar,
             has_cover=user.has_cover,
         )
@@ -1283,16 +1321,15 @@ def get_avatar_preview(
         user = self.get_one(user_id)
         if not user.cropped_avatar:
             raise UserImageNotFound("cropped version of user {} avatar not found".format(user_id))
-        _, original_file_extension = os.path.splitext(user.cropped_avatar.filename)
-        return StorageLib(self._config).get_jpeg_preview(
-            depot_file=user.cropped_avatar,
+        return self._get_image_preview(
+            user,
+            UserImageType.AVATAR,
+            user.cropped_avatar,
             filename=filename,
             default_filename=default_filename,
             width=width,
             height=height,
-            original_file_extension=original_file_extension,
             force_download=force_download,
-            page_number=1,
         )
 
     def set_avatar(
@@ -1301,9 +1338,10 @@ def set_avatar(
         user = self.get_one(user_id)
 
         self._session.add(user)
-        (user.avatar, user.cropped_avatar) = self._crop_and_prepare_depot_storage(
-            new_filename, new_mimetype, new_content.read(), "avatar", AVATAR_RATIO
+        (user.avatar, user.cropped_avatar, variants) = self._crop_and_prepare_depot_storage(
+            new_filename, new_mimetype, new_content.read(), "avatar", AVATAR_RATIO, AVATAR_SIZES
         )
+        self._set_image_variants(user, UserImageType.AVATAR, variants)
         self._session.flush()
 
     def get_cover(
@@ -1331,28 +1369,88 @@ def get_cover_preview(
         user = self.get_one(user_id)
         if not user.cropped_cover:
             raise UserImageNotFound("cropped version of user {} cover not found".format(user_id))
-        _, original_file_extension = os.path.splitext(user.cropped_cover.filename)
-        return StorageLib(self._config).get_jpeg_preview(
-            depot_file=user.cropped_cover,
+        return self._get_image_preview(
+            user,
+            UserImageType.COVER,
+            user.cropped_cover,
             filename=filename,
             default_filename=default_filename,
             width=width,
             height=height,
-            original_file_extension=original_file_extension,
             force_download=force_download,
-            page_number=1,
         )
 
     def set_cover(
         self, user_id: int, new_filename: str, new_mimetype: str, new_content: typing.BinaryIO
     ) -> None:
         user = self.get_one(user_id)
-        (user.cover, user.cropped_cover) = self._crop_and_prepare_depot_storage(
-            new_filename, new_mimetype, new_content.read(), "cover", COVER_RATIO
+        (user.cover, user.cropped_cover, variants) = self._crop_and_prepare_depot_storage(
+            new_filename, new_mimetype, new_content.read(), "cover", COVER_RATIO, COVER_SIZES
         )
+        self._set_image_variants(user, UserImageType.COVER, variants)
         self._session.add(user)
         self._session.flush()
 
+    def _get_image_preview(
+        self,
+        user: User,
+        image_type: UserImageType,
+        cropped_image: UploadedFile,
+        filename: str,
+        default_filename: str,
+        width: int = None,
+        height: int = None,
+        force_download: bool = False,
+    ) -> HapicFile:
+        """
+        Get jpeg preview of a user image: pre-rendered sizes are directly sent from depot,
+        other ones are generated by preview generator.
+        """
+        storage_lib = StorageLib(self._config)
+        variant = self._session.query(UserImageVariant).get(
+            (user.user_id, image_type, width, height)
+        )
+        if variant:
+            return storage_lib.get_raw_file(
+                depot_file=variant.file,
+                filename=filename,
+                default_filename=default_filename,
+                force_download=force_download,
+                # INFO - etag changes with each new image of the user
+                etag="user-{}-{}-{}".format(user.user_id, image_type.value, variant.file.file_id),
+                cache_max_age=USER_IMAGE_CACHE_MAX_AGE,
+            )
+        _, original_file_extension = os.path.splitext(cropped_image.filename)
+        return storage_lib.get_jpeg_preview(
+            depot_file=cropped_image,
+            filename=filename,
+            default_filename=default_filename,
+            width=width,
+            height=height,
+            original_file_extension=original_file_extension,
+            force_download=force_download,
+            page_number=1,
+        )
+
+    def _set_image_variants(
+        self,
+        user: User,
+        image_type: UserImageType,
+        variants: typing.List[typing.Tuple[ImageSize, FileIntent]],
+    ) -> None:
+        """
+        Replace pre-rendered sizes of given user image, previous files are removed
+        from depot on commit.
+        """
+        user.image_variants = [
+            variant for variant in user.image_variants if variant.image_type != image_type
+        ] + [
+            UserImageVariant(
+                image_type=image_type, width=size.width, height=size.height, file=file_intent
+            )
+            for size, file_intent in variants
+        ]
+
     def _crop_and_prepare_depot_storage(
         self,
         filename: str,
@@ -1360,14 +1458,18 @@ def _crop_and_prepare_depot_storage(
         content: bytes,
         cropped_basename: str,
         crop_ratio: ImageRatio,
-    ) -> typing.Tuple[FileIntent, FileIntent]:
+        variant_sizes: typing.Sequence[ImageSize] = (),
+    ) -> typing.Tuple[FileIntent, FileIntent, typing.List[typing.Tuple[ImageSize, FileIntent]]]:
         """
-        Prepare depot storage of an image file: original + cropped image.
-        The cropped image is stored as a PNG file.
+        Prepare depot storage of an image file: original + cropped image + cropped image
+        resized to each of variant_sizes.
+        The cropped image is stored as a PNG file, resized ones as JPEG files.
         @return tuple with FileIntent objects for original, cropped images
+        and list of (size, FileIntent) for resized images.
         """
         label, extension = os.path.splitext(filename)
         original = FileIntent(content, filename, mimetype)
+        variants = []
         with io.BytesIO() as cropped_io:
             # FIXME - G.M - 2021-01-21 - should we catch error here,
             # what happened if pillow failed ?
@@ -1375,26 +1477,49 @@ def _crop_and_prepare_depot_storage(
             cropped = FileIntent(
                 cropped_io.getvalue(), "{}.png".format(cropped_basename), "image/png"
             )
-        return (original, cropped)
+            for size in variant_sizes:
+                with io.BytesIO() as resized_io:
+                    resize_image(cropped_io, resized_io, size, format="jpeg")
+                    cropped_io.seek(0)
+                    variants.append(
+                        (
+                            size,
+                            FileIntent(
+                                resized_io.getvalue(),
+                                "{}_{}x{}.jpg".format(cropped_basename, size.width, size.height),
+                                "image/jpeg",
+                            ),
+                        )
+                    )
+        return (original, cropped, variants)
 
-    def get_online_user_count(self, exclude_current_user: bool = True) -> int:
+    def get_online_user_count(
+        self, exclude_current_user: bool = True, limit: typing.Optional[int] = None
+    ) -> int:
         """Return the number of online users.
 
         By default, exclude the current user from the count.
+        :param limit: stop counting after this number of users, the returned
+        count is then at most limit.
         """
         query = self._session.query(User.user_id).filter(
             User.connection_status == UserConnectionStatus.ONLINE
         )
         if exclude_current_user:
             query = query.filter(User.user_id != self._user.user_id)
+        if limit is not None:
+            query = query.limit(limit)
         return query.count()
 
     def check_maximum_online_users(self) -> None:
-        online_user_count = self.get_online_user_count(exclude_current_user=True)
-        if (
-            self._config.LIMITATION__MAXIMUM_ONLINE_USERS
-            and online_user_count >= self._config.LIMITATION__MAXIMUM_ONLINE_USERS
-        ):
+        maximum_online_users = self._config.LIMITATION__MAXIMUM_ONLINE_USERS
+        if not maximum_online_users:
+            return
+        # INFO - no need to count all online users, knowing the limit is reached is enough
+        online_user_count = self.get_online_user_count(
+            exclude_current_user=True, limit=maximum_online_users
+        )
+        if online_user_count >= maximum_online_users:
             raise TooManyOnlineUsersError(
                 "Too many users online ({}/{})".format(
                     online_user_count, self._config.LIMITATION__MAXIMUM_ONLINE_USERS
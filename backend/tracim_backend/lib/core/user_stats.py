@@ -0,0 +1,176 @@
+import typing
+
+from pluggy import PluginManager
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from tracim_backend.lib.core.plugins import hookimpl
+from tracim_backend.models.auth import User
+from tracim_backend.models.data import Content
+from tracim_backend.models.data import ContentRevisionRO
+from tracim_backend.models.social import UserFollower
+from tracim_backend.models.social import UserStats
+
+if typing.TYPE_CHECKING:
+    from tracim_backend.lib.utils.request import TracimContext
+
+
+class UserStatsLib(object):
+    """
+    Read and update denormalized user profile counters (see UserStats).
+
+    Counters are updated with atomic "UPDATE ... SET count = count + delta"
+    statements, usable during a flush (from crud hooks). A missing stats row
+    is computed from scratch on first use.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def get_user_stats(self, user_id: int) -> typing.Dict[str, int]:
+        stats = (
+            self._session.query(
+                UserStats.followers_count,
+                UserStats.leaders_count,
+                UserStats.authored_content_revisions_count,
+                UserStats.authored_content_revisions_space_count,
+            )
+            .filter(UserStats.user_id == user_id)
+            .one_or_none()
+        )
+        if stats is None:
+            return self.rebuild_user_stats(user_id)
+        return stats._asdict()
+
+    def compute_user_stats(self, user_id: int) -> typing.Dict[str, int]:
+        """
+        Compute user counters from followers and revisions tables.
+        """
+        followers_count = (
+            self._session.query(func.count(UserFollower.follower_id))
+            .filter(UserFollower.leader_id == user_id)
+            .scalar()
+        )
+        leaders_count = (
+            self._session.query(func.count(UserFollower.leader_id))
+            .filter(UserFollower.follower_id == user_id)
+            .scalar()
+        )
+        revisions_count, spaces_count = (
+            self._session.query(
+                func.count(ContentRevisionRO.revision_id),
+                func.count(ContentRevisionRO.workspace_id.distinct()),
+            )
+            .filter(ContentRevisionRO.owner_id == user_id)
+            .one()
+        )
+        return {
+            "followers_count": followers_count,
+            "leaders_count": leaders_count,
+            "authored_content_revisions_count": revisions_count,
+            "authored_content_revisions_space_count": spaces_count,
+        }
+
+    def rebuild_user_stats(self, user_id: int) -> typing.Dict[str, int]:
+        """
+        Compute user counters and store them, replacing existing ones.
+        """
+        stats = self.compute_user_stats(user_id)
+        table = UserStats.__table__
+        result = self._session.execute(
+            table.update().where(table.c.user_id == user_id).values(**stats)
+        )
+        if not result.rowcount:
+            self._session.execute(table.insert().values(user_id=user_id, **stats))
+        return stats
+
+    def rebuild_all_user_stats(self, batch_size: int, on_batch: typing.Callable = None) -> int:
+        """
+        Rebuild counters of all users, by batches of batch_size users.
+        :param on_batch: called after each batch, for example to commit it.
+        :return: number of users whose counters were rebuilt
+        """
+        last_user_id = 0
+        rebuilt_count = 0
+        while True:
+            user_ids = [
+                user_id
+                for (user_id,) in self._session.query(User.user_id)
+                .filter(User.user_id > last_user_id)
+                .order_by(User.user_id)
+                .limit(batch_size)
+            ]
+            if not user_ids:
+                return rebuilt_count
+            for user_id in user_ids:
+                self.rebuild_user_stats(user_id)
+            rebuilt_count += len(user_ids)
+            last_user_id = user_ids[-1]
+            if on_batch:
+                on_batch()
+
+    def increment(self, user_id: int, **deltas: int) -> None:
+        """
+        Add given deltas to user counters, ie increment(1, followers_count=-1).
+        """
+        table = UserStats.__table__
+        result = self._session.execute(
+            table.update()
+            .where(table.c.user_id == user_id)
+            .values({table.c[name]: table.c[name] + delta for name, delta in deltas.items()})
+        )
+        if not result.rowcount:
+            # INFO - counters computed from scratch already include the change
+            self.rebuild_user_stats(user_id)
+
+
+class UserStatsUpdater(object):
+    """Keep UserStats counters up to date from crud hooks."""
+
+    # pluggy uses this attribute to name the plugin
+    __name__ = "UserStatsUpdater"
+
+    @hookimpl
+    def on_content_revision_created(
+        self, content: Content, revision: ContentRevisionRO, context: "TracimContext"
+    ) -> None:
+        if revision.owner_id is None:
+            return
+        session = context.dbsession
+        deltas = {"authored_content_revisions_count": 1}
+        # INFO - only the first revision of the owner in the workspace counts
+        # for the space counter, comparing revision ids handles revisions
+        # flushed together.
+        has_previous_revision_in_space = session.query(
+            session.query(ContentRevisionRO.revision_id)
+            .filter(
+                ContentRevisionRO.owner_id == revision.owner_id,
+                ContentRevisionRO.workspace_id == revision.workspace_id,
+                ContentRevisionRO.revision_id < revision.revision_id,
+            )
+            .exists()
+        ).scalar()
+        if not has_previous_revision_in_space:
+            deltas["authored_content_revisions_space_count"] = 1
+        UserStatsLib(session).increment(revision.owner_id, **deltas)
+
+    @hookimpl
+    def on_user_follower_created(
+        self, user_follower: UserFollower, context: "TracimContext"
+    ) -> None:
+        stats_lib = UserStatsLib(context.dbsession)
+        stats_lib.increment(user_follower.leader_id, followers_count=1)
+        stats_lib.increment(user_follower.follower_id, leaders_count=1)
+
+    @hookimpl
+    def on_user_follower_deleted(
+        self, user_follower: UserFollower, context: "TracimContext"
+    ) -> None:
+        stats_lib = UserStatsLib(context.dbsession)
+        stats_lib.increment(user_follower.leader_id, followers_count=-1)
+        stats_lib.increment(user_follower.follower_id, leaders_count=-1)
+
+
+def register_tracim_plugin(plugin_manager: PluginManager) -> None:
+    """Entry point for this plugin."""
+    plugin_manager.register(UserStatsUpdater())
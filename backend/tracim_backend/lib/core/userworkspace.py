@@ -1,13 +1,18 @@
 # -*- coding: utf-8 -*-
 import typing
 
+from sqlakeyset import Page
+from sqlakeyset import get_page
+from sqlalchemy import or_
 from sqlalchemy.orm import Query
+from sqlalchemy.orm import contains_eager
 from sqlalchemy.orm.exc import NoResultFound
 
 from tracim_backend.config import CFG
 from tracim_backend.exceptions import LastWorkspaceManagerRoleCantBeModified
 from tracim_backend.exceptions import RoleAlreadyExistError
 from tracim_backend.exceptions import UserRoleNotFound
+from tracim_backend.lib.utils.utils import DEFAULT_NB_ITEM_PAGINATION
 from tracim_backend.models.auth import Profile
 from tracim_backend.models.auth import User
 from tracim_backend.models.context_models import UserRoleWorkspaceInContext
@@ -18,6 +23,8 @@
 
 __author__ = "damien"
 
+USER_IDS_CHUNK_SIZE = 500
+
 
 class RoleApi(object):
     def __init__(
@@ -49,6 +56,14 @@ def get_user_workspaces_ids(
         assert (
             not self._user or self._user.profile == Profile.ADMIN or self._user.user_id == user_id
         )
+        # INFO - this is the security filter of most content queries, cache it for the session
+        workspaces_ids = self._session.get_cached_result(
+            ("user_workspaces_ids", user_id, min_role, self._show_disabled_user),
+            lambda: self._get_user_workspaces_ids(user_id, min_role),
+        )
+        return list(workspaces_ids)
+
+    def _get_user_workspaces_ids(self, user_id: int, min_role: int) -> typing.List[int]:
         workspaces_ids_tuples = (
             self._base_query()
             .with_entities(UserRoleInWorkspace.workspace_id)
@@ -169,6 +184,148 @@ def delete_one(self, user_id: int, workspace_id: int, flush=True) -> None:
         if flush:
             self._session.flush()
 
+    def bulk_update_workspace_members(
+        self,
+        workspace: Workspace,
+        roles: typing.Dict[int, int],
+        removed_user_ids: typing.Iterable[int] = (),
+        with_notif: bool = False,
+    ) -> typing.List[UserRoleInWorkspace]:
+        """
+        Create or update the roles of the given users (user_id -> role level) and delete the
+        roles of the removed users with set-based statements.
+        The per role hooks are not called, on_user_roles_in_workspace_bulk_modified is called
+        once instead.
+        :param with_notif: is user notification enabled in this workspace for created roles ?
+        :return: roles of the created or updated members
+        """
+        workspace_id = workspace.workspace_id
+        self._session.flush()
+        existing_roles = dict(
+            self._session.query(UserRoleInWorkspace.user_id, UserRoleInWorkspace.role).filter(
+                UserRoleInWorkspace.workspace_id == workspace_id
+            )
+        )
+        created_roles = {
+            user_id: role_level
+            for user_id, role_level in roles.items()
+            if user_id not in existing_roles
+        }
+        modified_roles = {
+            user_id: role_level
+            for user_id, role_level in roles.items()
+            if user_id in existing_roles and existing_roles[user_id] != role_level
+        }
+        deleted_roles = {}
+        for user_id in removed_user_ids:
+            if user_id not in existing_roles:
+                raise UserRoleNotFound(
+                    "Role for user {user_id} "
+                    "in workspace {workspace_id} was not found.".format(
+                        user_id=user_id, workspace_id=workspace_id
+                    )
+                )
+            deleted_roles[user_id] = existing_roles[user_id]
+        self._check_workspace_manager_remains(
+            workspace_id, existing_roles, created_roles, modified_roles, deleted_roles
+        )
+
+        table = UserRoleInWorkspace.__table__
+        if created_roles:
+            self._session.execute(
+                table.insert(),
+                [
+                    {
+                        "user_id": user_id,
+                        "workspace_id": workspace_id,
+                        "role": role_level,
+                        "do_notify": with_notif,
+                    }
+                    for user_id, role_level in created_roles.items()
+                ],
+            )
+        modified_user_ids_by_level = {}  # type: typing.Dict[int, typing.List[int]]
+        for user_id, role_level in modified_roles.items():
+            modified_user_ids_by_level.setdefault(role_level, []).append(user_id)
+        for role_level, user_ids in modified_user_ids_by_level.items():
+            for user_ids_chunk in self._chunks(user_ids):
+                self._session.execute(
+                    table.update()
+                    .where(table.c.workspace_id == workspace_id)
+                    .where(table.c.user_id.in_(user_ids_chunk))
+                    .values(role=role_level)
+                )
+        for user_ids_chunk in self._chunks(list(deleted_roles)):
+            self._session.execute(
+                table.delete()
+                .where(table.c.workspace_id == workspace_id)
+                .where(table.c.user_id.in_(user_ids_chunk))
+            )
+        self._expire_bulk_modified_roles(workspace, set(roles) | set(deleted_roles))
+
+        if created_roles or modified_roles or deleted_roles:
+            self._session.context.plugin_manager.hook.on_user_roles_in_workspace_bulk_modified(
+                workspace=workspace,
+                created_roles=created_roles,
+                modified_roles=modified_roles,
+                deleted_roles=deleted_roles,
+                context=self._session.context,
+            )
+
+        members = []  # type: typing.List[UserRoleInWorkspace]
+        for user_ids_chunk in self._chunks(sorted(roles)):
+            members.extend(
+                self._session.query(UserRoleInWorkspace)
+                .join(UserRoleInWorkspace.user)
+                .options(contains_eager(UserRoleInWorkspace.user))
+                .filter(UserRoleInWorkspace.workspace_id == workspace_id)
+                .filter(UserRoleInWorkspace.user_id.in_(user_ids_chunk))
+                .order_by(UserRoleInWorkspace.user_id)
+            )
+        return members
+
+    def _check_workspace_manager_remains(
+        self,
+        workspace_id: int,
+        existing_roles: typing.Dict[int, int],
+        created_roles: typing.Dict[int, int],
+        modified_roles: typing.Dict[int, int],
+        deleted_roles: typing.Dict[int, int],
+    ) -> None:
+        manager_level = WorkspaceRoles.WORKSPACE_MANAGER.level
+        managers_before = {
+            user_id for user_id, role_level in existing_roles.items() if role_level == manager_level
+        }
+        if not managers_before:
+            return
+        managers_after = managers_before - set(deleted_roles)
+        for user_id, role_level in list(created_roles.items()) + list(modified_roles.items()):
+            if role_level == manager_level:
+                managers_after.add(user_id)
+            else:
+                managers_after.discard(user_id)
+        if not managers_after:
+            raise LastWorkspaceManagerRoleCantBeModified(
+                "workspace {} can't be left without workspace manager".format(workspace_id)
+            )
+
+    def _expire_bulk_modified_roles(self, workspace: Workspace, user_ids: typing.Set[int]) -> None:
+        # INFO - roles were written without the ORM, loaded objects must not be used as is
+        for identity_key, obj in list(self._session.identity_map.items()):
+            if isinstance(obj, UserRoleInWorkspace):
+                user_id, workspace_id = identity_key[1]
+                if workspace_id == workspace.workspace_id and user_id in user_ids:
+                    self._session.expunge(obj)
+            elif isinstance(obj, User) and identity_key[1][0] in user_ids:
+                self._session.expire(obj, ["roles"])
+        self._session.expire(workspace, ["roles"])
+        self._session.clear_cached_results()
+
+    def _chunks(self, user_ids: typing.List[int]) -> typing.Iterator[typing.List[int]]:
+        for chunk_start in range(0, len(user_ids), USER_IDS_CHUNK_SIZE):
+            chunk_end = chunk_start + USER_IDS_CHUNK_SIZE
+            yield user_ids[chunk_start:chunk_end]
+
     def _is_last_workspace_manager(self, user_id: int, workspace_id: int) -> bool:
         # INFO - G.M - 2020-17-09 - check if user is workspace_manager of workspace
         try:
@@ -198,6 +355,42 @@ def get_all_for_workspace_query(self, workspace_id: int) -> Query:
     def get_all_for_workspace(self, workspace: Workspace) -> typing.List[UserRoleInWorkspace]:
         return self.get_all_for_workspace_query(workspace.workspace_id).all()
 
+    def get_workspace_members_page(
+        self,
+        workspace_id: int,
+        roles: typing.Optional[typing.List[WorkspaceRoles]] = None,
+        name_filter: typing.Optional[str] = None,
+        page_token: typing.Optional[str] = None,
+        count: typing.Optional[int] = DEFAULT_NB_ITEM_PAGINATION,
+    ) -> Page:
+        """
+        Get a page of workspace members roles ordered by user id, users of the page
+        are loaded with the roles.
+        :param roles: only return members with one of these roles
+        :param name_filter: only return members whose public name or username contains this
+        """
+        query = (
+            self._session.query(UserRoleInWorkspace)
+            .join(UserRoleInWorkspace.user)
+            .options(contains_eager(UserRoleInWorkspace.user))
+            .filter(UserRoleInWorkspace.workspace_id == workspace_id)
+        )
+        if not self._show_disabled_user:
+            query = query.filter(User.is_active == True)  # noqa:E712
+        if roles:
+            query = query.filter(UserRoleInWorkspace.role.in_([role.level for role in roles]))
+        if name_filter:
+            query = query.filter(
+                or_(
+                    User.display_name.ilike("%{}%".format(name_filter)),
+                    User.username.ilike("%{}%".format(name_filter)),
+                )
+            )
+        query = query.order_by(UserRoleInWorkspace.user_id)
+        if count:
+            return get_page(query, per_page=count, page=page_token or False)
+        return Page(query.all())
+
     def get_workspace_members(
         self, workspace_id: int, min_role: typing.Optional[WorkspaceRoles] = None
     ) -> typing.List[User]:
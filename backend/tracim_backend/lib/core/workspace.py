@@ -29,6 +29,9 @@
 
 __author__ = "damien"
 
+# INFO - bound the size of "IN" clauses of listing queries
+WORKSPACE_IDS_CHUNK_SIZE = 500
+
 
 class WorkspaceApi(object):
     def __init__(
@@ -104,6 +107,50 @@ def get_workspace_with_context(self, workspace: Workspace) -> WorkspaceInContext
         """
         return WorkspaceInContext(workspace=workspace, dbsession=self._session, config=self._config)
 
+    def get_workspaces_with_context(
+        self, workspaces: typing.List[Workspace]
+    ) -> typing.List[WorkspaceInContext]:
+        """
+        Return WorkspaceInContext objects from Workspaces, for listings: members counts
+        and owners of all workspaces are loaded with one query each.
+        """
+        members_counts = self.get_members_counts(
+            [workspace.workspace_id for workspace in workspaces]
+        )
+        owner_ids = sorted({workspace.owner_id for workspace in workspaces if workspace.owner_id})
+        # INFO - loaded owners are then found by workspace.owner in the session identity map
+        for chunk_start in range(0, len(owner_ids), WORKSPACE_IDS_CHUNK_SIZE):
+            chunk_end = chunk_start + WORKSPACE_IDS_CHUNK_SIZE
+            self._session.query(User).filter(
+                User.user_id.in_(owner_ids[chunk_start:chunk_end])
+            ).all()
+        return [
+            WorkspaceInContext(
+                workspace=workspace,
+                dbsession=self._session,
+                config=self._config,
+                number_of_members=members_counts.get(workspace.workspace_id, 0),
+            )
+            for workspace in workspaces
+        ]
+
+    def get_members_counts(self, workspace_ids: typing.List[int]) -> typing.Dict[int, int]:
+        """
+        Return number of members of given workspaces, as a workspace_id: count dict,
+        workspaces without members are missing from it.
+        """
+        members_counts = {}
+        for chunk_start in range(0, len(workspace_ids), WORKSPACE_IDS_CHUNK_SIZE):
+            chunk_end = chunk_start + WORKSPACE_IDS_CHUNK_SIZE
+            members_counts.update(
+                self._session.query(
+                    UserRoleInWorkspace.workspace_id, func.count(UserRoleInWorkspace.user_id)
+                )
+                .filter(UserRoleInWorkspace.workspace_id.in_(workspace_ids[chunk_start:chunk_end]))
+                .group_by(UserRoleInWorkspace.workspace_id)
+            )
+        return members_counts
+
     def create_workspace(
         self,
         label: str = "",
@@ -246,7 +293,17 @@ def add_current_user_as_member(self, workspace_id: int) -> Workspace:
     def get_one(self, workspace_id: int) -> Workspace:
         query = self._base_query().filter(Workspace.workspace_id == workspace_id)
         try:
-            return query.one()
+            return self._session.get_cached_result(
+                (
+                    "workspace",
+                    workspace_id,
+                    self._user.user_id if self._user else None,
+                    self._force_role,
+                    self.show_deleted,
+                    tuple(self._access_types_filter or ()),
+                ),
+                query.one,
+            )
         except NoResultFound as exc:
             raise WorkspaceNotFound(
                 "workspace {} does not exist or not visible for user".format(workspace_id)
@@ -5,10 +5,12 @@
 from tracim_backend.models.auth import User
 from tracim_backend.models.call import UserCall
 from tracim_backend.models.data import Content
+from tracim_backend.models.data import ContentRevisionRO
 from tracim_backend.models.data import UserRoleInWorkspace
 from tracim_backend.models.data import Workspace
 from tracim_backend.models.data import WorkspaceSubscription
 from tracim_backend.models.reaction import Reaction
+from tracim_backend.models.social import UserFollower
 from tracim_backend.models.tag import Tag
 from tracim_backend.models.tag import TagOnContent
 from tracim_backend.models.tracim_session import TracimSession
@@ -42,6 +44,14 @@ def _call_hooks(self, session: TracimSession, flush_context: UOWTransaction,) ->
                 )
             elif isinstance(obj, Content):
                 self._plugin_manager.hook.on_content_created(content=obj, context=session.context)
+            elif isinstance(obj, ContentRevisionRO):
+                self._plugin_manager.hook.on_content_revision_created(
+                    content=obj.node, revision=obj, context=session.context
+                )
+            elif isinstance(obj, UserFollower):
+                self._plugin_manager.hook.on_user_follower_created(
+                    user_follower=obj, context=session.context
+                )
             elif isinstance(obj, WorkspaceSubscription):
                 self._plugin_manager.hook.on_workspace_subscription_created(
                     subscription=obj, context=session.context
@@ -111,6 +121,10 @@ def _call_hooks(self, session: TracimSession, flush_context: UOWTransaction,) ->
                 )
             elif isinstance(obj, Content):
                 self._plugin_manager.hook.on_content_deleted(content=obj, context=session.context)
+            elif isinstance(obj, UserFollower):
+                self._plugin_manager.hook.on_user_follower_deleted(
+                    user_follower=obj, context=session.context
+                )
             elif isinstance(obj, WorkspaceSubscription):
                 self._plugin_manager.hook.on_workspace_subscription_deleted(
                     subscription=obj, context=session.context
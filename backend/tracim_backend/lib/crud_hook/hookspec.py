@@ -1,12 +1,16 @@
+import typing
+
 from tracim_backend.lib.core.plugins import hookspec
 from tracim_backend.lib.utils.request import TracimContext
 from tracim_backend.models.auth import User
 from tracim_backend.models.call import UserCall
 from tracim_backend.models.data import Content
+from tracim_backend.models.data import ContentRevisionRO
 from tracim_backend.models.data import UserRoleInWorkspace
 from tracim_backend.models.data import Workspace
 from tracim_backend.models.data import WorkspaceSubscription
 from tracim_backend.models.reaction import Reaction
+from tracim_backend.models.social import UserFollower
 from tracim_backend.models.tag import Tag
 from tracim_backend.models.tag import TagOnContent
 
@@ -15,8 +19,10 @@ class DatabaseCrudHookSpec:
     """Hook specifications for crud operations on tracim entities:
     - User
     - Content
+    - ContentRevisionRO (creation only)
+    - UserFollower (creation and deletion)
     - Workspace
-    - UserRoleInWorkspace
+    - UserRoleInWorkspace (also modified in bulk)
     - WorkspaceSubscription
     - Reaction
     - Tag
@@ -66,6 +72,20 @@ def on_user_role_in_workspace_deleted(
     ) -> None:
         ...
 
+    @hookspec
+    def on_user_roles_in_workspace_bulk_modified(
+        self,
+        workspace: Workspace,
+        created_roles: typing.Dict[int, int],
+        modified_roles: typing.Dict[int, int],
+        deleted_roles: typing.Dict[int, int],
+        context: TracimContext,
+    ) -> None:
+        """Called instead of the per role hooks when roles are written in bulk.
+
+        Roles are given as user_id -> role level (previous level for deleted roles)."""
+        ...
+
     @hookspec
     def on_content_created(self, content: Content, context: TracimContext) -> None:
         ...
@@ -79,7 +99,17 @@ def on_content_deleted(self, content: Content, context: TracimContext) -> None:
         ...
 
     @hookspec
-    def on_content_revision_created(self, content: Content, context: TracimContext) -> None:
+    def on_content_revision_created(
+        self, content: Content, revision: ContentRevisionRO, context: TracimContext
+    ) -> None:
+        ...
+
+    @hookspec
+    def on_user_follower_created(self, user_follower: UserFollower, context: TracimContext) -> None:
+        ...
+
+    @hookspec
+    def on_user_follower_deleted(self, user_follower: UserFollower, context: TracimContext) -> None:
         ...
 
     @hookspec
@@ -12,6 +12,7 @@
 from tracim_backend.lib.core.workspace import WorkspaceApi
 from tracim_backend.lib.mail_notifier.sender import EmailSender
 from tracim_backend.lib.mail_notifier.sender import send_email_through
+from tracim_backend.lib.mail_notifier.sender import send_email_through_after_commit
 from tracim_backend.lib.mail_notifier.utils import EST
 from tracim_backend.lib.mail_notifier.utils import EmailAddress
 from tracim_backend.lib.mail_notifier.utils import EmailNotificationMessage
@@ -325,13 +326,18 @@ def notify_content_update(self, event_actor_id: int, event_content_id: int) -> N
             send_email_through(self.config, email_sender.send_mail, message)
 
     def notify_created_account(
-        self, user: User, password: typing.Optional[str], origin_user: typing.Optional[User] = None
+        self,
+        user: User,
+        password: typing.Optional[str],
+        origin_user: typing.Optional[User] = None,
+        send_after_commit: bool = False,
     ) -> None:
         """
         Send created account email to given user.
 
         :param password: chosen password
         :param user: user to notify
+        :param send_after_commit: only send (or queue) the email once the session is committed
         """
         logger.info(self, "Generating created account mail to {}".format(user.email))
 
@@ -366,9 +372,17 @@ def notify_created_account(
             lang=translator.default_lang,
         )
 
-        send_email_through(
-            config=self.config, sendmail_callable=email_sender.send_mail, message=message
-        )
+        if send_after_commit:
+            send_email_through_after_commit(
+                config=self.config,
+                session=self.session,
+                sendmail_callable=email_sender.send_mail,
+                message=message,
+            )
+        else:
+            send_email_through(
+                config=self.config, sendmail_callable=email_sender.send_mail, message=message
+            )
 
     def notify_reset_password(self, user: User, reset_password_token: str) -> None:
         """
@@ -3,11 +3,13 @@
 import smtplib
 import typing
 
+from sqlalchemy.event import listen
+from sqlalchemy.orm import Session
+
 from tracim_backend.config import CFG
 from tracim_backend.lib.mail_notifier.utils import SmtpConfiguration
 from tracim_backend.lib.rq import RqQueueName
-from tracim_backend.lib.rq import get_redis_connection
-from tracim_backend.lib.rq import get_rq_queue
+from tracim_backend.lib.rq import get_rq_queue2
 from tracim_backend.lib.utils.logger import logger
 
 
@@ -33,8 +35,7 @@ def send_email_through(
             "mail stored in queue in wait for a"
             "mail_notifier daemon".format(message["To"]),
         )
-        redis_connection = get_redis_connection(config)
-        queue = get_rq_queue(redis_connection, RqQueueName.MAIL_SENDER)
+        queue = get_rq_queue2(config, RqQueueName.MAIL_SENDER)
         queue.enqueue(sendmail_callable, message)
     else:
         raise NotImplementedError(
@@ -42,6 +43,29 @@ def send_email_through(
         )
 
 
+def send_email_through_after_commit(
+    config: CFG,
+    session: Session,
+    sendmail_callable: typing.Callable[[MIMEMultipart], None],
+    message: MIMEMultipart,
+) -> None:
+    """
+    Send mail with send_email_through() once the session transaction is committed:
+    nothing is sent if the transaction is rolled back and sending errors are only logged.
+    """
+
+    def send_email(session: Session) -> None:
+        try:
+            send_email_through(config, sendmail_callable, message)
+        except Exception as exc:
+            logger.error(
+                send_email_through_after_commit, "Cannot send email to {}".format(message["To"])
+            )
+            logger.exception(send_email_through_after_commit, exc)
+
+    listen(session, "after_commit", send_email, once=True)
+
+
 class EmailSender(object):
     """
     Independent email sender class.
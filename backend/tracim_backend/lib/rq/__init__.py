@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 import enum
+import os
+import typing
 
 import redis
 import rq
@@ -12,18 +14,42 @@ class RqQueueName(str, enum.Enum):
     EVENT = "event"
     MAIL_SENDER = "mail_sender"
     ELASTICSEARCH_INDEXER = "elasticsearch_indexer"
+    AGENDA = "agenda"
+
+
+# INFO - redis connection pools and queues are shared by the whole process, they are
+# rebuilt when the process id changes as connections can't be shared by forked processes
+# (WSGI servers and RQ workers fork).
+_redis_connection_pools = {}  # type: typing.Dict[typing.Tuple[str, int, int], redis.ConnectionPool]
+_rq_queues = {}  # type: typing.Dict[typing.Tuple[str, int, int, str], rq.Queue]
+_pools_process_id = None  # type: typing.Optional[int]
+
+
+def _get_redis_connection_pool(config: CFG) -> redis.ConnectionPool:
+    global _pools_process_id
+    if _pools_process_id != os.getpid():
+        _redis_connection_pools.clear()
+        _rq_queues.clear()
+        _pools_process_id = os.getpid()
+    key = (
+        config.JOBS__ASYNC__REDIS__HOST,
+        config.JOBS__ASYNC__REDIS__PORT,
+        config.JOBS__ASYNC__REDIS__DB,
+    )
+    try:
+        return _redis_connection_pools[key]
+    except KeyError:
+        return _redis_connection_pools.setdefault(
+            key, redis.ConnectionPool(host=key[0], port=key[1], db=key[2])
+        )
 
 
 def get_redis_connection(config: CFG) -> redis.Redis:
     """
     :param config: current app_config
-    :return: redis connection
+    :return: redis connection using the process connection pool
     """
-    return redis.Redis(
-        host=config.JOBS__ASYNC__REDIS__HOST,
-        port=config.JOBS__ASYNC__REDIS__PORT,
-        db=config.JOBS__ASYNC__REDIS__DB,
-    )
+    return redis.Redis(connection_pool=_get_redis_connection_pool(config))
 
 
 def get_rq_queue(
@@ -39,6 +65,39 @@ def get_rq_queue(
     return rq.Queue(name=queue_name.value, connection=redis_connection, is_async=is_async)
 
 
-def get_rq_queue2(config: CFG, queue_name: RqQueueName) -> rq.job.Job:
-    connection = get_redis_connection(config)
-    return get_rq_queue(connection, queue_name)
+def get_rq_queue2(config: CFG, queue_name: RqQueueName) -> rq.Queue:
+    """
+    :return: the queue of given name, reused for the whole process
+    """
+    pool = _get_redis_connection_pool(config)
+    key = (
+        config.JOBS__ASYNC__REDIS__HOST,
+        config.JOBS__ASYNC__REDIS__PORT,
+        config.JOBS__ASYNC__REDIS__DB,
+        queue_name.value,
+    )
+    try:
+        return _rq_queues[key]
+    except KeyError:
+        queue = get_rq_queue(redis.Redis(connection_pool=pool), queue_name)
+        return _rq_queues.setdefault(key, queue)
+
+
+def enqueue_jobs(
+    config: CFG,
+    queue_name: RqQueueName,
+    jobs: typing.Iterable[typing.Tuple[typing.Callable, typing.Tuple]],
+) -> typing.List[rq.job.Job]:
+    """
+    Enqueue several jobs with a single redis round-trip (pipeline).
+    :param jobs: (callable, args) tuples
+    :return: enqueued jobs
+    """
+    queue = get_rq_queue2(config, queue_name)
+    enqueued_jobs = []
+    with queue.connection.pipeline() as pipeline:
+        for func, args in jobs:
+            job = queue.create_job(func, args=args)
+            enqueued_jobs.append(queue.enqueue_job(job, pipeline=pipeline))
+        pipeline.execute()
+    return enqueued_jobs
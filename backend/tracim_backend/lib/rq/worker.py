@@ -83,7 +83,7 @@ def work(self, *args, **kwargs):
             app_config = kwargs.pop("app_config")
         except KeyError:
             app_config = initialize_config_from_environment()
-        _engines.push(get_engine(app_config))
+        _engines.push(get_engine(app_config, pool_name="worker"))
         _configs.push(app_config)
         try:
             super().work(*args, **kwargs)
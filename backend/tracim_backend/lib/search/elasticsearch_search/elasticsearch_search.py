@@ -1126,6 +1126,19 @@ def on_user_role_in_workspace_deleted(
     ) -> None:
         self.index_user(role.user, context)
 
+    @hookimpl
+    def on_user_roles_in_workspace_bulk_modified(
+        self,
+        workspace: Workspace,
+        created_roles: typing.Dict[int, int],
+        modified_roles: typing.Dict[int, int],
+        deleted_roles: typing.Dict[int, int],
+        context: TracimContext,
+    ) -> None:
+        user_ids = set(created_roles) | set(modified_roles) | set(deleted_roles)
+        for user in context.dbsession.query(User).filter(User.user_id.in_(user_ids)):
+            self.index_user(user, context)
+
     def index_user(self, user: User, context: TracimContext) -> None:
         """Index the given user in the corresponding ES index.
         Two execution modes: sync or async depending on jobs.processing_mode.
@@ -1201,6 +1214,17 @@ def on_user_role_in_workspace_deleted(
     ) -> None:
         self.index_workspace(role.workspace, context)
 
+    @hookimpl
+    def on_user_roles_in_workspace_bulk_modified(
+        self,
+        workspace: Workspace,
+        created_roles: typing.Dict[int, int],
+        modified_roles: typing.Dict[int, int],
+        deleted_roles: typing.Dict[int, int],
+        context: TracimContext,
+    ) -> None:
+        self.index_workspace(workspace, context)
+
     def index_workspace(self, workspace: Workspace, context: TracimContext) -> None:
         """Index the given workpace in the corresponding ES index.
 
@@ -1,3 +1,4 @@
+from collections import defaultdict
 import re
 import time
 import typing
@@ -21,6 +22,9 @@
 
 # INFO - RJ-2020-07-06 Relevant pushpin documentation: https://pushpin.org/docs/advanced/#stats-socket
 
+# INFO - maximum number of user ids given in a single "IN" clause
+STATUS_CHANGES_CHUNK_SIZE = 500
+
 
 class CustomTracimContext(TracimContext):
     def __init__(self, config: CFG) -> None:
@@ -49,8 +53,20 @@ def plugin_manager(self) -> pluggy.PluginManager:
 class UserConnectionStateMonitor:
     def __init__(self, config: CFG):
         self.config = config
-        self.session_factory = get_session_factory(get_engine(config))
+        self.session_factory = get_session_factory(get_engine(config, pool_name="daemon"))
         self.pending_offline_users = {}
+        # INFO - status changes received from pushpin are coalesced and written by batches
+        self.pending_status_changes = {}  # type: typing.Dict[int, UserConnectionStatus]
+        self.pending_status_changes_since = None  # type: typing.Optional[float]
+
+    def _create_context(self) -> CustomTracimContext:
+        # INFO - the session only keeps a weak reference to its context: keep the returned
+        # context alive while using its session
+        context = CustomTracimContext(self.config)
+        context._session = create_dbsession_for_context(
+            self.session_factory, transaction.manager, context
+        )
+        return context
 
     def set_user_connection_status(
         self, user_id: typing.Optional[int], status: UserConnectionStatus
@@ -60,11 +76,8 @@ def set_user_connection_status(
         except KeyError:
             pass
 
-        context = CustomTracimContext(self.config)
-        session = create_dbsession_for_context(self.session_factory, transaction.manager, context)
-
-        context._session = session
-
+        context = self._create_context()
+        session = context.dbsession
         uapi = UserApi(session=session, current_user=None, config=self.config)
         query = uapi.base_query()
 
@@ -75,6 +88,79 @@ def set_user_connection_status(
         transaction.commit()
         logger.debug(self, "Set connection status of user {} to {}".format(user_id or "*", status))
 
+    def add_status_change(self, user_id: int, status: UserConnectionStatus) -> None:
+        """
+        Register a status change, written later by write_status_changes().
+        Only the last status received for a user is kept.
+        """
+        try:
+            del self.pending_offline_users[user_id]
+        except KeyError:
+            pass
+        if not self.pending_status_changes:
+            self.pending_status_changes_since = time.monotonic()
+        self.pending_status_changes[user_id] = status
+
+    def get_status_changes_timeout(self) -> typing.Optional[float]:
+        """
+        Return the delay (in seconds) before pending status changes must be written,
+        None if there are no pending status changes.
+        """
+        if not self.pending_status_changes:
+            return None
+        return max(
+            self.pending_status_changes_since
+            + self.config.USER__CONNECTION_STATUS_BATCH_DELAY
+            - time.monotonic(),
+            0,
+        )
+
+    def write_status_changes(self, force: bool = False) -> None:
+        """
+        Write pending status changes with one UPDATE per status (and per chunk of users),
+        users already having the new status are left untouched.
+        :param force: write status changes even if the batch delay is not elapsed.
+        """
+        timeout = self.get_status_changes_timeout()
+        if timeout is None or (timeout > 0 and not force):
+            return
+
+        user_ids_by_status = defaultdict(list)
+        for user_id, status in self.pending_status_changes.items():
+            user_ids_by_status[status].append(user_id)
+        self.pending_status_changes = {}
+        self.pending_status_changes_since = None
+
+        context = self._create_context()
+        session = context.dbsession
+        uapi = UserApi(session=session, current_user=None, config=self.config)
+        changed_user_ids_by_status = {}
+        for status, user_ids in user_ids_by_status.items():
+            changed_user_ids = []
+            for chunk_start in range(0, len(user_ids), STATUS_CHANGES_CHUNK_SIZE):
+                chunk_end = chunk_start + STATUS_CHANGES_CHUNK_SIZE
+                chunk_changed_user_ids = [
+                    user_id
+                    for (user_id,) in uapi.base_query()
+                    .filter(User.user_id.in_(user_ids[chunk_start:chunk_end]))
+                    .filter(User.connection_status != status)
+                    .with_entities(User.user_id)
+                ]
+                if not chunk_changed_user_ids:
+                    continue
+                session.query(User).filter(User.user_id.in_(chunk_changed_user_ids)).update(
+                    {User.connection_status: status}, synchronize_session=False
+                )
+                changed_user_ids.extend(chunk_changed_user_ids)
+            changed_user_ids_by_status[status] = changed_user_ids
+        transaction.commit()
+
+        for status, changed_user_ids in changed_user_ids_by_status.items():
+            for user_id in changed_user_ids:
+                logger.debug(
+                    self, "Set connection status of user {} to {}".format(user_id, status.value)
+                )
+
     def add_to_pending_offline_users(self, user_id: int) -> None:
         logger.debug(self, "User {} left".format(user_id))
         self.pending_offline_users[user_id] = time.monotonic()
@@ -86,8 +172,7 @@ def handle_pending_offline_users(self, online_timeout: int):
         current_time = time.monotonic()
         for (user_id, last_seen_time) in list(self.pending_offline_users.items()):
             if last_seen_time and last_seen_time + online_timeout <= current_time:
-                del self.pending_offline_users[user_id]
-                self.set_user_connection_status(user_id, UserConnectionStatus.OFFLINE)
+                self.add_status_change(user_id, UserConnectionStatus.OFFLINE)
 
     def run(self) -> None:
         # We assume everybody is offline when starting the daemon. This is true when starting a
@@ -109,12 +194,18 @@ def run(self) -> None:
         poller.register(sock, zmq.POLLIN)
 
         while True:
-            # Let's wait messages for online_timeout seconds
-            evts = poller.poll(online_timeout * 1000)
+            # Let's wait messages for online_timeout seconds, or less if status changes
+            # are waiting to be written
+            timeout = online_timeout
+            status_changes_timeout = self.get_status_changes_timeout()
+            if status_changes_timeout is not None:
+                timeout = min(timeout, status_changes_timeout)
+            evts = poller.poll(int(timeout * 1000))
 
             # When a message is received, or after the timeout, we mark as offline users that should
             # be marked as offline
             self.handle_pending_offline_users(online_timeout)
+            self.write_status_changes()
 
             if not evts:
                 # No message was received
@@ -149,4 +240,4 @@ def run(self) -> None:
                 self.add_to_pending_offline_users(user_id)
             else:
                 # The user is online
-                self.set_user_connection_status(user_id, UserConnectionStatus.ONLINE)
+                self.add_status_change(user_id, UserConnectionStatus.ONLINE)
@@ -126,7 +126,7 @@ def __init__(self, role_level: int):
 
     def check(self, tracim_context: TracimContext) -> bool:
         if (
-            tracim_context.current_workspace.get_user_role(tracim_context.current_user)
+            tracim_context.get_user_role_in_workspace(tracim_context.current_workspace)
             >= self.role_level
         ):
             return True
@@ -143,7 +143,7 @@ def __init__(self, role_level: int) -> None:
 
     def check(self, tracim_context: TracimContext) -> bool:
         if (
-            tracim_context.current_content.workspace.get_user_role(tracim_context.current_user)
+            tracim_context.get_user_role_in_workspace(tracim_context.current_content.workspace)
             >= self.role_level
         ):
             return True
@@ -161,7 +161,7 @@ def __init__(self, role_level: int):
 
     def check(self, tracim_context: TracimContext) -> bool:
         if (
-            tracim_context.candidate_workspace.get_user_role(tracim_context.current_user)
+            tracim_context.get_user_role_in_workspace(tracim_context.candidate_workspace)
             >= self.role_level
         ):
             return True
@@ -203,7 +203,7 @@ def __init__(
         self.content_type_list = content_type_list
 
     def check(self, tracim_context: TracimContext) -> bool:
-        user_role = tracim_context.current_workspace.get_user_role(tracim_context.current_user)
+        user_role = tracim_context.get_user_role_in_workspace(tracim_context.current_workspace)
         if self.content_type_slug:
             content_type = self.content_type_list.get_one_by_slug(self.content_type_slug)
         else:
@@ -0,0 +1,137 @@
+import threading
+import time
+import typing
+import weakref
+
+from pyramid.threadlocal import get_current_request
+from rq import get_current_job
+from sqlalchemy.engine import Engine
+from sqlalchemy.event import listen
+from sqlalchemy.pool import QueuePool
+
+from tracim_backend.lib.utils.logger import logger
+
+# INFO - statistics are kept as long as their engine exists
+_pools_statistics = weakref.WeakSet()  # type: weakref.WeakSet
+
+
+class MonitoredQueuePool(QueuePool):
+    """
+    QueuePool measuring the time spent waiting for a connection, see DatabasePoolStatistics.
+    """
+
+    statistics = None  # type: typing.Optional[DatabasePoolStatistics]
+
+    def _do_get(self):
+        start_time = time.monotonic()
+        try:
+            return super()._do_get()
+        finally:
+            if self.statistics:
+                self.statistics.add_wait_time(time.monotonic() - start_time)
+
+    def recreate(self) -> "MonitoredQueuePool":
+        pool = super().recreate()
+        pool.statistics = self.statistics
+        return pool
+
+
+class DatabasePoolStatistics(object):
+    """
+    Connection checkout statistics of an engine pool, for the current process.
+    Connections held longer than hold_warning_threshold seconds (0 to disable) are logged
+    with their holder (request, rq job or thread).
+    """
+
+    def __init__(self, name: str, engine: Engine, hold_warning_threshold: float) -> None:
+        self.name = name
+        self.hold_warning_threshold = hold_warning_threshold
+        self._engine = engine
+        self._lock = threading.Lock()
+        self.checkouts_count = 0
+        self.checked_out_count = 0
+        self.max_checked_out_count = 0
+        self.waits_count = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.long_holds_count = 0
+        self.max_hold_time = 0.0
+
+    @classmethod
+    def monitor(
+        cls, name: str, engine: Engine, hold_warning_threshold: float
+    ) -> "DatabasePoolStatistics":
+        statistics = cls(name, engine, hold_warning_threshold)
+        listen(engine, "checkout", statistics.on_checkout)
+        listen(engine, "checkin", statistics.on_checkin)
+        if isinstance(engine.pool, MonitoredQueuePool):
+            engine.pool.statistics = statistics
+        _pools_statistics.add(statistics)
+        return statistics
+
+    def add_wait_time(self, wait_time: float) -> None:
+        with self._lock:
+            self.waits_count += 1
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info["checkout_time"] = time.monotonic()
+        connection_record.info["holder"] = _get_connection_holder()
+        with self._lock:
+            self.checkouts_count += 1
+            self.checked_out_count += 1
+            self.max_checked_out_count = max(self.max_checked_out_count, self.checked_out_count)
+
+    def on_checkin(self, dbapi_connection, connection_record) -> None:
+        # INFO - invalidated connections may be checked in without their record
+        if connection_record is None or "checkout_time" not in connection_record.info:
+            return
+        hold_time = time.monotonic() - connection_record.info.pop("checkout_time")
+        holder = connection_record.info.pop("holder", None)
+        with self._lock:
+            self.checked_out_count -= 1
+            self.max_hold_time = max(self.max_hold_time, hold_time)
+            if not self.hold_warning_threshold or hold_time < self.hold_warning_threshold:
+                return
+            self.long_holds_count += 1
+        logger.warning(
+            self,
+            "Connection of database pool {} held for {:.2f}s by {}".format(
+                self.name, hold_time, holder
+            ),
+        )
+
+    def get_statistics(self) -> typing.Dict[str, typing.Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "pool_status": self._engine.pool.status(),
+                "checkouts_count": self.checkouts_count,
+                "checked_out_count": self.checked_out_count,
+                "max_checked_out_count": self.max_checked_out_count,
+                "average_wait_time": self.total_wait_time / self.waits_count
+                if self.waits_count
+                else 0.0,
+                "max_wait_time": self.max_wait_time,
+                "long_holds_count": self.long_holds_count,
+                "max_hold_time": self.max_hold_time,
+            }
+
+
+def get_database_pools_statistics() -> typing.List[typing.Dict[str, typing.Any]]:
+    """Statistics of all database pools of the current process."""
+    return sorted(
+        (statistics.get_statistics() for statistics in list(_pools_statistics)),
+        key=lambda statistics: statistics["name"],
+    )
+
+
+def _get_connection_holder() -> str:
+    request = get_current_request()
+    if request is not None:
+        return "request {} {}".format(request.method, request.path)
+    job = get_current_job()
+    if job is not None:
+        return "job {}".format(job.func_name)
+    return "thread {}".format(threading.current_thread().name)
@@ -0,0 +1,272 @@
+from datetime import datetime
+import mimetypes
+import os
+import typing
+import uuid
+
+from hapic.data import HapicFile
+from pyramid.response import FileIter
+from pyramid.response import Response
+from webob.request import BaseRequest
+
+# INFO - cache lifetime of immutable files, as advised by rfc8246
+IMMUTABLE_FILE_CACHE_MAX_AGE = 31536000  # 1 year, in seconds
+MULTIPART_BYTERANGES_BOUNDARY_PREFIX = "tracim-byteranges-"
+
+
+class TracimFile(HapicFile):
+    """
+    HapicFile with tracim specific options:
+    :param immutable: file is addressed by an url which will always return same content
+    (like a revision one): allow clients to cache it without revalidation.
+    :param cache_max_age: allow clients to cache file for this duration (in seconds),
+    then to revalidate it.
+    :param offload_header: (header name, internal path) tuple: file content is not sent by
+    tracim but by the front web server (X-Accel-Redirect/X-Sendfile).
+    """
+
+    def __init__(
+        self,
+        *args,
+        immutable: bool = False,
+        cache_max_age: typing.Optional[int] = None,
+        offload_header: typing.Optional[typing.Tuple[str, str]] = None,
+        **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.immutable = immutable
+        self.cache_max_age = cache_max_age
+        self.offload_header = offload_header
+
+
+class SeekableFileIter(FileIter):
+    """
+    FileIter serving a byte range by seeking into the file, instead of reading
+    (and dropping) all data before the range like default webob behaviour.
+    """
+
+    def app_iter_range(self, start: int, stop: typing.Optional[int]) -> "FileRangeIter":
+        return FileRangeIter(self.file, start, stop, self.block_size)
+
+
+class FileRangeIter(object):
+    """
+    Iterate over the [start, stop[ byte range of a seekable file.
+    """
+
+    def __init__(
+        self, file: typing.BinaryIO, start: int, stop: typing.Optional[int], block_size: int
+    ) -> None:
+        self.file = file
+        self.file.seek(start)
+        self.remaining = stop - start if stop is not None else None
+        self.block_size = block_size
+
+    def __iter__(self) -> "FileRangeIter":
+        return self
+
+    def __next__(self) -> bytes:
+        if self.remaining is None:
+            data = self.file.read(self.block_size)
+        elif self.remaining > 0:
+            data = self.file.read(min(self.block_size, self.remaining))
+            self.remaining -= len(data)
+        else:
+            data = b""
+        if not data:
+            raise StopIteration
+        return data
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def parse_byte_ranges(
+    range_header: typing.Optional[str], content_length: int
+) -> typing.Optional[typing.List[typing.Tuple[int, int]]]:
+    """
+    Parse a Range header value (rfc7233), which can contain multiple ranges.
+    :return: satisfiable ranges as [start, stop[ tuples or None if header is missing
+    or invalid.
+    """
+    if not range_header:
+        return None
+    unit, _, range_set = range_header.partition("=")
+    if unit.strip().lower() != "bytes":
+        return None
+    ranges = []
+    for range_spec in range_set.split(","):
+        first_byte, separator, last_byte = range_spec.strip().partition("-")
+        if not separator:
+            return None
+        try:
+            if first_byte:
+                start = int(first_byte)
+                stop = int(last_byte) + 1 if last_byte else content_length
+            else:
+                start = max(content_length - int(last_byte), 0)
+                stop = content_length
+        except ValueError:
+            return None
+        if start < 0 or stop <= start:
+            return None
+        if start < content_length:
+            ranges.append((start, min(stop, content_length)))
+    return ranges
+
+
+class TracimFileResponse(Response):
+    """
+    Pyramid response for files, handling requests with multiple byte ranges
+    (multipart/byteranges response), single range and other conditional requests
+    are handled by webob.
+    """
+
+    offload_header_name = None  # type: typing.Optional[str]
+
+    def conditional_response_app(self, environ, start_response):
+        if self.offload_header_name:
+            return super().conditional_response_app(
+                environ, self._offload_start_response(start_response)
+            )
+        ranges = self._get_multiple_ranges(environ)
+        if ranges and not isinstance(self.app_iter, SeekableFileIter):
+            # INFO - webob would only serve first range: serve whole file instead
+            environ = dict(environ)
+            del environ["HTTP_RANGE"]
+            ranges = None
+        if not ranges:
+            return super().conditional_response_app(environ, start_response)
+
+        boundary = MULTIPART_BYTERANGES_BOUNDARY_PREFIX + uuid.uuid4().hex
+        part_headers = [
+            "--{}\r\nContent-Type: {}\r\nContent-Range: bytes {}-{}/{}\r\n\r\n".format(
+                boundary, self.content_type, start, stop - 1, self.content_length
+            ).encode("ascii")
+            for start, stop in ranges
+        ]
+        closing_boundary = "--{}--\r\n".format(boundary).encode("ascii")
+        body_length = len(closing_boundary) + sum(
+            len(part_header) + stop - start + 2
+            for part_header, (start, stop) in zip(part_headers, ranges)
+        )
+        headerlist = [
+            (name, value)
+            for name, value in self._abs_headerlist(environ)
+            if name.lower() not in ("content-length", "content-type")
+        ]
+        headerlist += [
+            ("Content-Type", "multipart/byteranges; boundary={}".format(boundary)),
+            ("Content-Length", str(body_length)),
+        ]
+        start_response("206 Partial Content", headerlist)
+        return self._multiple_ranges_iter(ranges, part_headers, closing_boundary)
+
+    def _offload_start_response(self, start_response: typing.Callable) -> typing.Callable:
+        # INFO - byte ranges of offloaded files are served by the front web server but
+        # it must not send the file when tracim answers "not modified"
+        def offload_start_response(status: str, headerlist: list, exc_info=None):
+            if not status.startswith("200"):
+                headerlist = [
+                    (name, value)
+                    for name, value in headerlist
+                    if name.lower() != self.offload_header_name.lower()
+                ]
+            return start_response(status, headerlist, exc_info)
+
+        return offload_start_response
+
+    def _get_multiple_ranges(
+        self, environ: dict
+    ) -> typing.Optional[typing.List[typing.Tuple[int, int]]]:
+        if environ.get("REQUEST_METHOD", "GET") != "GET" or self.status_code != 200:
+            return None
+        if self.content_length is None:
+            return None
+        request = BaseRequest(environ)
+        # INFO - let webob answer "not modified" requests
+        if request.if_none_match and self.etag:
+            return None
+        if request.if_modified_since and self.last_modified:
+            return None
+        if self not in request.if_range:
+            return None
+        ranges = parse_byte_ranges(environ.get("HTTP_RANGE"), self.content_length)
+        if not ranges or len(ranges) < 2:
+            return None
+        return ranges
+
+    def _multiple_ranges_iter(
+        self,
+        ranges: typing.List[typing.Tuple[int, int]],
+        part_headers: typing.List[bytes],
+        closing_boundary: bytes,
+    ) -> typing.Generator[bytes, None, None]:
+        try:
+            for part_header, (start, stop) in zip(part_headers, ranges):
+                yield part_header
+                yield from FileRangeIter(self.app_iter.file, start, stop, self.app_iter.block_size)
+                yield b"\r\n"
+            yield closing_boundary
+        finally:
+            self.app_iter.close()
+
+
+def get_file_response(file_response: HapicFile, http_code: int) -> Response:
+    """
+    Build a pyramid response for an hapic file, like hapic does, but:
+    - files given by path are served by seeking into them for byte ranges requests,
+    including multiple byte ranges requests.
+    - immutable TracimFile are returned with long-lived cache headers.
+    - offloaded TracimFile are returned without body, front web server will send the file
+    content from the offload header.
+    """
+    response = TracimFileResponse(status=http_code)
+    offload_header = getattr(file_response, "offload_header", None)
+    if offload_header:
+        header_name, internal_path = offload_header
+        response.headers[header_name] = internal_path
+        response.offload_header_name = header_name
+        response.content_type = (
+            file_response.mimetype
+            or mimetypes.guess_type(file_response.file_path or "", strict=False)[0]
+            or "application/octet-stream"
+        )
+        response.app_iter = []
+        if file_response.last_modified:
+            response.last_modified = file_response.last_modified
+    elif file_response.file_path:
+        response.content_type = (
+            file_response.mimetype
+            or mimetypes.guess_type(file_response.file_path, strict=False)[0]
+            or "application/octet-stream"
+        )
+        response.app_iter = SeekableFileIter(open(file_response.file_path, "rb"))
+        response.content_length = os.path.getsize(file_response.file_path)
+        response.last_modified = file_response.last_modified or datetime.utcfromtimestamp(
+            os.path.getmtime(file_response.file_path)
+        )
+    else:
+        response.content_type = file_response.mimetype
+        response.app_iter = FileIter(file_response.file_object)
+        if file_response.content_length:
+            response.content_length = file_response.content_length
+        if file_response.last_modified:
+            response.last_modified = file_response.last_modified
+
+    response.conditional_response = file_response.use_conditional_response
+    if file_response.etag:
+        response.etag = file_response.etag
+    if file_response.use_conditional_response:
+        response.accept_ranges = "bytes"
+    else:
+        response.accept_ranges = "none"
+    # INFO - files may need authorization: only allow private caches
+    if isinstance(file_response, TracimFile) and file_response.immutable:
+        response.cache_control = "private, max-age={}, immutable".format(
+            IMMUTABLE_FILE_CACHE_MAX_AGE
+        )
+    elif isinstance(file_response, TracimFile) and file_response.cache_max_age:
+        response.cache_control = "private, max-age={}".format(file_response.cache_max_age)
+    response.content_disposition = file_response.get_content_disposition_header_value()
+    return response
@@ -74,3 +74,26 @@ def crop_image(
     img = ImageOps.fit(img, (new_size.width, new_size.height))
     img.save(destination_file, format=format)
     destination_file.seek(0)
+
+
+def resize_image(
+    source_file: typing.BinaryIO,
+    destination_file: typing.BinaryIO,
+    size: ImageSize,
+    format="jpeg",
+    background_color=(255, 255, 255),
+) -> None:
+    """
+    Resize (and crop if needed) image to given size.
+    Transparency is replaced by background_color for formats which do not support it.
+    result will be stored into destination_file(fileobj)
+    """
+    img = Image.open(source_file)
+    img = ImageOps.fit(img, (size.width, size.height), method=Image.LANCZOS)
+    if format == "jpeg" and img.mode != "RGB":
+        img = img.convert("RGBA")
+        background = Image.new("RGB", img.size, background_color)
+        background.paste(img, mask=img.split()[3])
+        img = background
+    img.save(destination_file, format=format)
+    destination_file.seek(0)
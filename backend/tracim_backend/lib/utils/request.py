@@ -59,6 +59,8 @@ def __init__(self) -> None:
         self._client_token = None  # type: typing.Optional[str]
         # Pending events: have been created but are commited to the DB
         self._pending_events = []  # type: typing.List[Event]
+        # Role levels of users in workspaces, by (user_id, workspace_id)
+        self._user_roles_in_workspaces = {}  # type: typing.Dict[typing.Tuple[int, int], int]
 
     @property
     def pending_events(self) -> typing.List[Event]:
@@ -80,6 +82,19 @@ def set_client_token(self, client_token: str):
     def client_token(self) -> typing.Optional[str]:
         return self._client_token
 
+    def get_user_role_in_workspace(
+        self, workspace: Workspace, user: typing.Optional[User] = None
+    ) -> int:
+        """
+        Role level of user (current user by default) in workspace, looked up once
+        in database then reused for the rest of the context lifetime.
+        """
+        user = user or self.current_user
+        key = (user.user_id, workspace.workspace_id)
+        if key not in self._user_roles_in_workspaces:
+            self._user_roles_in_workspaces[key] = workspace.get_user_role(user)
+        return self._user_roles_in_workspaces[key]
+
     def safe_current_user(self) -> typing.Optional[User]:
         """Current authenticated user or None.
 
@@ -275,6 +290,7 @@ def cleanup(self) -> None:
         self.plugin_manager.hook.on_context_finished(context=self)
         self._current_user = None
         self._current_workspace = None
+        self._user_roles_in_workspaces = {}
         if self.dbsession:
             self.dbsession.close()
 
@@ -46,11 +46,13 @@ def _initConfig(self, **settings):
                 "consider installing lxml from http://codespeak.net/lxml/."
             )
 
-        config["provider_mapping"] = {
-            app_config.WEBDAV__ROOT_PATH: TracimDavProvider(
-                manage_locks=app_config.WEBDAV_MANAGE_LOCK, app_config=app_config,
-            )
-        }
+        provider = TracimDavProvider(
+            manage_locks=app_config.WEBDAV_MANAGE_LOCK, app_config=app_config,
+        )
+        config["provider_mapping"] = {app_config.WEBDAV__ROOT_PATH: provider}
+        # INFO - use database lock storage of the provider, shared between processes,
+        # instead of the in-memory default one of wsgidav.
+        config["locksmanager"] = provider.lockManager.storage if provider.lockManager else False
         config["block_size"] = app_config.WEBDAV__BLOCK_SIZE
 
         config["domaincontroller"] = TracimDomainController(
@@ -14,6 +14,7 @@
 from tracim_backend.lib.core.content import ContentApi
 from tracim_backend.lib.core.user import UserApi
 from tracim_backend.lib.core.workspace import WorkspaceApi
+from tracim_backend.lib.utils.authorization import AuthorizationChecker
 from tracim_backend.lib.utils.request import TracimContext
 from tracim_backend.lib.utils.utils import normpath
 from tracim_backend.lib.utils.utils import webdav_convert_file_name_to_bdd
@@ -50,6 +51,8 @@ def __init__(self, path: str, current_user: User, session: TracimSession, app_co
 
         self.workspaces = []
         self.contents = []
+        # Authorization checkers already passed for this path, see webdav_check_right
+        self.granted_authorization_checkers = set()  # type: typing.Set[AuthorizationChecker]
         path_parts = self._path_splitter(self.path)
         # TODO - G.M - 2020-10-09 - Find a proper way to refactor this code to make easier to
         # understood. This code is a bit confusing because:
@@ -243,11 +246,11 @@ def __init__(
     ):
         super(TracimDavProvider, self).__init__()
 
-        if manage_locks:
-            self.lockManager = LockManager(LockStorage())
-
         self.app_config = app_config
 
+        if manage_locks:
+            self.lockManager = LockManager(LockStorage(app_config))
+
     #########################################################
     # Everything override from DAVProvider
     def getResourceInst(self, path: str, environ: dict) -> typing.Optional[_DAVResource]:
@@ -1,25 +1,33 @@
+from contextlib import contextmanager
+import os
 import time
+import typing
 
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
 from wsgidav import util
 from wsgidav.lock_manager import generateLockToken
 from wsgidav.lock_manager import lockString
 from wsgidav.lock_manager import normalizeLockRoot
 from wsgidav.lock_manager import validateLock
-from wsgidav.rw_lock import ReadWriteLock
 
-from tracim_backend.lib.webdav.model import Lock
-from tracim_backend.lib.webdav.model import Url2Token
+from tracim_backend.config import CFG
+from tracim_backend.models.setup_models import get_engine
+from tracim_backend.models.setup_models import get_session_factory
+from tracim_backend.models.webdav import Lock
+from tracim_backend.models.webdav import Url2Token
 
 _logger = util.getModuleLogger(__name__)
 
 
-def from_dict_to_base(lock):
+def from_dict_to_base(lock: dict) -> Lock:
     return Lock(
         token=lock["token"],
         depth=lock["depth"],
         root=lock["root"],
         type=lock["type"],
-        scopre=lock["scope"],
+        scope=lock["scope"],
         owner=lock["owner"],
         timeout=lock["timeout"],
         principal=lock["principal"],
@@ -27,7 +35,7 @@ def from_dict_to_base(lock):
     )
 
 
-def from_base_to_dict(lock):
+def from_base_to_dict(lock: Lock) -> dict:
     return {
         "token": lock.token,
         "depth": lock.depth,
@@ -42,25 +50,53 @@ def from_base_to_dict(lock):
 
 
 class LockStorage(object):
+    """
+    WsgiDAV lock storage backed by the database: locks are shared between
+    all WebDAV processes.
+
+    Every operation uses its own short transaction, path lookups (including
+    children ones) are done with indexed queries and expired locks are purged
+    by batches (see cleanup()).
+    """
+
     LOCK_TIME_OUT_DEFAULT = 604800  # 1 week, in seconds
     LOCK_TIME_OUT_MAX = 4 * 604800  # 1 month, in seconds
+    CLEANUP_INTERVAL = 3600  # in seconds
+    CLEANUP_BATCH_SIZE = 500
 
-    def __init__(self):
-        self._session = None  # todo Session()
-        self._lock = ReadWriteLock()
+    def __init__(self, app_config: CFG) -> None:
+        self.app_config = app_config
+        self._session_factory = None  # type: typing.Optional[sessionmaker]
+        self._session_factory_pid = None  # type: typing.Optional[int]
+        self._last_cleanup = 0.0
 
     def __repr__(self):
-        return "C'est bien mon verrou..."
-
-    def __del__(self):
-        pass
-
-    def get_lock_db_from_token(self, token):
-        return self._session.query(Lock).filter(Lock.token == token).one_or_none()
+        return "LockStorage({})".format(self.app_config.SQLALCHEMY__URL)
+
+    @contextmanager
+    def _session(self) -> typing.Generator[Session, None, None]:
+        # INFO - engine is created lazily and again after a fork as
+        # database connections must not be shared between processes.
+        if self._session_factory is None or self._session_factory_pid != os.getpid():
+            self._session_factory = get_session_factory(
+                get_engine(self.app_config, pool_name="webdav")
+            )
+            self._session_factory_pid = os.getpid()
+        session = self._session_factory()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
 
-    def _flush(self):
-        """Overloaded by Shelve implementation."""
-        pass
+    def _delete_tokens(self, session: Session, tokens: typing.List[str]) -> int:
+        session.query(Url2Token).filter(Url2Token.token.in_(tokens)).delete(
+            synchronize_session=False
+        )
+        return session.query(Lock).filter(Lock.token.in_(tokens)).delete(synchronize_session=False)
 
     def open(self):
         """Called before first use.
@@ -73,16 +109,35 @@ def close(self):
         """Called on shutdown."""
         pass
 
-    def cleanup(self):
-        """Purge expired locks (optional)."""
-        pass
+    def cleanup(self) -> int:
+        """Purge expired locks by batches.
+
+        Returns the number of purged locks.
+        """
+        self._last_cleanup = time.time()
+        purged_count = 0
+        while True:
+            with self._session() as session:
+                tokens = [
+                    token
+                    for (token,) in session.query(Lock.token)
+                    .filter(Lock.expire >= 0, Lock.expire < self._last_cleanup)
+                    .limit(self.CLEANUP_BATCH_SIZE)
+                ]
+                if not tokens:
+                    break
+                purged_count += self._delete_tokens(session, tokens)
+        if purged_count:
+            _logger.debug("Purged {} expired locks".format(purged_count))
+        return purged_count
 
     def clear(self):
         """Delete all entries."""
-        self._session.query(Lock).all().delete(synchronize_session=False)
-        self._session.commit()
+        with self._session() as session:
+            session.query(Url2Token).delete(synchronize_session=False)
+            session.query(Lock).delete(synchronize_session=False)
 
-    def get(self, token):
+    def get(self, token: str) -> typing.Optional[dict]:
         """Return a lock dictionary for a token.
 
         If the lock does not exist or is expired, None is returned.
@@ -94,26 +149,25 @@ def get(self, token):
 
         Side effect: if lock is expired, it will be purged and None is returned.
         """
-        self._lock.acquireRead()
-        try:
-            lock_base = self._session.query(Lock).filter(Lock.token == token).one_or_none()
-            if lock_base is None:
+        with self._session() as session:
+            lock_db = session.query(Lock).filter(Lock.token == token).one_or_none()
+            if lock_db is None:
                 # Lock not found: purge dangling URL2TOKEN entries
                 _logger.debug("Lock purged dangling: %s" % token)
-                self.delete(token)
+                session.query(Url2Token).filter(Url2Token.token == token).delete(
+                    synchronize_session=False
+                )
                 return None
-            expire = float(lock_base.expire)
+            expire = float(lock_db.expire)
             if 0 <= expire < time.time():
                 _logger.debug(
-                    "Lock timed-out(%s): %s" % (expire, lockString(from_base_to_dict(lock_base)))
+                    "Lock timed-out(%s): %s" % (expire, lockString(from_base_to_dict(lock_db)))
                 )
-                self.delete(token)
+                self._delete_tokens(session, [token])
                 return None
-            return from_base_to_dict(lock_base)
-        finally:
-            self._lock.release()
+            return from_base_to_dict(lock_db)
 
-    def create(self, path, lock):
+    def create(self, path: str, lock: dict) -> dict:
         """Create a direct lock for a resource path.
 
         path:
@@ -129,52 +183,47 @@ def create(self, path, lock):
         - lock['timeout'] may be normalized and shorter than requested
         - lock['token'] is added
         """
-        self._lock.acquireWrite()
-        try:
-            # We expect only a lock definition, not an existing lock
-            assert lock.get("token") is None
-            assert lock.get("expire") is None, "Use timeout instead of expire"
-            assert path and "/" in path
+        # We expect only a lock definition, not an existing lock
+        assert lock.get("token") is None
+        assert lock.get("expire") is None, "Use timeout instead of expire"
+        assert path and "/" in path
 
-            # Normalize root: /foo/bar
-            org_path = path
-            path = normalizeLockRoot(path)
-            lock["root"] = path
+        if time.time() - self._last_cleanup > self.CLEANUP_INTERVAL:
+            self.cleanup()
 
-            # Normalize timeout from ttl to expire-date
-            timeout = float(lock.get("timeout"))
-            if timeout is None:
-                timeout = LockStorage.LOCK_TIME_OUT_DEFAULT
-            elif timeout < 0 or timeout > LockStorage.LOCK_TIME_OUT_MAX:
-                timeout = LockStorage.LOCK_TIME_OUT_MAX
-
-            lock["timeout"] = timeout
-            lock["expire"] = time.time() + timeout
+        # Normalize root: /foo/bar
+        org_path = path
+        path = normalizeLockRoot(path)
+        lock["root"] = path
 
-            validateLock(lock)
+        # Normalize timeout from ttl to expire-date
+        timeout = lock.get("timeout")
+        if timeout is None:
+            timeout = LockStorage.LOCK_TIME_OUT_DEFAULT
+        timeout = float(timeout)
+        if timeout < 0 or timeout > LockStorage.LOCK_TIME_OUT_MAX:
+            timeout = LockStorage.LOCK_TIME_OUT_MAX
 
-            token = generateLockToken()
-            lock["token"] = token
+        lock["timeout"] = timeout
+        lock["expire"] = time.time() + timeout
 
-            # Store lock
-            lock_db = from_dict_to_base(lock)
+        validateLock(lock)
 
-            self._session.add(lock_db)
+        token = generateLockToken()
+        lock["token"] = token
 
+        with self._session() as session:
+            # Store lock
+            session.add(from_dict_to_base(lock))
+            # flush lock before its path reference to respect foreign key
+            session.flush()
             # Store locked path reference
-            url2token = Url2Token(path=path, token=token)
+            session.add(Url2Token(path=path, token=token))
 
-            self._session.add(url2token)
-            self._session.commit()
+        _logger.debug("LockStorage.set(%r): %s" % (org_path, lockString(lock)))
+        return lock
 
-            self._flush()
-            _logger.debug("LockStorageDict.set(%r): %s" % (org_path, lockString(lock)))
-            #            print("LockStorageDict.set(%r): %s" % (org_path, lockString(lock)))
-            return lock
-        finally:
-            self._lock.release()
-
-    def refresh(self, token, timeout):
+    def refresh(self, token: str, timeout: float) -> dict:
         """Modify an existing lock's timeout.
 
         token:
@@ -186,52 +235,30 @@ def refresh(self, token, timeout):
             Lock dictionary.
             Raises ValueError, if token is invalid.
         """
-        lock_db = self._session.query(Lock).filter(Lock.token == token).one_or_none()
-        assert lock_db is not None, "Lock must exist"
         assert timeout == -1 or timeout > 0
         if timeout < 0 or timeout > LockStorage.LOCK_TIME_OUT_MAX:
             timeout = LockStorage.LOCK_TIME_OUT_MAX
 
-        self._lock.acquireWrite()
-        try:
-            # Note: shelve dictionary returns copies, so we must reassign values:
+        with self._session() as session:
+            lock_db = session.query(Lock).filter(Lock.token == token).one_or_none()
+            assert lock_db is not None, "Lock must exist"
             lock_db.timeout = timeout
             lock_db.expire = time.time() + timeout
-            self._session.commit()
-            self._flush()
-        finally:
-            self._lock.release()
-        return from_base_to_dict(lock_db)
+            return from_base_to_dict(lock_db)
 
-    def delete(self, token):
+    def delete(self, token: str) -> bool:
         """Delete lock.
 
         Returns True on success. False, if token does not exist, or is expired.
         """
-        self._lock.acquireWrite()
-        try:
-            lock_db = self._session.query(Lock).filter(Lock.token == token).one_or_none()
-            _logger.debug("delete %s" % lockString(from_base_to_dict(lock_db)))
-            if lock_db is None:
-                return False
-            # Remove url to lock mapping
-            url2token = (
-                self._session.query(Url2Token)
-                .filter(Url2Token.path == lock_db.root, Url2Token.token == token)
-                .one_or_none()
-            )
-            if url2token is not None:
-                self._session.delete(url2token)
-            # Remove the lock
-            self._session.delete(lock_db)
-            self._session.commit()
-
-            self._flush()
-        finally:
-            self._lock.release()
-        return True
-
-    def getLockList(self, path, includeRoot, includeChildren, tokenOnly):
+        with self._session() as session:
+            deleted_count = self._delete_tokens(session, [token])
+        _logger.debug("delete %s" % token)
+        return deleted_count > 0
+
+    def getLockList(
+        self, path: str, includeRoot: bool, includeChildren: bool, tokenOnly: bool
+    ) -> typing.List[typing.Union[str, dict]]:
         """Return a list of direct locks for <path>.
 
         Expired locks are *not* returned (but may be purged).
@@ -252,32 +279,20 @@ def getLockList(self, path, includeRoot, includeChildren, tokenOnly):
         assert path and path.startswith("/")
         assert includeRoot or includeChildren
 
-        def __appendLocks(toklist):
-            # Since we can do this quickly, we use self.get() even if
-            # tokenOnly is set, so expired locks are purged.
-            for token in toklist:
-                lock_db = self.get_lock_db_from_token(token)
-                if lock_db:
-                    if tokenOnly:
-                        lockList.append(lock_db.token)
-                    else:
-                        lockList.append(from_base_to_dict(lock_db))
-
         path = normalizeLockRoot(path)
-        self._lock.acquireRead()
-        try:
-            tokList = self._session.query(Url2Token.token).filter(Url2Token.path == path).all()
-            lockList = []
-            if includeRoot:
-                __appendLocks(tokList)
-
-            if includeChildren:
-                for (url,) in self._session.query(Url2Token.path).group_by(Url2Token.path):
-                    if util.isChildUri(path, url):
-                        __appendLocks(
-                            self._session.query(Url2Token.token).filter(Url2Token.path == url)
-                        )
-
-            return lockList
-        finally:
-            self._lock.release()
+        path_filters = []
+        if includeRoot:
+            path_filters.append(Url2Token.path == path)
+        if includeChildren:
+            path_filters.append(Url2Token.path.startswith(path.rstrip("/") + "/", autoescape=True))
+
+        with self._session() as session:
+            query = (
+                session.query(Lock.token if tokenOnly else Lock)
+                .join(Url2Token, Url2Token.token == Lock.token)
+                .filter(or_(*path_filters))
+                .filter(or_(Lock.expire < 0, Lock.expire >= time.time()))
+            )
+            if tokenOnly:
+                return [token for (token,) in query]
+            return [from_base_to_dict(lock_db) for lock_db in query]
@@ -260,7 +260,7 @@ def __init__(self, application, config):
         self.app_config = CFG(self.settings)
         self.app_config.configure_filedepot()
         self.plugin_manager = init_plugin_manager(self.app_config)
-        self.engine = get_engine(self.app_config)
+        self.engine = get_engine(self.app_config, pool_name="webdav")
         self.session_factory = get_session_factory(self.engine)
 
     def __call__(self, environ, start_response):
@@ -47,6 +47,7 @@
 from tracim_backend.models.data import ContentNamespaces
 from tracim_backend.models.data import Workspace
 from tracim_backend.models.revision_protection import new_revision
+from tracim_backend.models.types import get_uploaded_file_content_length
 
 logger = logging.getLogger()
 
@@ -59,10 +60,18 @@ def webdav_check_right(authorization_checker: AuthorizationChecker):
     def decorator(func: typing.Callable) -> typing.Callable:
         @functools.wraps(func)
         def wrapper(self: "_DAVResource", *arg, **kwarg) -> typing.Callable:
+            # Checkers only depend on the processed path of the context, so a checker which
+            # already passed for this path does not need to be evaluated again. This avoid
+            # re-checking rights for each property of each member of a collection listing
+            # (PROPFIND with depth 1).
+            processed_path = self.tracim_context.processed_path
+            if authorization_checker in processed_path.granted_authorization_checkers:
+                return func(self, *arg, **kwarg)
             try:
                 authorization_checker.check(tracim_context=self.tracim_context)
             except TracimException as exc:
                 raise DAVError(HTTP_FORBIDDEN, contextinfo=str(exc)) from exc
+            processed_path.granted_authorization_checkers.add(authorization_checker)
             return func(self, *arg, **kwarg)
 
         return wrapper
@@ -88,9 +97,12 @@ def get_content_resource(
     environ: typing.Dict,
     workspace: Workspace,
     tracim_context: "WebdavTracimContext",
+    content_api: typing.Optional[ContentApi] = None,
 ) -> _DAVResource:
     """
     Helper to get the correct content WebDAV resource according to the content type
+    :param content_api: ContentApi to use for resource, if not given, resource will create
+    its own one. This is useful to share the same api between all members of a collection.
     """
     if content.type == content_type_list.Folder.slug:
         return FolderResource(
@@ -99,14 +111,23 @@ def get_content_resource(
             workspace=workspace,
             content=content,
             tracim_context=tracim_context,
+            content_api=content_api,
         )
     elif content.type == content_type_list.File.slug:
         return FileResource(
-            path=path, environ=environ, content=content, tracim_context=tracim_context,
+            path=path,
+            environ=environ,
+            content=content,
+            tracim_context=tracim_context,
+            content_api=content_api,
         )
     else:
         return OtherFileResource(
-            path=path, environ=environ, content=content, tracim_context=tracim_context
+            path=path,
+            environ=environ,
+            content=content,
+            tracim_context=tracim_context,
+            content_api=content_api,
         )
 
 
@@ -185,7 +206,7 @@ def __init__(
     def _get_members(
         self, already_existing_names: typing.Optional[typing.List[str]] = None
     ) -> typing.List[Workspace]:
-        members_names = already_existing_names or []  # type: List[str]
+        members_names = set(already_existing_names or [])  # type: typing.Set[str]
         members = []
         workspace_id = self.workspace.workspace_id if self.workspace else 0  # type: int
         workspace_children = list(self.workspace_api.get_all_children([workspace_id]))
@@ -200,7 +221,7 @@ def _get_members(
                 # much trouble: only one workspace is accessible without any issue.
                 continue
             else:
-                members_names.append(workspace_label)
+                members_names.add(workspace_label)
                 members.append(workspace)
         return members
 
@@ -274,6 +295,7 @@ def __init__(
         provider: "TracimDavProvider",
         workspace: Workspace,
         tracim_context: "WebdavTracimContext",
+        content_api: typing.Optional[ContentApi] = None,
     ) -> None:
         """
         Some rules:
@@ -292,7 +314,7 @@ def __init__(
         self.session = tracim_context.dbsession
         self.label = label
         self.provider = provider
-        self.content_api = ContentApi(
+        self.content_api = content_api or ContentApi(
             current_user=self.user,
             session=tracim_context.dbsession,
             config=tracim_context.app_config,
@@ -304,7 +326,7 @@ def __init__(
     def _get_members(
         self, already_existing_names: typing.Optional[typing.List[str]] = None
     ) -> typing.List[Content]:
-        members_names = []
+        members_names = set()  # type: typing.Set[str]
         members = []
         if self.content:
             parent_id = self.content.content_id
@@ -325,7 +347,7 @@ def _get_members(
             if child.file_name in members_names:
                 continue
             else:
-                members_names.append(child.file_name)
+                members_names.add(child.file_name)
                 members.append(child)
         return members
 
@@ -342,6 +364,7 @@ def _generate_child_content_resource(
             workspace=self.workspace,
             content=child_content,
             tracim_context=self.tracim_context,
+            content_api=self.content_api,
         )
 
     # Container methods
@@ -356,7 +379,9 @@ def createEmptyResource(self, file_name: str):
         if resource:
             content = resource.content
         try:
-            self.content_api.check_upload_size(int(self.environ["CONTENT_LENGTH"]), self.workspace)
+            self.content_api.check_upload_size(
+                int(self.environ.get("CONTENT_LENGTH") or 0), self.workspace
+            )
         except (
             FileSizeOverMaxLimitation,
             FileSizeOverWorkspaceEmptySpace,
@@ -426,7 +451,10 @@ def getMember(self, label: str) -> _DAVResource:
 
     def getMemberList(self) -> [_DAVResource]:
         """
-        Access to the list of content of current workspace/folder
+        Access to the list of content of current workspace/folder.
+        All members are loaded at once with their current revision, and share
+        the same content api, so their properties can be served without
+        any further query.
         """
         members = []
         for content in self._get_members():
@@ -668,8 +696,17 @@ def __init__(
         workspace: Workspace,
         content: Content,
         tracim_context: "WebdavTracimContext",
+        content_api: typing.Optional[ContentApi] = None,
     ):
         DAVCollection.__init__(self, path, environ)
+        self.tracim_context = tracim_context
+        self.content_api = content_api or ContentApi(
+            current_user=tracim_context.current_user,
+            session=tracim_context.dbsession,
+            config=tracim_context.app_config,
+            show_temporary=True,
+            namespaces_filter=[ContentNamespaces.CONTENT],
+        )
         self.content_container = ContentOnlyContainer(
             path,
             environ,
@@ -678,14 +715,7 @@ def __init__(
             label=workspace.filemanager_filename,
             workspace=workspace,
             tracim_context=tracim_context,
-        )
-        self.tracim_context = tracim_context
-        self.content_api = ContentApi(
-            current_user=tracim_context.current_user,
-            session=tracim_context.dbsession,
-            config=tracim_context.app_config,
-            show_temporary=True,
-            namespaces_filter=[ContentNamespaces.CONTENT],
+            content_api=self.content_api,
         )
         self.content = content
         self.session = tracim_context.dbsession
@@ -819,14 +849,19 @@ class FileResource(DAVNonCollection):
     """
 
     def __init__(
-        self, path: str, environ: dict, content: Content, tracim_context: "WebdavTracimContext"
+        self,
+        path: str,
+        environ: dict,
+        content: Content,
+        tracim_context: "WebdavTracimContext",
+        content_api: typing.Optional[ContentApi] = None,
     ) -> None:
         super(FileResource, self).__init__(path, environ)
         self.tracim_context = tracim_context
         self.content = content
         self.user = tracim_context.current_user
         self.session = tracim_context.dbsession
-        self.content_api = ContentApi(
+        self.content_api = content_api or ContentApi(
             current_user=self.user,
             config=tracim_context.app_config,
             session=self.session,
@@ -842,7 +877,7 @@ def __repr__(self) -> str:
 
     @webdav_check_right(is_reader)
     def getContentLength(self) -> int:
-        return self.content.depot_file.file.content_length
+        return get_uploaded_file_content_length(self.content.depot_file)
 
     @webdav_check_right(is_reader)
     def getContentType(self) -> str:
@@ -871,7 +906,7 @@ def getContent(self) -> typing.BinaryIO:
     def beginWrite(self, contentType: str = None) -> FakeFileStream:
         try:
             self.content_api.check_upload_size(
-                int(self.environ["CONTENT_LENGTH"]), self.content.workspace
+                int(self.environ.get("CONTENT_LENGTH") or 0), self.content.workspace
             )
         except (
             FileSizeOverMaxLimitation,
@@ -1060,10 +1095,15 @@ class OtherFileResource(FileResource):
     """
 
     def __init__(
-        self, path: str, environ: dict, content: Content, tracim_context: "WebdavTracimContext"
+        self,
+        path: str,
+        environ: dict,
+        content: Content,
+        tracim_context: "WebdavTracimContext",
+        content_api: typing.Optional[ContentApi] = None,
     ):
         super(OtherFileResource, self).__init__(
-            path, environ, content, tracim_context=tracim_context
+            path, environ, content, tracim_context=tracim_context, content_api=content_api
         )
         self.content_revision = self.content.revision
         self.content_designed = self.design()
@@ -1,15 +1,19 @@
 # -*- coding: utf-8 -*-
-import tempfile
+import typing
 
+from depot.fields.upload import UploadedFile
 from sqlalchemy.orm import Session
 import transaction
 from wsgidav import util
 from wsgidav.dav_error import HTTP_FORBIDDEN
+from wsgidav.dav_error import HTTP_REQUEST_ENTITY_TOO_LARGE
 from wsgidav.dav_error import DAVError
 
 from tracim_backend.app_models.contents import content_type_list
+from tracim_backend.exceptions import FileSizeOverMaxLimitation
 from tracim_backend.exceptions import TracimException
 from tracim_backend.lib.core.content import ContentApi
+from tracim_backend.lib.core.storage import DepotFileWriter
 from tracim_backend.models.data import ActionDescription
 from tracim_backend.models.data import Content
 from tracim_backend.models.data import Workspace
@@ -42,6 +46,9 @@ class FakeFileStream(object):
     In the first case scenario, the transfer takes two part : it first create the resource (createEmptyResource)
     then add its content (beginWrite, write, close..). If we went without this class, we would create two revision
     of the file upon creating a new file, which is not what we want.
+
+    Written content is streamed to depot as it is received (see DepotFileWriter),
+    the new content or revision is then created from the already stored file.
     """
 
     def __init__(
@@ -63,19 +70,24 @@ def __init__(
         :param content:
         :param parent:
         """
-        # TODO - G.M - 2019-06-13 - use true streaming mechanism,
-        # instead of a true streaming mechanism we use
-        # a temporary file to avoid big file in memory without needing to refactor all
-        # upload mechanism of WebDAV
-        # see https://github.com/tracim/tracim/issues/1911
-        self.temp_file = tempfile.NamedTemporaryFile(suffix="tracim_webdav_upload_")
         self._session = session
-        self._file_name = file_name if file_name != "" else self._content.file_name
         self._content = content
+        self._file_name = file_name if file_name != "" else self._content.file_name
         self._api = content_api
         self._workspace = workspace
         self._parent = parent
         self._path = path
+        self._depot_file_writer = None  # type: typing.Optional[DepotFileWriter]
+
+    @property
+    def depot_file_writer(self) -> DepotFileWriter:
+        if not self._depot_file_writer:
+            if self._content is None:
+                mimetype = util.guessMimeType(self._file_name)
+            else:
+                mimetype = util.guessMimeType(self._content.file_name)
+            self._depot_file_writer = self._api.get_depot_file_writer(self._file_name, mimetype)
+        return self._depot_file_writer
 
     def getRefUrl(self) -> str:
         """
@@ -99,29 +111,36 @@ def endWrite(self, withErrors: bool):
         """
         pass
 
-    def write(self, s: str):
+    def write(self, s: bytes):
         """
-        Called by request_server when writing content to files, we put it inside a filestream
+        Called by request_server when writing content to files, we stream it to depot
         """
-        self.temp_file.write(s)
+        # INFO - content length may be unknown (chunked transfer), so max file size
+        # is checked on received data too.
+        try:
+            self._api.check_size_length_limitation(self.depot_file_writer.content_length + len(s))
+        except FileSizeOverMaxLimitation as exc:
+            self.depot_file_writer.abort()
+            raise DAVError(HTTP_REQUEST_ENTITY_TOO_LARGE, contextinfo=str(exc)) from exc
+        self.depot_file_writer.write(s)
 
     def close(self):
         """
         Called by request_server when the file content has been written. We either add a new content or create
         a new revision
         """
+        uploaded_file = self.depot_file_writer.close()
+        try:
+            if self._content is None:
+                self.create_file(uploaded_file)
+            else:
+                self.update_file(uploaded_file)
+            transaction.commit()
+        except Exception:
+            self.depot_file_writer.abort()
+            raise
 
-        self.temp_file.seek(0)
-
-        if self._content is None:
-            self.create_file()
-        else:
-            self.update_file()
-
-        transaction.commit()
-        self.temp_file.close()
-
-    def create_file(self):
+    def create_file(self, uploaded_file: UploadedFile):
         """
         Called when this is a new file; will create a new Content initialized with the correct content
         """
@@ -138,13 +157,13 @@ def create_file(self):
                     do_save=False,
                 )
                 self._api.update_file_data(
-                    file, self._file_name, util.guessMimeType(self._file_name), self.temp_file
+                    file, self._file_name, util.guessMimeType(self._file_name), uploaded_file
                 )
         except TracimException as exc:
             raise DAVError(HTTP_FORBIDDEN) from exc
         self._api.save(file, ActionDescription.CREATION)
 
-    def update_file(self):
+    def update_file(self, uploaded_file: UploadedFile):
         """
         Called when we're updating an existing content; we create a new revision and update the file content
         """
@@ -154,7 +173,7 @@ def update_file(self):
                     self._content,
                     self._file_name,
                     util.guessMimeType(self._content.file_name),
-                    self.temp_file,
+                    uploaded_file,
                 )
         except TracimException as exc:
             raise DAVError(HTTP_FORBIDDEN) from exc
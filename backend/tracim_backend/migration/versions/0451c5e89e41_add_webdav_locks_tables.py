@@ -0,0 +1,52 @@
+"""add webdav locks tables
+
+Revision ID: 0451c5e89e41
+Revises: 8382e5a19f0d
+Create Date: 2026-10-19 10:12:41.201846
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0451c5e89e41"
+down_revision = "8382e5a19f0d"
+
+
+def upgrade():
+    op.create_table(
+        "webdav_locks",
+        sa.Column("token", sa.Unicode(length=255), nullable=False),
+        sa.Column("depth", sa.Unicode(length=32), nullable=False),
+        sa.Column("root", sa.UnicodeText(), nullable=False),
+        sa.Column("type", sa.Unicode(length=32), nullable=False),
+        sa.Column("scope", sa.Unicode(length=32), nullable=False),
+        sa.Column("owner", sa.LargeBinary(), nullable=False),
+        sa.Column("expire", sa.Float(), nullable=False),
+        sa.Column("principal", sa.Unicode(length=255), nullable=False),
+        sa.Column("timeout", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("token", name=op.f("pk_webdav_locks")),
+    )
+    op.create_index("idx__webdav_locks__expire", "webdav_locks", ["expire"], unique=False)
+    op.create_table(
+        "webdav_url2token",
+        sa.Column("token", sa.Unicode(length=255), nullable=False),
+        sa.Column("path", sa.UnicodeText(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["token"],
+            ["webdav_locks.token"],
+            name=op.f("fk_webdav_url2token_token_webdav_locks"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("token", name=op.f("pk_webdav_url2token")),
+    )
+    op.create_index(
+        "idx__webdav_url2token__path", "webdav_url2token", ["path"], unique=False, mysql_length=255,
+    )
+
+
+def downgrade():
+    op.drop_index("idx__webdav_url2token__path", table_name="webdav_url2token")
+    op.drop_table("webdav_url2token")
+    op.drop_index("idx__webdav_locks__expire", table_name="webdav_locks")
+    op.drop_table("webdav_locks")
@@ -0,0 +1,44 @@
+"""add indexes for shares and upload permissions
+
+Revision ID: 5b2e9f8c3a71
+Revises: d7a4c1e5b9f2
+Create Date: 2026-10-19 14:41:05.118943
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b2e9f8c3a71"
+down_revision = "d7a4c1e5b9f2"
+
+
+def upgrade():
+    op.create_index(
+        "idx__content_shares__share_token", "content_shares", ["share_token"], unique=True
+    )
+    op.create_index(
+        "idx__content_shares__content_id__enabled",
+        "content_shares",
+        ["content_id", "enabled"],
+        unique=False,
+    )
+    op.create_index("idx__content_shares__disabled", "content_shares", ["disabled"], unique=False)
+    op.create_index("idx__upload_permissions__token", "upload_permissions", ["token"], unique=True)
+    op.create_index(
+        "idx__upload_permissions__workspace_id__enabled",
+        "upload_permissions",
+        ["workspace_id", "enabled"],
+        unique=False,
+    )
+    op.create_index(
+        "idx__upload_permissions__disabled", "upload_permissions", ["disabled"], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index("idx__upload_permissions__disabled", table_name="upload_permissions")
+    op.drop_index("idx__upload_permissions__workspace_id__enabled", table_name="upload_permissions")
+    op.drop_index("idx__upload_permissions__token", table_name="upload_permissions")
+    op.drop_index("idx__content_shares__disabled", table_name="content_shares")
+    op.drop_index("idx__content_shares__content_id__enabled", table_name="content_shares")
+    op.drop_index("idx__content_shares__share_token", table_name="content_shares")
@@ -0,0 +1,73 @@
+"""add user stats table
+
+Revision ID: 8e4d2b6f1c93
+Revises: 5b2e9f8c3a71
+Create Date: 2026-10-19 15:02:17.482913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "8e4d2b6f1c93"
+down_revision = "5b2e9f8c3a71"
+
+
+def upgrade():
+    op.create_table(
+        "user_stats",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("followers_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("leaders_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "authored_content_revisions_count", sa.Integer(), server_default="0", nullable=False
+        ),
+        sa.Column(
+            "authored_content_revisions_space_count",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.user_id"],
+            name=op.f("fk_user_stats_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("user_id", name=op.f("pk_user_stats")),
+    )
+    op.create_index(
+        "idx__content_revisions__owner_id__workspace_id",
+        "content_revisions",
+        ["owner_id", "workspace_id"],
+        unique=False,
+    )
+    op.execute(
+        """
+        INSERT INTO user_stats (
+            user_id,
+            followers_count,
+            leaders_count,
+            authored_content_revisions_count,
+            authored_content_revisions_space_count
+        )
+        SELECT
+            users.user_id,
+            (SELECT COUNT(*) FROM user_followers WHERE user_followers.leader_id = users.user_id),
+            (SELECT COUNT(*) FROM user_followers WHERE user_followers.follower_id = users.user_id),
+            (
+                SELECT COUNT(*) FROM content_revisions
+                WHERE content_revisions.owner_id = users.user_id
+            ),
+            (
+                SELECT COUNT(DISTINCT content_revisions.workspace_id) FROM content_revisions
+                WHERE content_revisions.owner_id = users.user_id
+            )
+        FROM users
+        """
+    )
+
+
+def downgrade():
+    op.drop_index("idx__content_revisions__owner_id__workspace_id", table_name="content_revisions")
+    op.drop_table("user_stats")
@@ -0,0 +1,20 @@
+"""add users connection_status index
+
+Revision ID: a6d3e8f1b2c4
+Revises: c3f7a9d2e4b6
+Create Date: 2026-10-19 17:05:12.318466
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a6d3e8f1b2c4"
+down_revision = "c3f7a9d2e4b6"
+
+
+def upgrade():
+    op.create_index("idx__users__connection_status", "users", ["connection_status"], unique=False)
+
+
+def downgrade():
+    op.drop_index("idx__users__connection_status", table_name="users")
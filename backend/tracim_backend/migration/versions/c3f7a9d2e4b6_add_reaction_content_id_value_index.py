@@ -0,0 +1,22 @@
+"""add reaction content_id value index
+
+Revision ID: c3f7a9d2e4b6
+Revises: 8e4d2b6f1c93
+Create Date: 2026-10-19 16:20:43.905127
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c3f7a9d2e4b6"
+down_revision = "8e4d2b6f1c93"
+
+
+def upgrade():
+    op.create_index(
+        "idx__reaction__content_id__value", "reaction", ["content_id", "value"], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index("idx__reaction__content_id__value", table_name="reaction")
@@ -0,0 +1,25 @@
+"""add user_workspace workspace_id role index
+
+Revision ID: d4b8e2f6a1c3
+Revises: a6d3e8f1b2c4
+Create Date: 2026-10-19 19:42:37.904512
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d4b8e2f6a1c3"
+down_revision = "a6d3e8f1b2c4"
+
+
+def upgrade():
+    op.create_index(
+        "idx__user_workspace__workspace_id__role",
+        "user_workspace",
+        ["workspace_id", "role"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("idx__user_workspace__workspace_id__role", table_name="user_workspace")
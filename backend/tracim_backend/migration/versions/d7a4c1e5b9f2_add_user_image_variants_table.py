@@ -0,0 +1,38 @@
+"""add user image variants table
+
+Revision ID: d7a4c1e5b9f2
+Revises: 0451c5e89e41
+Create Date: 2026-10-19 14:02:17.540318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "d7a4c1e5b9f2"
+down_revision = "0451c5e89e41"
+
+
+def upgrade():
+    op.create_table(
+        "user_image_variants",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("image_type", sa.Enum("AVATAR", "COVER", name="userimagetype"), nullable=False),
+        sa.Column("width", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("height", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("file", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.user_id"],
+            name=op.f("fk_user_image_variants_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "user_id", "image_type", "width", "height", name=op.f("pk_user_image_variants")
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table("user_image_variants")
+    sa.Enum(name="userimagetype").drop(op.get_bind(), checkfirst=True)
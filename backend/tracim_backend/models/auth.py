@@ -20,6 +20,7 @@
 from sqlalchemy import CheckConstraint
 from sqlalchemy import Column
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Sequence
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import backref
@@ -61,6 +62,11 @@ class UserCreationType(str, enum.Enum):
     CLI = "cli"
 
 
+class UserImageType(enum.Enum):
+    AVATAR = "avatar"
+    COVER = "cover"
+
+
 class AuthType(enum.Enum):
     INTERNAL = "internal"
     LDAP = "ldap"
@@ -386,3 +392,26 @@ def _validate_date(cls, date: datetime, validity_seconds: int) -> bool:
         if difference > validity_seconds:
             return False
         return True
+
+
+# INFO - online users are a small part of all users: checking the maximum online users
+# limitation uses this index
+Index("idx__users__connection_status", User.connection_status)
+
+
+class UserImageVariant(DeclarativeBase):
+    """
+    Pre-rendered jpeg version of a user avatar or cover at a given size.
+    """
+
+    __tablename__ = "user_image_variants"
+
+    user_id = Column(
+        Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False, primary_key=True
+    )
+    image_type = Column(Enum(UserImageType), nullable=False, primary_key=True)
+    width = Column(Integer, nullable=False, primary_key=True, autoincrement=False)
+    height = Column(Integer, nullable=False, primary_key=True, autoincrement=False)
+    file = Column(TracimUploadedFileField, nullable=False)
+
+    user = relationship("User", backref=backref("image_variants", cascade="all, delete-orphan"))
@@ -42,6 +42,7 @@
 from tracim_backend.models.event import ReadStatus
 from tracim_backend.models.favorites import FavoriteContent
 from tracim_backend.models.roles import WorkspaceRoles
+from tracim_backend.models.types import get_uploaded_file_content_length
 
 
 class AboutModel(object):
@@ -660,6 +661,30 @@ def __init__(
         self.user_id = user_id
 
 
+class WorkspaceMembersBulkUpdate(object):
+    """
+    Workspace members to add or update and members to remove in one request
+    """
+
+    def __init__(
+        self, members: List[WorkspaceMemberInvitation] = None, removed_user_ids: List[int] = None,
+    ) -> None:
+        self.members = members or []
+        self.removed_user_ids = removed_user_ids or []
+
+
+class WorkspaceMembersBulkUpdateResult(object):
+    """
+    Added or updated workspace members and removed members of a bulk update
+    """
+
+    def __init__(
+        self, members: List["UserRoleWorkspaceInContext"], removed_user_ids: List[int]
+    ) -> None:
+        self.members = members
+        self.removed_user_ids = removed_user_ids
+
+
 class WorkspaceUpdate(object):
     """
     Update workspace
@@ -750,6 +775,16 @@ def __init__(self, value: str) -> None:
         self.value = value
 
 
+class ContentsTagsCreation(object):
+    """
+    bulk content tags creation model
+    """
+
+    def __init__(self, content_ids: List[int], tag_ids: List[int]) -> None:
+        self.content_ids = content_ids
+        self.tag_ids = tag_ids
+
+
 class TagCreation(object):
     """
     tag creation model
@@ -986,10 +1021,21 @@ class WorkspaceInContext(object):
     Interface to get Workspace data and Workspace data related to context.
     """
 
-    def __init__(self, workspace: Workspace, dbsession: Session, config: CFG) -> None:
+    def __init__(
+        self,
+        workspace: Workspace,
+        dbsession: Session,
+        config: CFG,
+        number_of_members: Optional[int] = None,
+    ) -> None:
+        """
+        :param number_of_members: already computed number of members, see
+        WorkspaceApi.get_workspaces_with_context()
+        """
         self.workspace = workspace
         self.dbsession = dbsession
         self.config = config
+        self._number_of_members = number_of_members
 
     @property
     def workspace_in_context(self) -> "WorkspaceInContext":
@@ -1118,6 +1164,8 @@ def publication_enabled(self) -> bool:
 
     @property
     def number_of_members(self) -> int:
+        if self._number_of_members is not None:
+            return self._number_of_members
         return (
             self.dbsession.query(UserRoleInWorkspace)
             .filter(UserRoleInWorkspace.workspace_id == self.workspace.workspace_id)
@@ -1499,7 +1547,7 @@ def size(self) -> Optional[int]:
         if not self.content.depot_file:
             return len(self.raw_content)
         try:
-            return self.content.depot_file.file.content_length
+            return get_uploaded_file_content_length(self.content.depot_file)
         except IOError:
             logger.warning(
                 self, "IO Exception Occured when trying to get content size", exc_info=True
@@ -1791,7 +1839,7 @@ def size(self) -> Optional[int]:
         if not self.revision.depot_file:
             return None
         try:
-            return self.revision.depot_file.file.content_length
+            return get_uploaded_file_content_length(self.revision.depot_file)
         except IOError:
             logger.warning(
                 self, "IO Exception Occured when trying to get content size", exc_info=True
@@ -1892,6 +1940,18 @@ def __init__(self, items: List[T]) -> None:
         self.items = items
 
 
+class ReactionSummary(object):
+    """
+    Reactions of a content with a given value, aggregated
+    """
+
+    def __init__(self, content_id: int, value: str, count: int, user_reacted: bool) -> None:
+        self.content_id = content_id
+        self.value = value
+        self.count = count
+        self.user_reacted = user_reacted
+
+
 class UserMessagesSummary(object):
     def __init__(self, user: UserInContext, read_messages_count: int, unread_messages_count: int):
         self.read_messages_count = read_messages_count
@@ -57,6 +57,7 @@
 from tracim_backend.models.mixins import TrashableMixin
 from tracim_backend.models.mixins import UpdateDateMixin
 from tracim_backend.models.roles import WorkspaceRoles
+from tracim_backend.models.tracim_session import TracimSession
 from tracim_backend.models.types import TracimUploadedFileField
 from tracim_backend.models.utils import get_sort_expression
 
@@ -216,10 +217,30 @@ def get_size(self, include_deleted: bool = False, include_archived: bool = False
         return size
 
     def get_user_role(self, user: User) -> int:
-        for role in user.roles:
-            if role.workspace.workspace_id == self.workspace_id:
-                return role.role
-        return WorkspaceRoles.NOT_APPLICABLE.level
+        """
+        Get role level of user in this workspace with a lookup on user_workspace
+        primary key instead of loading all user roles (and their workspaces).
+        """
+        session = object_session(self)
+        if session is None:
+            for role in user.roles:
+                if role.workspace.workspace_id == self.workspace_id:
+                    return role.role
+            return WorkspaceRoles.NOT_APPLICABLE.level
+        role_query = (
+            session.query(UserRoleInWorkspace.role)
+            .filter(UserRoleInWorkspace.user_id == user.user_id)
+            .filter(UserRoleInWorkspace.workspace_id == self.workspace_id)
+        )
+        if isinstance(session, TracimSession):
+            role = session.get_cached_result(
+                ("user_role", user.user_id, self.workspace_id), role_query.scalar
+            )
+        else:
+            role = role_query.scalar()
+        if role is None:
+            return WorkspaceRoles.NOT_APPLICABLE.level
+        return role
 
     def get_label(self):
         """ this method is for interoperability with Content class"""
@@ -303,6 +324,13 @@ def get_all_role_slug(cls) -> List[str]:
         return [role.slug for role in WorkspaceRoles.get_all_valid_role()]
 
 
+Index(
+    "idx__user_workspace__workspace_id__role",
+    UserRoleInWorkspace.workspace_id,
+    UserRoleInWorkspace.role,
+)
+
+
 class WorkspaceSubscriptionState(enum.Enum):
     """Workspace subscription state Types"""
 
@@ -707,6 +735,11 @@ def has_new_information_for(self, user: User) -> bool:
 
 # TODO - G.M - 2018-06-177 - [author] Owner should be renamed "author"
 Index("idx__content_revisions__owner_id", ContentRevisionRO.owner_id)
+Index(
+    "idx__content_revisions__owner_id__workspace_id",
+    ContentRevisionRO.owner_id,
+    ContentRevisionRO.workspace_id,
+)
 Index("idx__content_revisions__parent_id", ContentRevisionRO.parent_id)
 # INFO - G.M - 2020-04-02 - Theses index may have different name in mysql
 # this is due to the fact, we do not remove automatically created index by mysql
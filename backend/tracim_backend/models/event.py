@@ -130,11 +130,15 @@ class Event(CreationDateMixin, DeclarativeBase):
     WORKSPACE_FIELD = "workspace"
     CONTENT_FIELD = "content"
     MEMBER_FIELD = "member"
+    MEMBERS_FIELD = "members"
     SUBSCRIPTION_FIELD = "subscription"
     REACTION_FIELD = "reaction"
     TAG_FIELD = "tag"
     USER_CALL_FIELD = "user_call"
 
+    # INFO - subtype of the single workspace_member event emitted for roles modified in bulk
+    WORKSPACE_MEMBERS_BULK_SUBTYPE = "bulk"
+
     _ENTITY_SUBTYPE_LENGTH = 100
     __tablename__ = "events"
 
@@ -152,6 +156,7 @@ class Event(CreationDateMixin, DeclarativeBase):
     user = index_property("fields", USER_FIELD)
     content = index_property("fields", CONTENT_FIELD)
     member = index_property("fields", MEMBER_FIELD)
+    members = index_property("fields", MEMBERS_FIELD)
     subscription = index_property("fields", SUBSCRIPTION_FIELD)
     client_token = index_property("fields", CLIENT_TOKEN_FIELD)
     reaction = index_property("fields", REACTION_FIELD)
@@ -1,5 +1,6 @@
 from sqlalchemy import Column
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Sequence
 from sqlalchemy import Unicode
 from sqlalchemy import UniqueConstraint
@@ -34,3 +35,6 @@ def __repr__(self):
             repr(self.content_id),
             repr(self.value),
         )
+
+
+Index("idx__reaction__content_id__value", Reaction.content_id, Reaction.value)
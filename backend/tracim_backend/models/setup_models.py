@@ -1,20 +1,28 @@
 # import or define all models here to ensure they are attached to the
 # Base.metadata prior to any initialization routines
+import random
+import time
 import typing
 
 from pyramid.config import Configurator
+from pyramid.request import Request
+from pyramid.response import Response
 from sqlalchemy import engine_from_config
 from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import make_url
 from sqlalchemy.event import listen
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import configure_mappers
 from sqlalchemy.orm import scoped_session
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 import zope.sqlalchemy
 
 from tracim_backend.applications.share.models import ContentShare  # noqa: F401
 from tracim_backend.applications.upload_permissions.models import UploadPermission  # noqa: F401
 from tracim_backend.lib.crud_hook.caller import DatabaseCrudHookCaller
+from tracim_backend.lib.utils.database_pool import DatabasePoolStatistics
+from tracim_backend.lib.utils.database_pool import MonitoredQueuePool
 from tracim_backend.lib.utils.utils import sliced_dict
 from tracim_backend.models.auth import User  # noqa: F401
 from tracim_backend.models.data import Content  # noqa: F401
@@ -23,6 +31,7 @@
 from tracim_backend.models.meta import DeclarativeBase  # noqa: F401
 from tracim_backend.models.reaction import Reaction  # noqa: F401
 from tracim_backend.models.tracim_session import TracimSession
+from tracim_backend.models.webdav import Lock  # noqa: F401
 
 if typing.TYPE_CHECKING:
     # INFO - G.M - 2019-05-03 - import for type-checking only, setted here to
@@ -35,7 +44,15 @@
 configure_mappers()
 
 
-def get_engine(app_config: "CFG", prefix="sqlalchemy.", **kwargs) -> Engine:
+def get_engine(
+    app_config: "CFG", prefix="sqlalchemy.", pool_name: str = "default", **kwargs
+) -> Engine:
+    """
+    Create an engine from sqlalchemy parameters of the config.
+    :param pool_name: name of the application using the engine: settings of its pool can be
+    overridden in config file with "database.pool.<pool_name>." prefix, ie
+    "database.pool.webdav.pool_size = 5", and its statistics are reported under this name.
+    """
     sqlalchemy_params = sliced_dict(
         app_config.__dict__, beginning_key_string=prefix.upper().replace(".", "__")
     )
@@ -45,8 +62,89 @@ def get_engine(app_config: "CFG", prefix="sqlalchemy.", **kwargs) -> Engine:
     for key, value in sqlalchemy_params.items():
         new_key = key.lower().replace("__", ".")
         new_config[new_key] = value
+    pool_prefix = "database.pool.{}.".format(pool_name)
+    for key, value in sliced_dict(app_config.settings, beginning_key_string=pool_prefix).items():
+        new_config[key.replace(pool_prefix, prefix, 1)] = value
+
+    url = make_url(kwargs.get("url") or new_config[prefix + "url"])
+    if "poolclass" not in kwargs and url.get_dialect().get_pool_class(url) is QueuePool:
+        kwargs["poolclass"] = MonitoredQueuePool
+    engine = engine_from_config(new_config, prefix=prefix, **kwargs)
+    DatabasePoolStatistics.monitor(
+        pool_name, engine, app_config.DATABASE__CONNECTION_HOLD_WARNING_THRESHOLD
+    )
+    return engine
 
-    return engine_from_config(new_config, prefix=prefix, **kwargs)
+
+class DatabaseReplicaRouter(object):
+    """
+    Route sessions of read-only requests to read replica databases (database.replica_urls),
+    see TracimSession.get_bind().
+
+    To read its own writes, a client which wrote to the database less than
+    database.read_your_writes_delay seconds ago keeps reading from the primary database:
+    the time of its last write is kept in a cookie.
+    """
+
+    LAST_WRITE_COOKIE_NAME = "tracim_last_write"
+    READ_ONLY_METHODS = ("GET", "HEAD", "OPTIONS", "PROPFIND")
+
+    def __init__(self, app_config: "CFG", replica_engines: typing.List[Engine]) -> None:
+        self._replica_engines = replica_engines
+        self._read_your_writes_delay = app_config.DATABASE__READ_YOUR_WRITES_DELAY
+
+    @classmethod
+    def from_config(
+        cls, app_config: "CFG", pool_name: str = "default", **engine_kwargs
+    ) -> "DatabaseReplicaRouter":
+        replica_engines = [
+            get_engine(
+                app_config,
+                url=replica_url,
+                pool_name="{}_replica".format(pool_name),
+                **engine_kwargs
+            )
+            for replica_url in app_config.DATABASE__REPLICA_URLS
+        ]
+        return cls(app_config, replica_engines)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._replica_engines)
+
+    def route_session(
+        self, session: TracimSession, method: str, last_write_time: typing.Optional[str] = None
+    ) -> None:
+        """
+        Give a replica to the session and use it if the request is read-only.
+        :param last_write_time: value of the last write cookie of the client, if any
+        """
+        if not self._replica_engines:
+            return
+        session.info["replica_engine"] = random.choice(self._replica_engines)
+        if method.upper() in self.READ_ONLY_METHODS and not self._has_written_recently(
+            last_write_time
+        ):
+            session.info["use_replica"] = True
+
+    def _has_written_recently(self, last_write_time: typing.Optional[str]) -> bool:
+        if not last_write_time:
+            return False
+        try:
+            return time.time() - float(last_write_time) < self._read_your_writes_delay
+        except ValueError:
+            return False
+
+    def set_last_write_cookie(self, request: Request, response: Response) -> None:
+        """Pyramid response callback setting the last write cookie after writes."""
+        if request.dbsession.has_written and response.status_code < 400:
+            response.set_cookie(
+                self.LAST_WRITE_COOKIE_NAME,
+                "{:.3f}".format(time.time()),
+                max_age=self._read_your_writes_delay,
+                path="/",
+                httponly=True,
+            )
 
 
 def get_session_factory(engine) -> sessionmaker:
@@ -97,9 +195,14 @@ def get_tm_session(session_factory, transaction_manager) -> Session:
     from tracim_backend.models.revision_protection import prevent_content_revision_delete
 
     listen(dbsession, "before_flush", prevent_content_revision_delete)
+    listen(dbsession, "after_flush", _set_session_written)
     return dbsession
 
 
+def _set_session_written(session: TracimSession, flush_context=None) -> None:
+    session.set_written()
+
+
 def create_dbsession_for_context(
     session_factory, transaction_manager, context: "TracimContext"
 ) -> Session:
@@ -125,13 +228,21 @@ def init_models(configurator: Configurator, app_config: "CFG") -> None:
     # use pyramid_retry to retry a request when transient exceptions occur
     configurator.include("pyramid_retry")
 
-    session_factory = get_session_factory(get_engine(app_config))
+    session_factory = get_session_factory(get_engine(app_config, pool_name="web"))
     configurator.registry["dbsession_factory"] = session_factory
+    replica_router = DatabaseReplicaRouter.from_config(app_config, pool_name="web")
+
+    def create_request_dbsession(request: Request) -> TracimSession:
+        # request.tm is the transaction manager used by pyramid_tm
+        dbsession = create_dbsession_for_context(session_factory, request.tm, request)
+        if replica_router.enabled:
+            replica_router.route_session(
+                dbsession,
+                request.method,
+                request.cookies.get(DatabaseReplicaRouter.LAST_WRITE_COOKIE_NAME),
+            )
+            request.add_response_callback(replica_router.set_last_write_cookie)
+        return dbsession
 
     # make request.dbsession available for use in Pyramid
-    configurator.add_request_method(
-        # r.tm is the transaction manager used by pyramid_tm
-        lambda r: create_dbsession_for_context(session_factory, r.tm, r),
-        "dbsession",
-        reify=True,
-    )
+    configurator.add_request_method(create_request_dbsession, "dbsession", reify=True)
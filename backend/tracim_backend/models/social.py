@@ -24,3 +24,27 @@ def __repr__(self):
         return "<UserFollower: follower_id=%s, leader_id=%s>".format(
             self.follower_id, self.leader_id
         )
+
+
+class UserStats(DeclarativeBase):
+    """
+    Denormalized counters displayed on user profiles, kept up to date by
+    UserStatsUpdater crud hooks and rebuilt by "tracimcli user rebuild-stats".
+    """
+
+    __tablename__ = "user_stats"
+
+    user_id = Column(
+        Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False, primary_key=True
+    )
+    followers_count = Column(Integer, nullable=False, default=0, server_default="0")
+    leaders_count = Column(Integer, nullable=False, default=0, server_default="0")
+    authored_content_revisions_count = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    authored_content_revisions_space_count = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    def __repr__(self):
+        return "<UserStats: user_id={}>".format(self.user_id)
@@ -2,11 +2,16 @@
 import typing
 import weakref
 
+from sqlalchemy.engine import Engine
+from sqlalchemy.event import listen
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.selectable import SelectBase
 
 if typing.TYPE_CHECKING:
     from tracim_backend.lib.utils.request import TracimContext
 
+CACHED_RESULTS_INFO_KEY = "cached_results"
+
 
 class TracimSession(Session):
     """
@@ -17,6 +22,10 @@ def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._allow_revision_deletion = False  # type: bool
         self._context = None  # type: typing.Optional[weakref.CallableProxyType]
+        for event_name in ("after_flush", "after_commit", "after_rollback", "after_soft_rollback"):
+            listen(self, event_name, self._on_cached_results_outdated)
+        for event_name in ("after_bulk_update", "after_bulk_delete"):
+            listen(self, event_name, self._on_bulk_operation)
 
     # TODO S.G 2020-06-08: this is a temporary setup until #1834 is done
     @property
@@ -28,6 +37,50 @@ def context(self) -> "TracimContext":
     def set_context(self, tracim_context: "TracimContext") -> None:
         self._context = weakref.proxy(tracim_context)
 
+    def get_bind(self, mapper=None, clause=None) -> Engine:
+        if self.info.get("use_replica"):
+            # INFO - only reads go to the read replica, once the session writes something
+            # it reads from the primary database to see its own writes
+            if not self._flushing and (clause is None or isinstance(clause, SelectBase)):
+                return self.info["replica_engine"]
+            self.set_written()
+        return super().get_bind(mapper=mapper, clause=clause)
+
+    def set_written(self) -> None:
+        """Mark the session as having written to the database, see get_bind()."""
+        self.info["has_written"] = True
+        self.info["use_replica"] = False
+
+    @property
+    def has_written(self) -> bool:
+        return self.info.get("has_written", False)
+
+    def get_cached_result(
+        self, key: typing.Hashable, compute: typing.Callable[[], typing.Any]
+    ) -> typing.Any:
+        """
+        Return the result of compute() cached in this session for the given key.
+        Cached results are dropped each time the session flushes, commits or rolls back,
+        see clear_cached_results(). Nothing is cached while the session has pending changes
+        as compute() may autoflush them.
+        """
+        if self.new or self.dirty or self.deleted:
+            return compute()
+        cached_results = self.info.setdefault(CACHED_RESULTS_INFO_KEY, {})
+        if key not in cached_results:
+            cached_results[key] = compute()
+        return cached_results[key]
+
+    def clear_cached_results(self) -> None:
+        """Drop results cached by get_cached_result(), to call after writes done without flush."""
+        self.info.pop(CACHED_RESULTS_INFO_KEY, None)
+
+    def _on_cached_results_outdated(self, session: "TracimSession", *args) -> None:
+        self.clear_cached_results()
+
+    def _on_bulk_operation(self, bulk_operation_context) -> None:
+        self.clear_cached_results()
+
     def set_allowed_revision_deletion(self, value: bool) -> None:
         self._allow_revision_deletion = value
 
@@ -62,3 +115,19 @@ def unprotected_content_revision(
         yield session
     finally:
         session.set_allowed_revision_deletion(original_allow_revision_deletion_status)
+
+
+@contextmanager
+def read_from_replica(session: TracimSession) -> typing.Generator[TracimSession, None, None]:
+    """
+    Read from the read replica database of the session (if any) in this block, for
+    read-only library calls outside of read-only requests.
+    Nothing is read from the replica if the session already wrote to the database.
+    """
+    original_use_replica = session.info.get("use_replica", False)
+    try:
+        if session.info.get("replica_engine") is not None and not session.has_written:
+            session.info["use_replica"] = True
+        yield session
+    finally:
+        session.info["use_replica"] = original_use_replica and not session.has_written
@@ -1,6 +1,24 @@
+from depot.fields.interfaces import FileFilter
 from depot.fields.sqlalchemy import UploadedFileField
+from depot.fields.upload import UploadedFile
 from sqlalchemy import types
 
+CONTENT_LENGTH_METADATA_KEY = "content_length"
+
+
+class ContentLengthFilter(FileFilter):
+    """
+    Store content length of the saved file in uploaded file metadata.
+    This allow to know the size of a file from the database row only,
+    without opening the stored file (useful for listings like WebDAV PROPFIND).
+    """
+
+    def on_save(self, uploaded_file: UploadedFile) -> None:
+        uploaded_file[CONTENT_LENGTH_METADATA_KEY] = uploaded_file.file.content_length
+
+
+UPLOADED_FILE_FILTERS = (ContentLengthFilter(),)
+
 
 class TracimUploadedFileField(UploadedFileField):
     """
@@ -9,5 +27,19 @@ class TracimUploadedFileField(UploadedFileField):
     mysql database for real utf8 fields: 4000 char in utf8bm4 is too big for mysql.
     """
 
+    def __init__(self, *args, filters=UPLOADED_FILE_FILTERS, **kwargs):
+        super().__init__(*args, filters=filters, **kwargs)
+
     def load_dialect_impl(self, dialect):
         return dialect.type_descriptor(types.TEXT)
+
+
+def get_uploaded_file_content_length(uploaded_file: UploadedFile) -> int:
+    """
+    Return content length of the uploaded file, using metadata when available
+    (see ContentLengthFilter), or the stored file for files uploaded before.
+    """
+    content_length = uploaded_file.get(CONTENT_LENGTH_METADATA_KEY)
+    if content_length is None:
+        content_length = uploaded_file.file.content_length
+    return content_length
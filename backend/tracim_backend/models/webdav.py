@@ -0,0 +1,59 @@
+from sqlalchemy import Column
+from sqlalchemy import ForeignKey
+from sqlalchemy import Index
+from sqlalchemy.types import Float
+from sqlalchemy.types import LargeBinary
+from sqlalchemy.types import Unicode
+from sqlalchemy.types import UnicodeText
+
+from tracim_backend.models.meta import DeclarativeBase
+
+
+class Lock(DeclarativeBase):
+    """
+    WebDAV lock, stored in database to be shared between all WebDAV processes
+    """
+
+    __tablename__ = "webdav_locks"
+    MAX_TOKEN_LENGTH = 255
+
+    token = Column(Unicode(MAX_TOKEN_LENGTH), primary_key=True, nullable=False)
+    depth = Column(Unicode(32), unique=False, nullable=False, default="infinity")
+    root = Column(UnicodeText, unique=False, nullable=False)
+    type = Column(Unicode(32), unique=False, nullable=False, default="write")
+    scope = Column(Unicode(32), unique=False, nullable=False, default="exclusive")
+    # INFO - owner is the xml bytestring given by the WebDAV client
+    owner = Column(LargeBinary, unique=False, nullable=False)
+    expire = Column(Float, unique=False, nullable=False)
+    principal = Column(Unicode(255), unique=False, nullable=False)
+    timeout = Column(Float, unique=False, nullable=False)
+
+    def __repr__(self):
+        return "<Lock(token=%s, root=%s)>" % (repr(self.token), repr(self.root))
+
+
+Index("idx__webdav_locks__expire", Lock.expire)
+
+
+class Url2Token(DeclarativeBase):
+    """
+    Locked path to lock token mapping
+    """
+
+    __tablename__ = "webdav_url2token"
+
+    token = Column(
+        Unicode(Lock.MAX_TOKEN_LENGTH),
+        ForeignKey("webdav_locks.token", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    path = Column(UnicodeText, unique=False, nullable=False)
+
+    def __repr__(self):
+        return "<Url2Token(token=%s, path=%s)>" % (repr(self.token), repr(self.path))
+
+
+# INFO - path index is also used for prefix (children) lookups,
+# mysql needs an explicit length to index text columns.
+Index("idx__webdav_url2token__path", Url2Token.path, mysql_length=255)
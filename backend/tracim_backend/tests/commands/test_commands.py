@@ -4,11 +4,13 @@
 import subprocess
 
 from depot.manager import DepotManager
+from freezegun import freeze_time
 import pytest
 from sqlalchemy.orm.exc import NoResultFound
 import transaction
 
 import tracim_backend
+from tracim_backend.applications.upload_permissions.models import UploadPermission
 from tracim_backend.command import TracimCLI
 from tracim_backend.exceptions import UserDoesNotExist
 from tracim_backend.models.auth import AuthType
@@ -48,8 +50,11 @@ def test_func__check_commands_list__ok__nominal_case(self) -> None:
         # user
         assert output.find("user create") > 0
         assert output.find("user update") > 0
+        assert output.find("user rebuild-stats") > 0
         assert output.find("user delete") > 0
         assert output.find("user update") > 0
+        # share
+        assert output.find("share delete-disabled") > 0
         # db
         assert output.find("db init") > 0
         assert output.find("db delete") > 0
@@ -1575,3 +1580,46 @@ def test_func__anonymize_user__ok__specific_display_name(
         assert deleted_user_event.user["public_name"] == "bob"
         assert anonymized_user_event.event_type == "user.modified"
         assert anonymized_user_event.user["public_name"] == "Custom Name"
+
+    def test_func__delete_disabled_shares__ok__nominal_case(
+        self, session, workspace_api_factory, upload_permission_lib_factory
+    ) -> None:
+        """
+        Test deletion of upload permissions disabled for a long time
+        """
+        workspace = workspace_api_factory.get().create_workspace(
+            "test", public_upload_enabled=True, save_now=True
+        )
+        upload_permission_lib = upload_permission_lib_factory.get()
+        permissions = upload_permission_lib.add_permission_to_workspace(
+            workspace, ["old@test.test", "recent@test.test", "enabled@test.test"]
+        )
+        with freeze_time("2000-01-01 00:00:00"):
+            upload_permission_lib.disable_upload_permission(
+                workspace, permissions[0].upload_permission_id
+            )
+        upload_permission_lib.disable_upload_permission(
+            workspace, permissions[1].upload_permission_id
+        )
+        transaction.commit()
+
+        session.close()
+        # NOTE GM 2019-07-21: Unset Depot configuration. Done here and not in fixture because
+        # TracimCLI need reseted context when ran.
+        DepotManager._clear()
+        app = TracimCLI()
+        result = app.run(
+            [
+                "share",
+                "delete-disabled",
+                "-c",
+                "{}#command_test".format(TEST_CONFIG_FILE_PATH),
+                "--days",
+                "10",
+                "--batch-size",
+                "1",
+            ]
+        )
+        assert result == 0
+        emails = [email for (email,) in session.query(UploadPermission.email)]
+        assert sorted(emails) == ["enabled@test.test", "recent@test.test"]
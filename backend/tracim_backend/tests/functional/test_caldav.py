@@ -1,11 +1,17 @@
+import os
 from time import sleep
+from unittest import mock
 
 import pytest
 import requests
 from requests.exceptions import ConnectionError
 import transaction
 
+from tracim_backend.applications.agenda.lib import AgendaApi
+from tracim_backend.applications.agenda.lib import AgendaHooks
+from tracim_backend.applications.agenda.models import AgendaResourceType
 from tracim_backend.models.auth import Profile
+from tracim_backend.models.auth import UserConnectionStatus
 from tracim_backend.models.data import UserRoleInWorkspace
 from tracim_backend.tests.fixtures import *  # noqa: F403,F40
 
@@ -584,3 +590,97 @@ def test_proxy_user_agenda__ok__workspace_filter(
             workspace3.workspace_id
         )
         assert agenda["with_credentials"] is True
+
+
+@pytest.mark.usefixtures("base_fixture")
+@pytest.mark.parametrize(
+    "config_section", [{"name": "functional_caldav_radicale_proxy_test"}], indirect=True
+)
+class TestAgendaHooks(object):
+    def test_unit__agenda_hooks__ok__only_sync_on_agenda_properties_change(
+        self, session, user_api_factory, workspace_api_factory
+    ) -> None:
+        user = user_api_factory.get().create_user(
+            "test@test.test", password="test@test.test", do_save=True, do_notify=False
+        )
+        workspace = workspace_api_factory.get().create_workspace("wp1", save_now=True)
+        workspace.agenda_enabled = True
+        session.flush()
+        hooks = AgendaHooks()
+
+        with mock.patch.object(AgendaApi, "ensure_user_agenda_exists") as ensure_user_agenda:
+            user.connection_status = UserConnectionStatus.ONLINE
+            hooks.on_user_modified(user, session.context)
+            assert not ensure_user_agenda.called
+            user.display_name = "Renamed"
+            hooks.on_user_modified(user, session.context)
+            ensure_user_agenda.assert_called_once_with(user)
+        session.flush()
+
+        with mock.patch.object(
+            AgendaApi, "ensure_workspace_agenda_exists"
+        ) as ensure_workspace_agenda:
+            workspace.public_download_enabled = not workspace.public_download_enabled
+            hooks.on_workspace_modified(workspace, session.context)
+            assert not ensure_workspace_agenda.called
+            workspace.description = "new description"
+            hooks.on_workspace_modified(workspace, session.context)
+            ensure_workspace_agenda.assert_called_once_with(workspace)
+
+    def test_unit__agenda_is_up_to_date__ok__from_radicale_storage(
+        self, session, app_config, radicale_server, user_api_factory, workspace_api_factory
+    ) -> None:
+        user = user_api_factory.get().create_user(
+            "test@test.test", password="test@test.test", do_save=True, do_notify=False
+        )
+        workspace = workspace_api_factory.get().create_workspace("wp1", save_now=True)
+        workspace.agenda_enabled = True
+        session.flush()
+        agenda_api = AgendaApi(current_user=None, session=session, config=app_config)
+
+        assert not agenda_api.user_agenda_is_up_to_date(user)
+        agenda_api.ensure_user_agenda_exists(user)
+        assert agenda_api.user_agenda_is_up_to_date(user)
+        user.display_name = "Renamed"
+        assert not agenda_api.user_agenda_is_up_to_date(user)
+
+        assert not agenda_api.workspace_agenda_is_up_to_date(workspace)
+        agenda_api.ensure_workspace_agenda_exists(workspace)
+        assert agenda_api.workspace_agenda_is_up_to_date(workspace)
+        workspace.description = "new description"
+        assert not agenda_api.workspace_agenda_is_up_to_date(workspace)
+        agenda_api.ensure_workspace_agenda_exists(workspace)
+        assert agenda_api.workspace_agenda_is_up_to_date(workspace)
+
+    def test_unit__agenda_hooks__ok__workspace_symlinks_reconciled_after_commit(
+        self, session, app_config, user_api_factory, workspace_api_factory, role_api_factory
+    ) -> None:
+        user = user_api_factory.get().create_user(
+            "test@test.test", password="test@test.test", do_save=True, do_notify=False
+        )
+        workspace = workspace_api_factory.get().create_workspace("wp1", save_now=True)
+        transaction.commit()
+        session.context.plugin_manager.register(AgendaHooks())
+        agenda_api = AgendaApi(current_user=None, session=session, config=app_config)
+        symlink_paths = [
+            agenda_api._get_symlink_path(
+                "space", workspace.workspace_id, user.user_id, resource_type
+            )
+            for resource_type in (AgendaResourceType.calendar, AgendaResourceType.addressbook)
+        ]
+        role_api = role_api_factory.get()
+
+        role_api.create_one(user, workspace, UserRoleInWorkspace.READER, with_notif=False)
+        assert not any(os.path.lexists(path) for path in symlink_paths)
+        transaction.commit()
+        assert all(os.path.islink(path) for path in symlink_paths)
+
+        # INFO - links already in the wanted state are not written again
+        with mock.patch("tracim_backend.applications.agenda.lib.os.symlink") as symlink:
+            agenda_api.reconcile_workspace_symlinks({(workspace.workspace_id, user.user_id): True})
+        assert not symlink.called
+
+        role_api.delete_one(user.user_id, workspace.workspace_id)
+        assert all(os.path.islink(path) for path in symlink_paths)
+        transaction.commit()
+        assert not any(os.path.lexists(path) for path in symlink_paths)
@@ -2398,6 +2398,88 @@ def test_api__get_file_raw__ok_200__nominal_case(
         assert res.last_modified.month == test_file.updated.month
         assert res.last_modified.year == test_file.updated.year
 
+    def test_api__get_file_raw__ok_206__range_and_conditional_requests(
+        self,
+        workspace_api_factory,
+        content_api_factory,
+        session,
+        web_testapp,
+        content_type_list,
+        app_config,
+    ) -> None:
+        """
+        Get parts of one file of a content, with etag based on revision
+        """
+        workspace_api = workspace_api_factory.get()
+        content_api = content_api_factory.get()
+        business_workspace = workspace_api.get_one(1)
+        tool_folder = content_api.get_one(1, content_type=content_type_list.Any_SLUG)
+        test_file = content_api.create(
+            content_type_slug=content_type_list.File.slug,
+            workspace=business_workspace,
+            parent=tool_folder,
+            label="Test file",
+            do_save=False,
+            do_notify=False,
+        )
+        with new_revision(session=session, tm=transaction.manager, content=test_file):
+            content_api.update_file_data(
+                test_file,
+                new_content=b"0123456789abcdef",
+                new_filename="Test_file.txt",
+                new_mimetype="text/plain",
+            )
+        session.flush()
+        transaction.commit()
+        content_id = int(test_file.content_id)
+        revision_id = int(test_file.cached_revision_id)
+        web_testapp.authorization = ("Basic", ("admin@admin.admin", "admin@admin.admin"))
+        url = "/api/workspaces/1/files/{}/raw/Test_file.txt".format(content_id)
+
+        res = web_testapp.get(url, status=200)
+        assert res.headers["Accept-Ranges"] == "bytes"
+        assert res.headers["ETag"] == '"revision-{}"'.format(revision_id)
+        assert "Cache-Control" not in res.headers
+        web_testapp.get(url, headers={"If-None-Match": res.headers["ETag"]}, status=304)
+
+        res = web_testapp.get(url, headers={"Range": "bytes=2-5"}, status=206)
+        assert res.body == b"2345"
+        assert res.headers["Content-Range"] == "bytes 2-5/16"
+        res = web_testapp.get(
+            url, headers={"Range": "bytes=-3", "If-Range": res.headers["ETag"]}, status=206
+        )
+        assert res.body == b"def"
+        res = web_testapp.get(
+            url, headers={"Range": "bytes=-3", "If-Range": '"revision-0"'}, status=200
+        )
+        assert res.body == b"0123456789abcdef"
+
+        if app_config.UPLOADED_FILES__STORAGE__STORAGE_TYPE == "memory":
+            # INFO - not seekable storage: multiple ranges are ignored
+            res = web_testapp.get(url, headers={"Range": "bytes=0-1,10-"}, status=200)
+            assert res.body == b"0123456789abcdef"
+            return
+        res = web_testapp.get(url, headers={"Range": "bytes=0-1,10-"}, status=206)
+        content_type, boundary = res.headers["Content-Type"].split("; boundary=")
+        assert content_type == "multipart/byteranges"
+        assert res.body == (
+            "--{boundary}\r\nContent-Type: text/plain\r\n"
+            "Content-Range: bytes 0-1/16\r\n\r\n01\r\n"
+            "--{boundary}\r\nContent-Type: text/plain\r\n"
+            "Content-Range: bytes 10-15/16\r\n\r\nabcdef\r\n"
+            "--{boundary}--\r\n".format(boundary=boundary).encode()
+        )
+        assert int(res.headers["Content-Length"]) == len(res.body)
+
+        res = web_testapp.get(
+            "/api/workspaces/1/files/{}/revisions/{}/raw/Test_file.txt".format(
+                content_id, revision_id
+            ),
+            status=200,
+        )
+        assert res.headers["ETag"] == '"revision-{}"'.format(revision_id)
+        assert res.headers["Cache-Control"] == "private, max-age=31536000, immutable"
+
     def test_api__get_file_raw__ok_200__force_download_case(
         self, workspace_api_factory, content_api_factory, session, web_testapp, content_type_list
     ) -> None:
@@ -5086,3 +5168,55 @@ def test_api__get_html_document_translation__ok__nominal_case(
         )
         assert res.body.decode("utf-8") == translated_raw_content
         assert res.content_type == "text/html"
+
+
+@pytest.mark.usefixtures("base_fixture")
+@pytest.mark.parametrize(
+    "config_section", [{"name": "functional_test_file_offload"}], indirect=True
+)
+class TestFileOffload(object):
+    def test_api__get_file_raw__ok_200__offloaded_to_web_server(
+        self, workspace_api_factory, content_api_factory, session, web_testapp, content_type_list
+    ) -> None:
+        """
+        Get one file of a content, content is sent by the front web server
+        """
+        workspace_api = workspace_api_factory.get()
+        content_api = content_api_factory.get()
+        business_workspace = workspace_api.create_workspace("Business")
+        test_file = content_api.create(
+            content_type_slug=content_type_list.File.slug,
+            workspace=business_workspace,
+            parent=None,
+            label="Test file",
+            do_save=True,
+            do_notify=False,
+        )
+        with new_revision(session=session, tm=transaction.manager, content=test_file):
+            content_api.update_file_data(
+                test_file,
+                new_content=b"0123456789abcdef",
+                new_filename="Test_file.txt",
+                new_mimetype="text/plain",
+            )
+        session.flush()
+        transaction.commit()
+        content_id = int(test_file.content_id)
+        web_testapp.authorization = ("Basic", ("admin@admin.admin", "admin@admin.admin"))
+        url = "/api/workspaces/{}/files/{}/raw/Test_file.txt".format(
+            business_workspace.workspace_id, content_id
+        )
+
+        res = web_testapp.get(url, status=200)
+        assert res.body == b""
+        assert res.headers["X-Accel-Redirect"].startswith("/_tracim_depot/")
+        assert res.headers["X-Accel-Redirect"].endswith("/file")
+        assert res.content_type == "text/plain"
+        assert res.headers["Content-Disposition"].startswith("inline;")
+        assert res.headers["ETag"] == '"revision-{}"'.format(test_file.cached_revision_id)
+        res = web_testapp.get(url, headers={"If-None-Match": res.headers["ETag"]}, status=304)
+        assert "X-Accel-Redirect" not in res.headers
+
+        web_testapp.authorization = None
+        res = web_testapp.get(url, status=401)
+        assert "X-Accel-Redirect" not in res.headers
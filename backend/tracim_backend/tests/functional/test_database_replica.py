@@ -0,0 +1,80 @@
+import os
+import shutil
+
+import pytest
+import transaction
+from webtest import TestApp
+
+from tracim_backend.models.data import Workspace
+from tracim_backend.models.setup_models import DatabaseReplicaRouter
+from tracim_backend.models.tracim_session import read_from_replica
+from tracim_backend.tests.fixtures import *  # noqa: F403,F40
+
+REPLICA_DATABASE_PATH = "/tmp/tracim_replica.sqlite"
+
+
+@pytest.fixture
+def replica_database(sqlalchemy_database):
+    """Snapshot of the primary database, playing the role of a lagging read replica."""
+    if sqlalchemy_database != "sqlite":
+        pytest.skip("replica snapshot is only done for sqlite")
+    shutil.copyfile("/tmp/tracim.sqlite", REPLICA_DATABASE_PATH)
+    yield REPLICA_DATABASE_PATH
+    os.remove(REPLICA_DATABASE_PATH)
+
+
+@pytest.mark.usefixtures("base_fixture")
+@pytest.mark.parametrize(
+    "config_section", [{"name": "functional_test_database_replica"}], indirect=True
+)
+class TestDatabaseReplica(object):
+    def test_api__get_workspaces__ok_200__read_from_replica_except_after_write(
+        self, web_testapp: TestApp, replica_database: str
+    ) -> None:
+        web_testapp.authorization = ("Basic", ("admin@admin.admin", "admin@admin.admin"))
+        params = {
+            "label": "superworkspace",
+            "description": "mysuperdescription",
+            "agenda_enabled": False,
+            "access_type": "confidential",
+            "default_user_role": "reader",
+        }
+        res = web_testapp.post_json("/api/workspaces", status=200, params=params)
+        workspace_id = res.json_body["workspace_id"]
+        assert DatabaseReplicaRouter.LAST_WRITE_COOKIE_NAME in web_testapp.cookies
+
+        # INFO - recent write: read from the primary database
+        web_testapp.get("/api/workspaces/{}".format(workspace_id), status=200)
+
+        # INFO - replica does not know the workspace yet
+        web_testapp.reset()
+        web_testapp.authorization = ("Basic", ("admin@admin.admin", "admin@admin.admin"))
+        web_testapp.get("/api/workspaces/{}".format(workspace_id), status=400)
+        res = web_testapp.get("/api/workspaces", status=200)
+        assert workspace_id not in [workspace["workspace_id"] for workspace in res.json_body]
+        assert DatabaseReplicaRouter.LAST_WRITE_COOKIE_NAME not in web_testapp.cookies
+
+    def test_unit__read_from_replica__ok__nominal_case(
+        self,
+        app_config,
+        session,
+        test_context_without_plugins,
+        workspace_api_factory,
+        replica_database: str,
+    ) -> None:
+        workspace_api_factory.get().create_workspace("superworkspace", save_now=True)
+        transaction.commit()
+        other_session = test_context_without_plugins.dbsession
+        DatabaseReplicaRouter.from_config(app_config).route_session(other_session, "POST")
+        assert other_session.query(Workspace).count() == 1
+        with read_from_replica(other_session):
+            assert other_session.query(Workspace).count() == 0
+        assert other_session.query(Workspace).count() == 1
+
+        other_session.add(Workspace(label="other", description="", owner_id=1))
+        other_session.flush()
+        assert other_session.has_written
+        with read_from_replica(other_session):
+            # INFO - session wrote: read from the primary database
+            assert other_session.query(Workspace).count() == 2
+        other_session.rollback()
@@ -364,3 +364,76 @@ def test_api__delete_content_reaction__ok_400__is_not_author_and_contributor(
             ),
             status=200,
         )
+
+    def test_api__get_reaction_summaries__ok_200__nominal_case(
+        self,
+        web_testapp,
+        session,
+        workspace_api_factory,
+        content_api_factory,
+        content_type_list,
+        admin_user,
+        riyad_user,
+    ) -> None:
+        workspace_api = workspace_api_factory.get()
+        content_api = content_api_factory.get()
+        test_workspace = workspace_api.create_workspace(label="test", save_now=True)
+        other_workspace = workspace_api.create_workspace(label="other", save_now=True)
+        folder = content_api.create(
+            label="test-folder",
+            content_type_slug=content_type_list.Folder.slug,
+            workspace=test_workspace,
+            do_save=True,
+            do_notify=False,
+        )
+        other_folder = content_api.create(
+            label="other-folder",
+            content_type_slug=content_type_list.Folder.slug,
+            workspace=test_workspace,
+            do_save=True,
+            do_notify=False,
+        )
+        foreign_folder = content_api.create(
+            label="foreign-folder",
+            content_type_slug=content_type_list.Folder.slug,
+            workspace=other_workspace,
+            do_save=True,
+            do_notify=False,
+        )
+        reaction_lib = ReactionLib(session)
+        reaction_lib.create(riyad_user, folder, "🐧", do_save=True)
+        reaction_lib.create(admin_user, folder, "😀", do_save=True)
+        reaction_lib.create(admin_user, folder, "🐧", do_save=True)
+        reaction_lib.create(riyad_user, other_folder, "🦋", do_save=True)
+        reaction_lib.create(riyad_user, foreign_folder, "🦋", do_save=True)
+        transaction.commit()
+
+        web_testapp.authorization = ("Basic", ("admin@admin.admin", "admin@admin.admin"))
+        res = web_testapp.get(
+            "/api/workspaces/{}/contents/{}/reaction_summaries".format(
+                test_workspace.workspace_id, folder.content_id
+            ),
+            status=200,
+        )
+        assert res.json_body == [
+            {"content_id": folder.content_id, "value": "🐧", "count": 2, "user_reacted": True},
+            {"content_id": folder.content_id, "value": "😀", "count": 1, "user_reacted": True},
+        ]
+
+        res = web_testapp.get(
+            "/api/workspaces/{}/reaction_summaries".format(test_workspace.workspace_id),
+            params={
+                "content_ids": "{},{},{}".format(
+                    other_folder.content_id, folder.content_id, foreign_folder.content_id
+                )
+            },
+            status=200,
+        )
+        assert [
+            (summary["content_id"], summary["value"], summary["count"], summary["user_reacted"])
+            for summary in res.json_body
+        ] == [
+            (folder.content_id, "🐧", 2, True),
+            (folder.content_id, "😀", 1, True),
+            (other_folder.content_id, "🦋", 1, False),
+        ]
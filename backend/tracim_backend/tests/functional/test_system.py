@@ -5,6 +5,7 @@
 
 from tracim_backend.error import ErrorCode
 from tracim_backend.lib.utils.utils import get_timezones_list
+from tracim_backend.models.auth import Profile
 from tracim_backend.tests.fixtures import *  # noqa: F403,F40
 
 
@@ -169,6 +170,37 @@ def test_api__get_about__err_401__unregistered_user(self, web_testapp):
         assert "details" in res.json.keys()
 
 
+@pytest.mark.usefixtures("base_fixture")
+@pytest.mark.parametrize("config_section", [{"name": "functional_test"}], indirect=True)
+class TestDatabasePoolsEndpoint(object):
+    """
+    Tests for /api/system/database_pools
+    """
+
+    def test_api__get_database_pools__ok_200__nominal_case(self, web_testapp):
+        web_testapp.authorization = ("Basic", ("admin@admin.admin", "admin@admin.admin"))
+        res = web_testapp.get("/api/system/database_pools", status=200)
+        web_pools = [pool for pool in res.json_body if pool["name"] == "web"]
+        # INFO - engine of the app answering the request holds the request connection
+        assert [pool for pool in web_pools if pool["checked_out_count"] == 1]
+        assert all(pool["pool_status"] for pool in web_pools)
+
+    def test_api__get_database_pools__err_403__simple_user(self, web_testapp, user_api_factory):
+        uapi = user_api_factory.get()
+        profile = Profile.USER
+        uapi.create_user(
+            "test@test.test",
+            password="test@test.test",
+            do_save=True,
+            do_notify=False,
+            profile=profile,
+        )
+        transaction.commit()
+        web_testapp.authorization = ("Basic", ("test@test.test", "test@test.test"))
+        res = web_testapp.get("/api/system/database_pools", status=403)
+        assert res.json_body["code"] == ErrorCode.INSUFFICIENT_USER_PROFILE
+
+
 @pytest.mark.usefixtures("test_fixture")
 class TestUsernameEndpoints(object):
     """
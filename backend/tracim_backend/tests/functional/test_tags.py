@@ -563,3 +563,101 @@ def test_api__put_content_tag__ok_400__is_not_contributor(
         )
 
         assert not [tag for tag in res.json_body if tag["tag_id"] == tag_id]
+
+    def test_api__add_contents_tags__ok_200__existing_ones_ignored(
+        self,
+        web_testapp,
+        session,
+        workspace_api_factory,
+        content_api_factory,
+        content_type_list,
+        admin_user,
+    ) -> None:
+        workspace_api = workspace_api_factory.get()
+        content_api = content_api_factory.get()
+        test_workspace = workspace_api.create_workspace(label="test", save_now=True)
+        folders = [
+            content_api.create(
+                label="folder {}".format(index),
+                content_type_slug=content_type_list.Folder.slug,
+                workspace=test_workspace,
+                do_save=True,
+                do_notify=False,
+            )
+            for index in range(3)
+        ]
+        tag_lib = TagLib(session)
+        tag = tag_lib.add_tag_to_content(admin_user, folders[0], "tag", do_save=True)
+        other_tag = tag_lib.add(admin_user, test_workspace, "other tag", do_save=True)
+        transaction.commit()
+
+        web_testapp.authorization = ("Basic", ("admin@admin.admin", "admin@admin.admin"))
+        res = web_testapp.post_json(
+            "/api/workspaces/{}/tags/contents".format(test_workspace.workspace_id),
+            params={
+                "content_ids": [folder.content_id for folder in folders],
+                "tag_ids": [tag.tag_id, other_tag.tag_id],
+            },
+            status=200,
+        )
+        # INFO - tag was already on first folder
+        assert len(res.json_body) == 5
+        for folder in folders:
+            res = web_testapp.get(
+                "/api/workspaces/{}/contents/{}/tags".format(
+                    test_workspace.workspace_id, folder.content_id
+                ),
+                status=200,
+            )
+            assert [tag_res["tag_name"] for tag_res in res.json_body] == ["tag", "other tag"]
+
+        res = web_testapp.post_json(
+            "/api/workspaces/{}/tags/contents".format(test_workspace.workspace_id),
+            params={"content_ids": [folders[0].content_id], "tag_ids": [tag.tag_id, 1000]},
+            status=400,
+        )
+        assert res.json_body["code"] == ErrorCode.TAG_NOT_FOUND
+
+    def test_api__get_tag_contents__ok_200__paginated(
+        self,
+        web_testapp,
+        session,
+        workspace_api_factory,
+        content_api_factory,
+        content_type_list,
+        admin_user,
+    ) -> None:
+        workspace_api = workspace_api_factory.get()
+        content_api = content_api_factory.get()
+        test_workspace = workspace_api.create_workspace(label="test", save_now=True)
+        folders = [
+            content_api.create(
+                label="folder {}".format(index),
+                content_type_slug=content_type_list.Folder.slug,
+                workspace=test_workspace,
+                do_save=True,
+                do_notify=False,
+            )
+            for index in range(3)
+        ]
+        tag_lib = TagLib(session)
+        tag = tag_lib.add(admin_user, test_workspace, "tag", do_save=True)
+        tag_lib.add_tags_to_contents(admin_user, folders[1:], [tag])
+        transaction.commit()
+
+        web_testapp.authorization = ("Basic", ("admin@admin.admin", "admin@admin.admin"))
+        url = "/api/workspaces/{}/tags/{}/contents".format(test_workspace.workspace_id, tag.tag_id)
+        res = web_testapp.get(url, params={"count": 1}, status=200)
+        assert [content["content_id"] for content in res.json_body["items"]] == [
+            folders[1].content_id
+        ]
+        assert res.json_body["has_next"]
+        res = web_testapp.get(
+            url, params={"count": 1, "page_token": res.json_body["next_page_token"]}, status=200,
+        )
+        assert [content["content_id"] for content in res.json_body["items"]] == [
+            folders[2].content_id
+        ]
+        assert not res.json_body["has_next"]
+        res = web_testapp.get(url, status=200)
+        assert len(res.json_body["items"]) == 2
@@ -5711,6 +5711,37 @@ def test_api__get_user_avatar_preview__ok__nominal_case(
         new_image = Image.open(io.BytesIO(res2.body))
         assert 100, 100 == new_image.size
 
+    def test_api__get_user_avatar_preview__ok__pre_rendered_size(
+        self, admin_user: User, web_testapp
+    ) -> None:
+        """
+        get pre-rendered 50x50 preview of a avatar, with cache headers
+        """
+        web_testapp.authorization = ("Basic", ("admin@admin.admin", "admin@admin.admin"))
+        image = create_png_test_image(500, 100)
+        web_testapp.put(
+            "/api/users/{}/avatar/raw/{}".format(admin_user.user_id, image.name),
+            upload_files=[("files", image.name, image.getvalue())],
+            status=204,
+        )
+        url = "/api/users/{}/avatar/preview/jpg/50x50/image.jpg".format(admin_user.user_id)
+        res = web_testapp.get(url, status=200)
+        assert res.content_type == "image/jpeg"
+        assert Image.open(io.BytesIO(res.body)).size == (50, 50)
+        assert res.headers["Cache-Control"] == "private, max-age=86400"
+        etag = res.headers["ETag"]
+        web_testapp.get(url, headers={"If-None-Match": etag}, status=304)
+
+        image = create_png_test_image(100, 100)
+        web_testapp.put(
+            "/api/users/{}/avatar/raw/{}".format(admin_user.user_id, image.name),
+            upload_files=[("files", image.name, image.getvalue())],
+            status=204,
+        )
+        res = web_testapp.get(url, headers={"If-None-Match": etag}, status=200)
+        assert res.headers["ETag"] != etag
+        assert Image.open(io.BytesIO(res.body)).size == (50, 50)
+
 
 @pytest.mark.usefixtures("base_fixture")
 @pytest.mark.parametrize("config_section", [{"name": "functional_test"}], indirect=True)
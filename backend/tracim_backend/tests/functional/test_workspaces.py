@@ -4,6 +4,7 @@
 """
 import datetime
 import typing
+from unittest import mock
 
 from depot.io.utils import FileIntent
 from freezegun import freeze_time
@@ -1407,6 +1408,57 @@ def test_api__get_workspace_members__ok_200_show_disabled_users(
         assert user_role["is_active"] is False
         assert user_role["do_notify"] is False
 
+    def test_api__get_workspace_members_page__ok_200__paginated_and_filtered(
+        self, web_testapp, user_api_factory, workspace_api_factory, role_api_factory, admin_user
+    ):
+        """
+        Check obtain workspace members pages, filtered by role and by name
+        """
+        uapi = user_api_factory.get()
+        workspace = workspace_api_factory.get().create_workspace("test_2", save_now=True)
+        rapi = role_api_factory.get(current_user=admin_user)
+        user_ids = []
+        for name, role in (
+            ("bob", UserRoleInWorkspace.READER),
+            ("alice", UserRoleInWorkspace.CONTRIBUTOR),
+            ("bobby", UserRoleInWorkspace.CONTRIBUTOR),
+        ):
+            user = uapi.create_user(
+                "{}@test.test".format(name),
+                name=name,
+                username=name,
+                do_save=True,
+                do_notify=False,
+            )
+            rapi.create_one(user, workspace, role, False)
+            user_ids.append(user.user_id)
+        transaction.commit()
+        workspace_id = workspace.workspace_id
+        web_testapp.authorization = ("Basic", ("admin@admin.admin", "admin@admin.admin"))
+        url = "/api/workspaces/{}/paginated_members".format(workspace_id)
+
+        res = web_testapp.get(url, params={"count": 2}, status=200).json_body
+        assert [member["user_id"] for member in res["items"]] == [1] + user_ids[:1]
+        assert res["has_next"] is True
+        assert res["items"][0]["user"]["public_name"] == "Global manager"
+        res = web_testapp.get(
+            url, params={"count": 2, "page_token": res["next_page_token"]}, status=200
+        ).json_body
+        assert [member["user_id"] for member in res["items"]] == user_ids[1:]
+        assert res["has_next"] is False
+
+        res = web_testapp.get(
+            url, params={"roles": "contributor,workspace-manager"}, status=200
+        ).json_body
+        assert [member["user_id"] for member in res["items"]] == [1] + user_ids[1:]
+        res = web_testapp.get(
+            url, params={"roles": "contributor", "name_filter": "BOB"}, status=200
+        ).json_body
+        assert [member["user_id"] for member in res["items"]] == user_ids[2:]
+        assert res["items"][0]["role"] == "contributor"
+        res = web_testapp.get(url, params={"roles": "contributor,unknown"}, status=400)
+        assert res.json_body["code"] == ErrorCode.GENERIC_SCHEMA_VALIDATION_ERROR
+
     def test_api__get_workspace_members__ok_200_show_only_enabled_users(
         self, web_testapp, user_api_factory, workspace_api_factory, role_api_factory, admin_user
     ):
@@ -2625,6 +2677,97 @@ def test_api__delete_workspace_member_role__err_400__simple_user(
         ).json_body
         assert len([role for role in roles if role["user_id"] == user.user_id]) == 1
 
+    def test_api__bulk_update_workspace_members__ok_200__add_update_and_remove(
+        self, user_api_factory, web_testapp, event_helper
+    ):
+        uapi = user_api_factory.get()
+        bob = uapi.create_user("bob@bob.bob", username="bob", do_save=True, do_notify=False)
+        alice = uapi.create_user("alice@alice.alice", do_save=True, do_notify=False)
+        transaction.commit()
+        bob_id, alice_id = bob.user_id, alice.user_id
+        web_testapp.authorization = ("Basic", ("admin@admin.admin", "admin@admin.admin"))
+        params = {
+            "members": [
+                {"user_username": "bob", "role": "reader"},
+                {"user_email": "Alice@alice.alice", "role": "contributor"},
+            ]
+        }
+        res = web_testapp.patch_json("/api/workspaces/1/members", status=200, params=params)
+        members = res.json_body["members"]
+        assert [(member["user_id"], member["role"]) for member in members] == [
+            (bob_id, "reader"),
+            (alice_id, "contributor"),
+        ]
+        assert all(member["newly_created"] is False for member in members)
+        assert res.json_body["removed_user_ids"] == []
+        last_event = event_helper.last_event
+        assert last_event.event_type == "workspace_member.modified.bulk"
+        assert last_event.members == {
+            "created": [
+                {"user_id": bob_id, "role": "reader"},
+                {"user_id": alice_id, "role": "contributor"},
+            ],
+            "modified": [],
+            "deleted": [],
+        }
+        assert last_event.workspace["number_of_members"] == 3
+        event_id = last_event.event_id
+
+        params = {
+            "members": [
+                {"user_id": bob_id, "role": "content-manager"},
+                {"user_id": 1, "role": "workspace-manager"},
+            ],
+            "removed_user_ids": [alice_id],
+        }
+        res = web_testapp.patch_json("/api/workspaces/1/members", status=200, params=params)
+        assert [(member["user_id"], member["role"]) for member in res.json_body["members"]] == [
+            (1, "workspace-manager"),
+            (bob_id, "content-manager"),
+        ]
+        assert res.json_body["removed_user_ids"] == [alice_id]
+        # INFO - one event for the whole update, the unchanged admin role is not in it
+        (last_event,) = [
+            event for event in event_helper.last_events(2) if event.event_id > event_id
+        ]
+        assert last_event.members == {
+            "created": [],
+            "modified": [{"user_id": bob_id, "role": "content-manager"}],
+            "deleted": [{"user_id": alice_id, "role": "contributor"}],
+        }
+        res = web_testapp.get("/api/workspaces/1/members", status=200).json_body
+        assert [(member["user_id"], member["role"]) for member in res] == [
+            (1, "workspace-manager"),
+            (bob_id, "content-manager"),
+        ]
+
+    @pytest.mark.parametrize(
+        "params,error_code",
+        [
+            (
+                {"members": [{"user_id": 1, "role": "reader"}]},
+                ErrorCode.LAST_WORKSPACE_MANAGER_ROLE_CANT_BE_MODIFIED,
+            ),
+            ({"removed_user_ids": [1]}, ErrorCode.LAST_WORKSPACE_MANAGER_ROLE_CANT_BE_MODIFIED),
+            ({"removed_user_ids": [2]}, ErrorCode.USER_ROLE_NOT_FOUND),
+            ({"members": [{"user_id": 47, "role": "reader"}]}, ErrorCode.USER_NOT_FOUND),
+            (
+                {"members": [{"user_id": 2, "role": "reader"}], "removed_user_ids": [2]},
+                ErrorCode.GENERIC_SCHEMA_VALIDATION_ERROR,
+            ),
+        ],
+    )
+    def test_api__bulk_update_workspace_members__err_400__nothing_written(
+        self, web_testapp, event_helper, params: dict, error_code: int
+    ):
+        web_testapp.authorization = ("Basic", ("admin@admin.admin", "admin@admin.admin"))
+        event_id = event_helper.last_event.event_id
+        res = web_testapp.patch_json("/api/workspaces/1/members", status=400, params=params)
+        assert res.json_body["code"] == error_code
+        assert event_helper.last_event.event_id == event_id
+        res = web_testapp.get("/api/workspaces/1/members", status=200).json_body
+        assert [(member["user_id"], member["role"]) for member in res] == [(1, "workspace-manager")]
+
 
 @pytest.mark.usefixtures("base_fixture")
 @pytest.mark.usefixtures("default_content_fixture")
@@ -2751,6 +2894,61 @@ def test_api__create_workspace_member_role__ok_200__new_user(
         assert headers["To"][0] == "bob <bob@bob.bob>"
         assert headers["Subject"][0] == "[Tracim] Created account"
 
+    def test_api__bulk_update_workspace_members__ok_200__invitations_sent_after_commit(
+        self, user_api_factory, workspace_api_factory, role_api_factory, web_testapp
+    ):
+        uapi = user_api_factory.get()
+        user = uapi.create_user(
+            "test@test.test",
+            password="test@test.test",
+            do_save=True,
+            do_notify=False,
+            profile=Profile.TRUSTED_USER,
+        )
+        workspace_api = workspace_api_factory.get(show_deleted=True)
+        workspace = workspace_api.create_workspace("test", save_now=True)
+        rapi = role_api_factory.get()
+        rapi.create_one(user, workspace, UserRoleInWorkspace.WORKSPACE_MANAGER, False)
+        transaction.commit()
+        web_testapp.authorization = ("Basic", ("test@test.test", "test@test.test"))
+        params = {
+            "members": [
+                {"user_email": "bob@bob.bob", "role": "content-manager"},
+                {"user_email": "alice@alice.alice", "role": "reader"},
+            ]
+        }
+        with mock.patch(
+            "tracim_backend.lib.mail_notifier.sender.send_email_through"
+        ) as send_email_through:
+            res = web_testapp.patch_json(
+                "/api/workspaces/{}/members".format(workspace.workspace_id),
+                status=200,
+                params=params,
+            )
+        members = res.json_body["members"]
+        assert [member["role"] for member in members] == ["content-manager", "reader"]
+        assert all(member["newly_created"] is True for member in members)
+        assert all(member["email_sent"] is True for member in members)
+        assert sorted(call[0][2]["To"] for call in send_email_through.call_args_list) == [
+            "alice <alice@alice.alice>",
+            "bob <bob@bob.bob>",
+        ]
+
+        # INFO - nothing is sent when the update fails
+        params = {
+            "members": [{"user_email": "carol@carol.carol", "role": "reader"}],
+            "removed_user_ids": [47],
+        }
+        with mock.patch(
+            "tracim_backend.lib.mail_notifier.sender.send_email_through"
+        ) as send_email_through:
+            web_testapp.patch_json(
+                "/api/workspaces/{}/members".format(workspace.workspace_id),
+                status=400,
+                params=params,
+            )
+        assert not send_email_through.called
+
     def test_api__create_workspace_member_role__err_400__user_not_found_as_simple_user(
         self, user_api_factory, web_testapp, role_api_factory, workspace_api_factory, mailhog
     ):
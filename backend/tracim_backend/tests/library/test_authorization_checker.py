@@ -169,6 +169,37 @@ def current_workspace(self):
         with pytest.raises(InsufficientUserRoleInWorkspace):
             RoleChecker(4).check(FakeBaseFakeTracimContext())
 
+    def test__unit__RoleChecker__ok__role_memoized_in_context(self, session):
+
+        current_user = User(user_id=2, email="toto@toto.toto")
+        current_user.profile = Profile.TRUSTED_USER
+        current_workspace = Workspace(workspace_id=3, owner=current_user)
+        role = UserRoleInWorkspace(user_id=2, workspace_id=3, role=2)
+        session.add(current_user)
+        session.add(current_workspace)
+        session.add(role)
+        session.flush()
+        transaction.commit()
+
+        class FakeBaseFakeTracimContext(BaseFakeTracimContext):
+            @property
+            def current_user(self):
+                return current_user
+
+            @property
+            def current_workspace(self):
+                return current_workspace
+
+        context = FakeBaseFakeTracimContext()
+        assert RoleChecker(2).check(context)
+        assert context.get_user_role_in_workspace(current_workspace) == 2
+        session.query(UserRoleInWorkspace).update({"role": 1})
+        # INFO - role is looked up once per context
+        assert RoleChecker(2).check(context)
+        assert current_workspace.get_user_role(current_user) == 1
+        with pytest.raises(InsufficientUserRoleInWorkspace):
+            RoleChecker(2).check(FakeBaseFakeTracimContext())
+
     def test__unit__CandidateWorkspaceRoleChecker__ok__nominal_case(self, session):
 
         current_user = User(user_id=2, email="toto@toto.toto")
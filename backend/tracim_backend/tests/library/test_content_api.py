@@ -2,11 +2,14 @@
 import typing
 
 import pytest
+from sqlalchemy.event import listen
+from sqlalchemy.event import remove
 import transaction
 
 from tracim_backend.app_models.contents import ContentTypeInContext
 from tracim_backend.exceptions import ContentFilenameAlreadyUsedInFolder
 from tracim_backend.exceptions import ContentInNotEditableState
+from tracim_backend.exceptions import ContentNotFound
 from tracim_backend.exceptions import EmptyLabelNotAllowed
 from tracim_backend.exceptions import SameValueError
 from tracim_backend.exceptions import UnallowedSubContent
@@ -18,6 +21,7 @@
 from tracim_backend.models.data import ContentNamespaces
 from tracim_backend.models.data import UserRoleInWorkspace
 from tracim_backend.models.revision_protection import new_revision
+from tracim_backend.models.roles import WorkspaceRoles
 from tracim_backend.tests.fixtures import *  # noqa F403,F401
 from tracim_backend.tests.utils import eq_
 
@@ -3137,3 +3141,51 @@ def test_unit__cant_get_non_access_content__ok__nominal_case(
             bob_viewable[0].label,
             'Bob should not view "{0}" content'.format(bob_viewable[0].label),
         )
+
+    def test_unit__get_one__ok__cached_until_flush(
+        self,
+        session,
+        workspace_api_factory,
+        role_api_factory,
+        admin_user,
+        app_config,
+        content_type_list,
+    ) -> None:
+        bob = session.query(User).filter(User.email == "bob@fsf.local").one()
+        workspace = workspace_api_factory.get(current_user=admin_user).create_workspace(
+            "workspace", save_now=True
+        )
+        role_api = role_api_factory.get()
+        role_api.create_one(bob, workspace, UserRoleInWorkspace.READER, with_notif=False)
+        page = ContentApi(current_user=admin_user, session=session, config=app_config).create(
+            content_type_slug=content_type_list.Page.slug,
+            workspace=workspace,
+            label="page",
+            do_save=True,
+        )
+        transaction.commit()
+        content_api = ContentApi(current_user=bob, session=session, config=app_config)
+        assert content_api.get_one(page.content_id) is page
+        assert workspace.get_user_role(bob) == UserRoleInWorkspace.READER
+        statements = []
+
+        def add_statement(conn, cursor, statement, *args) -> None:
+            statements.append(statement)
+
+        listen(session.bind, "before_cursor_execute", add_statement)
+        try:
+            # INFO - security filter, content and role are not queried again in the session
+            content_api = ContentApi(current_user=bob, session=session, config=app_config)
+            assert content_api.get_one(page.content_id) is page
+            assert workspace.get_user_role(bob) == UserRoleInWorkspace.READER
+            assert not statements
+        finally:
+            remove(session.bind, "before_cursor_execute", add_statement)
+
+        # INFO - flush invalidates cached results
+        role_api.delete_one(bob.user_id, workspace.workspace_id)
+        assert workspace.get_user_role(bob) == WorkspaceRoles.NOT_APPLICABLE.level
+        with pytest.raises(ContentNotFound):
+            ContentApi(current_user=bob, session=session, config=app_config).get_one(
+                page.content_id
+            )
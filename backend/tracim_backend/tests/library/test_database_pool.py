@@ -0,0 +1,53 @@
+from unittest import mock
+
+import pytest
+
+from tracim_backend.lib.utils.database_pool import MonitoredQueuePool
+from tracim_backend.lib.utils.database_pool import get_database_pools_statistics
+from tracim_backend.models.setup_models import get_engine
+from tracim_backend.tests.fixtures import *  # noqa F403,F401
+
+
+class TestDatabasePoolStatistics(object):
+    def test_unit__get_engine__ok__checkouts_statistics(self, app_config) -> None:
+        engine = get_engine(app_config, pool_name="test_statistics")
+        with engine.connect() as connection:
+            connection.execute("SELECT 1")
+            with engine.connect():
+                pass
+            (statistics,) = [
+                statistics
+                for statistics in get_database_pools_statistics()
+                if statistics["name"] == "test_statistics"
+            ]
+            assert statistics["checkouts_count"] == 2
+            assert statistics["checked_out_count"] == 1
+            assert statistics["max_checked_out_count"] == 2
+            assert statistics["long_holds_count"] == 0
+
+    def test_unit__get_engine__ok__queue_pool_settings_and_wait_time(self, app_config) -> None:
+        app_config.settings["database.pool.test_queue.pool_size"] = "3"
+        engine = get_engine(app_config, pool_name="test_queue", poolclass=MonitoredQueuePool)
+        assert engine.pool.size() == 3
+        with engine.connect():
+            pass
+        assert engine.pool.statistics.waits_count == 1
+        statistics = engine.pool.statistics
+        engine.dispose()
+        assert engine.pool.statistics is statistics
+
+    @pytest.mark.parametrize("threshold,warnings_count", [(0, 0), (10, 0), (0.000001, 1)])
+    def test_unit__get_engine__ok__long_hold_warning(
+        self, app_config, threshold: float, warnings_count: int
+    ) -> None:
+        with mock.patch.object(
+            app_config, "DATABASE__CONNECTION_HOLD_WARNING_THRESHOLD", threshold
+        ):
+            engine = get_engine(app_config, pool_name="test_long_hold")
+        with mock.patch("tracim_backend.lib.utils.database_pool.logger") as logger:
+            with engine.connect():
+                pass
+        assert logger.warning.call_count == warnings_count
+        if warnings_count:
+            assert "held for" in logger.warning.call_args[0][1]
+            assert "by thread" in logger.warning.call_args[0][1]
@@ -42,3 +42,21 @@ def test_unit__get_all_for_usages(self, admin_user, session, app_config, workspa
         assert len(roles) == 1
         assert roles[0].user_id == admin_user.user_id
         assert roles[0].role == WorkspaceRoles.WORKSPACE_MANAGER.level
+
+    def test_unit__get_workspace_members_page__ok__users_loaded_with_roles(
+        self, admin_user, session, app_config, workspace_api_factory
+    ):
+        workspace = workspace_api_factory.get().create_workspace("workspace_1", save_now=True)
+        bob = session.query(User).filter(User.email == "bob@fsf.local").one()
+        rapi = RoleApi(current_user=admin_user, session=session, config=app_config)
+        rapi.create_one(bob, workspace, WorkspaceRoles.READER.level, with_notif=False)
+        session.flush()
+        session.expire_all()
+        page = rapi.get_workspace_members_page(workspace.workspace_id, count=1)
+        assert [role.user_id for role in page] == [admin_user.user_id]
+        assert "user" in page[0].__dict__
+        assert page.paging.has_next
+        page = rapi.get_workspace_members_page(
+            workspace.workspace_id, roles=[WorkspaceRoles.READER], name_filter="bob"
+        )
+        assert [role.user_id for role in page] == [bob.user_id]
@@ -1,11 +1,14 @@
 import time
+from unittest import mock
 
 import pytest
 
 from tracim_backend.lib.core.user import UserApi
 from tracim_backend.lib.rq import RqQueueName
+from tracim_backend.lib.rq import enqueue_jobs
 from tracim_backend.lib.rq import get_redis_connection
 from tracim_backend.lib.rq import get_rq_queue
+from tracim_backend.lib.rq import get_rq_queue2
 from tracim_backend.lib.rq.worker import worker_context
 from tracim_backend.tests.fixtures import *  # noqa F403,F401
 
@@ -40,3 +43,37 @@ def test_unit__submit_job__OK_nominal_case(
         user = user_api.get_one(1)
         job_public_name = job.result
         assert user.public_name == job_public_name
+
+    def test_unit__enqueue_jobs__OK_pipelined(
+        self, app_config, session, rq_database_worker
+    ) -> None:
+        jobs = enqueue_jobs(
+            app_config,
+            RqQueueName.EVENT,
+            [("tracim_backend.tests.library.test_rq.get_public_name", (1,))] * 2,
+        )
+        assert len(jobs) == 2
+        for job in jobs:
+            while not job.result:
+                if job.exc_info:
+                    raise job.exc_info
+                time.sleep(0.1)
+            assert job.result == "Global manager"
+
+
+@pytest.mark.usefixtures("base_fixture")
+class TestRQConnectionPool(object):
+    def test_unit__get_redis_connection__OK_shared_pool(self, app_config) -> None:
+        redis = get_redis_connection(app_config)
+        assert get_redis_connection(app_config).connection_pool is redis.connection_pool
+        queue = get_rq_queue2(app_config, RqQueueName.EVENT)
+        assert get_rq_queue2(app_config, RqQueueName.EVENT) is queue
+        assert get_rq_queue2(app_config, RqQueueName.MAIL_SENDER) is not queue
+        assert queue.connection.connection_pool is redis.connection_pool
+
+    def test_unit__get_redis_connection__OK_new_pool_after_fork(self, app_config) -> None:
+        redis = get_redis_connection(app_config)
+        queue = get_rq_queue2(app_config, RqQueueName.EVENT)
+        with mock.patch("tracim_backend.lib.rq.os.getpid", return_value=-1):
+            assert get_redis_connection(app_config).connection_pool is not redis.connection_pool
+            assert get_rq_queue2(app_config, RqQueueName.EVENT) is not queue
@@ -1,4 +1,5 @@
 import cgi
+from datetime import datetime
 from io import BytesIO
 
 from freezegun import freeze_time
@@ -165,3 +166,73 @@ def test_unit__upload_permission__ok__do_multiple_upload_file_at_different_time(
             workspaces=[workspace], content_type=content_type_list.Comment.slug
         )
         assert len(comments) == 2
+
+    def test_unit__upload_permission__ok__upload_files_by_batches(
+        self, workspace_api_factory, session, app_config, content_api_factory, admin_user,
+    ):
+        workspace_api = workspace_api_factory.get()
+        workspace = workspace_api.create_workspace("test", public_upload_enabled=True)
+        transaction.commit()
+        api = UploadPermissionLib(current_user=admin_user, session=session, config=app_config)
+        permission = api.add_permission_to_workspace(workspace, ["test@test.test"])[0]
+        storages = []
+        for index in range(5):
+            content = "text {}".format(index).encode("utf-8")
+            headers = {
+                u"content-disposition": u'form-data; name="{}"; filename="{}"'.format(
+                    "file_{}".format(index), "test{}.txt".format(index)
+                ),
+                u"content-length": len(content),
+                u"content-type": "plain/text",
+            }
+            environ = {"REQUEST_METHOD": "POST"}
+            storages.append(cgi.FieldStorage(fp=BytesIO(content), headers=headers, environ=environ))
+        uploaded_contents = api.upload_files(
+            upload_permission=permission,
+            uploader_username="john",
+            message=None,
+            files=iter(storages),
+            do_notify=False,
+            tm=transaction.manager,
+            batch_size=2,
+        )
+        transaction.commit()
+
+        assert [content.filename for content in uploaded_contents] == [
+            "test{}.txt".format(index) for index in range(5)
+        ]
+        content_api = content_api_factory.get()
+        for uploaded_content in uploaded_contents:
+            content = content_api.get_one(uploaded_content.content_id)
+            # INFO - file data is set on creation revision
+            assert len(content.revisions) == 1
+            assert content.depot_file.file.read() == "text {}".format(
+                uploaded_contents.index(uploaded_content)
+            ).encode("utf-8")
+
+    def test_unit__delete_disabled_upload_permissions__ok__by_batches(
+        self, workspace_api_factory, session, app_config, admin_user,
+    ):
+        workspace_api = workspace_api_factory.get()
+        workspace = workspace_api.create_workspace("test", public_upload_enabled=True)
+        transaction.commit()
+        api = UploadPermissionLib(
+            current_user=admin_user, session=session, config=app_config, show_disabled=True
+        )
+        permissions = api.add_permission_to_workspace(
+            workspace, ["test{}@test.test".format(i) for i in range(4)]
+        )
+        with freeze_time("2000-01-01 00:00:00"):
+            for permission in permissions[:3]:
+                api.disable_upload_permission(workspace, permission.upload_permission_id)
+        with freeze_time("2000-02-01 00:00:00"):
+            api.disable_upload_permission(workspace, permissions[3].upload_permission_id)
+        transaction.commit()
+
+        disabled_before = datetime(2000, 1, 15)
+        assert api.delete_disabled_upload_permissions(disabled_before, limit=2) == 2
+        assert api.delete_disabled_upload_permissions(disabled_before, limit=2) == 1
+        assert api.delete_disabled_upload_permissions(disabled_before, limit=2) == 0
+        transaction.commit()
+        remaining_permissions = api.get_upload_permissions(workspace)
+        assert [permission.email for permission in remaining_permissions] == ["test3@test.test"]
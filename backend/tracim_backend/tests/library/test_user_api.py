@@ -13,17 +13,21 @@
 from tracim_backend.exceptions import InvalidUsernameFormat
 from tracim_backend.exceptions import MissingLDAPConnector
 from tracim_backend.exceptions import ReservedUsernameError
+from tracim_backend.exceptions import TooManyOnlineUsersError
 from tracim_backend.exceptions import TooShortAutocompleteString
 from tracim_backend.exceptions import TracimValidationFailed
 from tracim_backend.exceptions import UserAuthTypeDisabled
 from tracim_backend.exceptions import UserDoesNotExist
 from tracim_backend.exceptions import UsernameAlreadyExists
 from tracim_backend.lib.core.user import UserApi
+from tracim_backend.lib.core.user_stats import UserStatsLib
 from tracim_backend.models.auth import AuthType
 from tracim_backend.models.auth import Profile
 from tracim_backend.models.auth import User
+from tracim_backend.models.auth import UserConnectionStatus
 from tracim_backend.models.context_models import UserInContext
 from tracim_backend.models.data import UserRoleInWorkspace
+from tracim_backend.models.social import UserStats
 from tracim_backend.tests.fixtures import *  # noqa: F403,F40
 
 
@@ -869,6 +873,61 @@ def test_unit__disable_user___err__user_cant_disable_itself(self, session, app_c
         with pytest.raises(UserCantDisableHimself):
             api2.disable(user)
 
+    def test_unit__user_stats__ok__updated_by_hooks_and_rebuilt(
+        self, session, app_config, admin_user, workspace_api_factory, content_api_factory
+    ):
+        api = UserApi(current_user=admin_user, session=session, config=app_config)
+        bob = api.create_user(email="bob@bob", do_save=True, do_notify=False)
+        api.create_follower(follower_id=bob.user_id, leader_id=admin_user.user_id)
+        workspace = workspace_api_factory.get().create_workspace("test", save_now=True)
+        content_api = content_api_factory.get()
+        content_api.create("html-document", workspace, None, "one", do_save=True)
+        content_api.create("html-document", workspace, None, "two", do_save=True)
+        transaction.commit()
+
+        stats_lib = UserStatsLib(session)
+        expected_admin_stats = {
+            "followers_count": 1,
+            "leaders_count": 0,
+            "authored_content_revisions_count": 2,
+            "authored_content_revisions_space_count": 1,
+        }
+        assert session.query(UserStats).get(admin_user.user_id) is not None
+        assert stats_lib.get_user_stats(admin_user.user_id) == expected_admin_stats
+        assert stats_lib.get_user_stats(bob.user_id)["leaders_count"] == 1
+
+        api.delete_follower(follower_id=bob.user_id, leader_id=admin_user.user_id)
+        session.flush()
+        assert stats_lib.get_user_stats(admin_user.user_id)["followers_count"] == 0
+        assert stats_lib.get_user_stats(bob.user_id)["leaders_count"] == 0
+
+        session.query(UserStats).delete()
+        assert stats_lib.rebuild_all_user_stats(batch_size=1) == 2
+        assert stats_lib.get_user_stats(admin_user.user_id) == dict(
+            expected_admin_stats, followers_count=0
+        )
+
+    def test_unit__check_maximum_online_users__ok__count_stops_at_limit(
+        self, session, app_config, admin_user
+    ):
+        api = UserApi(current_user=admin_user, session=session, config=app_config)
+        for index in range(3):
+            user = api.create_minimal_user("online{}@example.com".format(index))
+            user.connection_status = UserConnectionStatus.ONLINE
+            session.add(user)
+        session.flush()
+        assert api.get_online_user_count() == 3
+        assert api.get_online_user_count(limit=2) == 2
+
+        with mock.patch.object(app_config, "LIMITATION__MAXIMUM_ONLINE_USERS", 4):
+            api.check_maximum_online_users()
+        with mock.patch.object(app_config, "LIMITATION__MAXIMUM_ONLINE_USERS", 2):
+            with pytest.raises(TooManyOnlineUsersError) as exc_info:
+                api.check_maximum_online_users()
+        assert str(exc_info.value) == "Too many users online (2/2)"
+        with mock.patch.object(app_config, "LIMITATION__MAXIMUM_ONLINE_USERS", 0):
+            api.check_maximum_online_users()
+
 
 @pytest.mark.usefixtures("base_fixture")
 @pytest.mark.parametrize("config_section", [{"name": "base_test_ldap"}], indirect=True)
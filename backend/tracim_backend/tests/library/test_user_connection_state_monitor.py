@@ -0,0 +1,58 @@
+from unittest import mock
+
+import pytest
+import transaction
+
+from tracim_backend.lib.core.user import UserApi
+from tracim_backend.lib.user_connection_state_monitor.monitor import UserConnectionStateMonitor
+from tracim_backend.models.auth import User
+from tracim_backend.models.auth import UserConnectionStatus
+from tracim_backend.tests.fixtures import *  # noqa F403,F401
+
+
+@pytest.mark.usefixtures("base_fixture")
+class TestUserConnectionStateMonitor(object):
+    def test_unit__write_status_changes__ok__coalesced_by_status(
+        self, app_config, session, admin_user
+    ) -> None:
+        user_api = UserApi(current_user=None, session=session, config=app_config)
+        bob = user_api.create_user("bob@example.com", do_save=True, do_notify=False)
+        alice = user_api.create_user("alice@example.com", do_save=True, do_notify=False)
+        alice.connection_status = UserConnectionStatus.ONLINE
+        transaction.commit()
+        bob_id, alice_id, admin_id = bob.user_id, alice.user_id, admin_user.user_id
+
+        monitor = UserConnectionStateMonitor(app_config)
+        monitor.add_status_change(bob_id, UserConnectionStatus.ONLINE)
+        monitor.add_status_change(alice_id, UserConnectionStatus.OFFLINE)
+        monitor.add_status_change(alice_id, UserConnectionStatus.ONLINE)
+        monitor.add_status_change(admin_id, UserConnectionStatus.ONLINE)
+        monitor.add_to_pending_offline_users(admin_id)
+        monitor.handle_pending_offline_users(online_timeout=0)
+        assert monitor.pending_status_changes == {
+            bob_id: UserConnectionStatus.ONLINE,
+            alice_id: UserConnectionStatus.ONLINE,
+            admin_id: UserConnectionStatus.OFFLINE,
+        }
+
+        with mock.patch.object(app_config, "USER__CONNECTION_STATUS_BATCH_DELAY", 60):
+            # INFO - batch delay is not elapsed yet
+            monitor.write_status_changes()
+            assert monitor.pending_status_changes
+            with mock.patch(
+                "tracim_backend.lib.user_connection_state_monitor.monitor.logger"
+            ) as logger:
+                monitor.write_status_changes(force=True)
+        assert not monitor.pending_status_changes
+        assert monitor.get_status_changes_timeout() is None
+        # INFO - only real changes are written: alice was already online, admin offline
+        logger.debug.assert_called_once_with(
+            monitor, "Set connection status of user {} to online".format(bob_id)
+        )
+        session.expire_all()
+        statuses = dict(session.query(User.user_id, User.connection_status))
+        assert statuses == {
+            admin_id: UserConnectionStatus.OFFLINE,
+            bob_id: UserConnectionStatus.ONLINE,
+            alice_id: UserConnectionStatus.ONLINE,
+        }
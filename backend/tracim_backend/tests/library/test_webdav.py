@@ -1,12 +1,18 @@
 # -*- coding: utf-8 -*-
+import datetime
 from unittest.mock import MagicMock
 
+from freezegun import freeze_time
 import pytest
+from wsgidav.dav_error import HTTP_REQUEST_ENTITY_TOO_LARGE
+from wsgidav.dav_error import DAVError
 
 from tracim_backend import WebdavAppFactory
 from tracim_backend.lib.core.notifications import DummyNotifier
+from tracim_backend.lib.utils.authorization import is_reader
 from tracim_backend.lib.webdav import TracimDavProvider
 from tracim_backend.lib.webdav import TracimDomainController
+from tracim_backend.lib.webdav.lock_storage import LockStorage
 from tracim_backend.lib.webdav.resources import FolderResource
 from tracim_backend.lib.webdav.resources import RootResource
 from tracim_backend.lib.webdav.resources import WorkspaceResource
@@ -41,6 +47,75 @@ def test_unit__initConfig__ok__nominal_case(self, settings):
         assert isinstance(config["provider_mapping"]["/"], TracimDavProvider)
         assert "domaincontroller" in config
         assert isinstance(config["domaincontroller"], TracimDomainController)
+        assert isinstance(config["locksmanager"], LockStorage)
+
+
+@pytest.mark.usefixtures("base_fixture")
+class TestWebdavLockStorage(object):
+    def _lock_dict(self, principal: str = "bob") -> dict:
+        return {
+            "type": "write",
+            "scope": "exclusive",
+            "depth": "infinity",
+            "owner": b"<owner>bob</owner>",
+            "timeout": 60,
+            "principal": principal,
+        }
+
+    def test_unit__create_get_delete_lock__ok__nominal_case(self, app_config):
+        lock_storage = LockStorage(app_config)
+        lock = lock_storage.create("/Recipes.space/Salads/", self._lock_dict())
+        assert lock["root"] == "/Recipes.space/Salads"
+        assert lock["token"]
+
+        # INFO - locks are shared between storages (e.g. processes)
+        other_lock_storage = LockStorage(app_config)
+        assert other_lock_storage.get(lock["token"]) == lock
+        refreshed_lock = other_lock_storage.refresh(lock["token"], 120)
+        assert refreshed_lock["timeout"] == 120
+        assert refreshed_lock["expire"] > lock["expire"]
+
+        assert lock_storage.delete(lock["token"]) is True
+        assert lock_storage.get(lock["token"]) is None
+        assert lock_storage.delete(lock["token"]) is False
+
+    def test_unit__get_lock_list__ok__root_and_children(self, app_config):
+        lock_storage = LockStorage(app_config)
+        root_lock = lock_storage.create("/Recipes.space", self._lock_dict())
+        child_lock = lock_storage.create("/Recipes.space/Salads", self._lock_dict())
+        lock_storage.create("/Recipes.space_2/Salads", self._lock_dict())
+        lock_storage.create("/Recipes%space/Salads", self._lock_dict())
+
+        assert lock_storage.getLockList(
+            "/Recipes.space", includeRoot=True, includeChildren=False, tokenOnly=True
+        ) == [root_lock["token"]]
+        assert lock_storage.getLockList(
+            "/Recipes.space", includeRoot=False, includeChildren=True, tokenOnly=True
+        ) == [child_lock["token"]]
+        locks = lock_storage.getLockList(
+            "/Recipes.space", includeRoot=True, includeChildren=True, tokenOnly=False
+        )
+        assert sorted(lock["token"] for lock in locks) == sorted(
+            [root_lock["token"], child_lock["token"]]
+        )
+
+    def test_unit__cleanup__ok__purge_expired_locks_by_batch(self, app_config):
+        lock_storage = LockStorage(app_config)
+        lock_storage.CLEANUP_BATCH_SIZE = 2
+        tokens = [
+            lock_storage.create("/Recipes.space/file{}".format(i), self._lock_dict())["token"]
+            for i in range(5)
+        ]
+        valid_lock = lock_storage.create("/Recipes.space/valid", self._lock_dict())
+        with freeze_time(datetime.datetime.utcnow() + datetime.timedelta(seconds=61)):
+            lock_storage.refresh(valid_lock["token"], 120)
+            assert lock_storage.getLockList(
+                "/", includeRoot=True, includeChildren=True, tokenOnly=True
+            ) == [valid_lock["token"]]
+            assert lock_storage.cleanup() == 5
+        for token in tokens:
+            assert lock_storage.get(token) is None
+        assert lock_storage.get(valid_lock["token"])
 
 
 @pytest.mark.usefixtures("base_fixture")
@@ -164,6 +239,26 @@ def test_unit__list_content__ok(
             "Tiramisu Recipe.document.html" in content_names
         ), "Tiramisu Recipe.document.html should be in names ({0})".format(content_names)
 
+    def test_unit__list_content__ok__properties_from_listing(
+        self, app_config, webdav_provider, user_api_factory, webdav_environ_factory
+    ):
+        environ = webdav_environ_factory.get(
+            user_api_factory.get().get_one_by_email("bob@fsf.local")
+        )
+        webdav_put_new_test_file_helper(
+            webdav_provider, environ, "/Recipes.space/Salads/greek_salad.txt", b"Greek Salad\n"
+        )
+        salads_dir = webdav_provider.getResourceInst("/Recipes.space/Salads", environ)
+        children = salads_dir.getMemberList()
+        eq_(1, len(children), msg="Salads should list 1 File instead {0}".format(len(children)))
+        greek_salad = children[0]
+        # members of a listing share the collection content api
+        assert greek_salad.content_api is salads_dir.content_api
+        assert greek_salad.content.depot_file["content_length"] == 12
+        assert greek_salad.getContentLength() == 12
+        assert greek_salad.getContentType() == "text/plain"
+        assert is_reader in environ["tracim_context"].processed_path.granted_authorization_checkers
+
     def test_unit__get_content__ok(
         self, app_config, user_api_factory, webdav_provider, webdav_environ_factory, session
     ):
@@ -230,6 +325,47 @@ def test_unit__create_content__ok(
             ),
         )
 
+    def test_unit__create_content__ok__chunked_upload(
+        self, app_config, webdav_provider, webdav_environ_factory, user_api_factory
+    ):
+        environ = webdav_environ_factory.get(
+            user_api_factory.get().get_one_by_email("bob@fsf.local")
+        )
+        # INFO - chunked transfer: content length is not known in advance
+        environ.pop("CONTENT_LENGTH", None)
+        folder = webdav_provider.getResourceInst("/Recipes.space/Salads", environ)
+        new_resource = folder.createEmptyResource("greek_salad.txt")
+        write_object = new_resource.beginWrite(contentType="application/octet-stream")
+        for _ in range(1000):
+            write_object.write(b"Greek Salad\n")
+        write_object.close()
+        new_resource.endWrite(withErrors=False)
+
+        result = webdav_provider.getResourceInst("/Recipes.space/Salads/greek_salad.txt", environ)
+        assert result
+        assert result.content.depot_file.file.read() == b"Greek Salad\n" * 1000
+        assert result.getContentLength() == 12000
+
+    def test_unit__create_content__err__file_size_over_limit_while_streaming(
+        self, app_config, webdav_provider, webdav_environ_factory, user_api_factory
+    ):
+        app_config.LIMITATION__CONTENT_LENGTH_FILE_SIZE = 20
+        environ = webdav_environ_factory.get(
+            user_api_factory.get().get_one_by_email("bob@fsf.local")
+        )
+        environ.pop("CONTENT_LENGTH", None)
+        folder = webdav_provider.getResourceInst("/Recipes.space/Salads", environ)
+        new_resource = folder.createEmptyResource("greek_salad.txt")
+        write_object = new_resource.beginWrite(contentType="application/octet-stream")
+        write_object.write(b"Greek Salad\n")
+        with pytest.raises(DAVError) as exc_info:
+            write_object.write(b"Greek Salad\n")
+        assert exc_info.value.value == HTTP_REQUEST_ENTITY_TOO_LARGE
+        assert (
+            webdav_provider.getResourceInst("/Recipes.space/Salads/greek_salad.txt", environ)
+            is None
+        )
+
     def test_unit__create_delete_and_create_file__ok(
         self, app_config, webdav_provider, webdav_environ_factory, user_api_factory, session
     ):
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 import pytest
+from sqlalchemy.event import listen
+from sqlalchemy.event import remove
 
 from tracim_backend.lib.core.workspace import WorkspaceApi
 from tracim_backend.models.auth import AuthType
@@ -226,3 +228,38 @@ def test_unit__rename_workspace_same_name_other_workspace__ok__same_workspace_na
         wapi.create_workspace(label="business", save_now=True)
         workspace2 = wapi.create_workspace(label="meeting", save_now=True)
         wapi.update_workspace(workspace=workspace2, label="business", save_now=True, description="")
+
+    def test_unit__get_workspaces_with_context__ok__members_counted_in_one_query(
+        self, session, admin_user, app_config, user_api_factory, role_api_factory
+    ):
+        wapi = WorkspaceApi(session=session, current_user=admin_user, config=app_config)
+        business = wapi.create_workspace(label="business", save_now=True)
+        meeting = wapi.create_workspace(label="meeting", save_now=True)
+        bob = user_api_factory.get().create_user(
+            "bob@bob.bob", do_save=True, do_notify=False, profile=Profile.USER
+        )
+        role_api_factory.get().create_one(
+            bob, business, UserRoleInWorkspace.READER, with_notif=False
+        )
+        session.flush()
+        session.expire_all()
+        workspaces = [business, meeting]
+        for workspace in workspaces:
+            workspace.owner_id
+        statements = []
+
+        def add_statement(conn, cursor, statement, *args) -> None:
+            statements.append(statement)
+
+        listen(session.bind, "before_cursor_execute", add_statement)
+        try:
+            workspaces_in_context = wapi.get_workspaces_with_context(workspaces)
+            assert [workspace.number_of_members for workspace in workspaces_in_context] == [2, 1]
+            assert [workspace.owner.user_id for workspace in workspaces_in_context] == [
+                admin_user.user_id,
+                admin_user.user_id,
+            ]
+        finally:
+            remove(session.bind, "before_cursor_execute", add_statement)
+        # INFO - one query for members counts, one for owners
+        assert len(statements) == 2
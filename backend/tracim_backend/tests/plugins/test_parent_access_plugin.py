@@ -130,3 +130,48 @@ def test__add_new_user_to_parent_workspaces__ok__several_child_workspaces(
             assert child2_workspace.get_user_role(user_1) == WorkspaceRoles.CONTRIBUTOR.level
             assert parent_workspace.get_user_role(user_1) == WorkspaceRoles.READER.level
             transaction.commit()
+
+    def test__add_new_users_to_parent_workspaces__ok__bulk_update(
+        self,
+        admin_user,
+        session,
+        app_config,
+        workspace_api_factory,
+        role_api_factory,
+        user_api_factory,
+        load_parent_access_plugin,
+    ):
+        wapi = workspace_api_factory.get()
+        parent_workspace = wapi.create_workspace(
+            label="parent", default_user_role=WorkspaceRoles.READER
+        )
+        child_workspace = wapi.create_workspace(
+            label="child", parent=parent_workspace, default_user_role=WorkspaceRoles.CONTRIBUTOR
+        )
+        grandson_workspace = wapi.create_workspace(
+            label="grandson", parent=child_workspace, default_user_role=WorkspaceRoles.READER
+        )
+        uapi = user_api_factory.get()
+        user_1 = uapi.create_user(
+            email="u.1@u.u", auth_type=AuthType.INTERNAL, do_save=True, do_notify=False
+        )
+        user_2 = uapi.create_user(
+            email="u.2@u.u", auth_type=AuthType.INTERNAL, do_save=True, do_notify=False
+        )
+        role_api = role_api_factory.get()
+        role_api.create_one(user_2, child_workspace, WorkspaceRoles.CONTENT_MANAGER.level, False)
+        with load_parent_access_plugin:
+            role_api.bulk_update_workspace_members(
+                grandson_workspace,
+                {
+                    user_1.user_id: WorkspaceRoles.CONTENT_MANAGER.level,
+                    user_2.user_id: WorkspaceRoles.READER.level,
+                },
+            )
+
+            assert grandson_workspace.get_user_role(user_1) == WorkspaceRoles.CONTENT_MANAGER.level
+            assert child_workspace.get_user_role(user_1) == WorkspaceRoles.CONTRIBUTOR.level
+            assert parent_workspace.get_user_role(user_1) == WorkspaceRoles.READER.level
+            assert grandson_workspace.get_user_role(user_2) == WorkspaceRoles.READER.level
+            assert child_workspace.get_user_role(user_2) == WorkspaceRoles.CONTENT_MANAGER.level
+            assert parent_workspace.get_user_role(user_2) == WorkspaceRoles.READER.level
@@ -8,6 +8,7 @@
 from tracim_backend.exceptions import ReactionAlreadyExistError
 from tracim_backend.exceptions import UserNotMemberOfWorkspace
 from tracim_backend.extensions import hapic
+from tracim_backend.lib.core.content import ContentApi
 from tracim_backend.lib.core.reaction import ReactionLib
 from tracim_backend.lib.utils.authorization import can_delete_reaction
 from tracim_backend.lib.utils.authorization import check_right
@@ -15,13 +16,18 @@
 from tracim_backend.lib.utils.authorization import is_reader
 from tracim_backend.lib.utils.request import TracimRequest
 from tracim_backend.lib.utils.utils import generate_documentation_swagger_tag
+from tracim_backend.models.context_models import ReactionSummary
+from tracim_backend.models.data import Content
 from tracim_backend.models.reaction import Reaction
 from tracim_backend.views.controllers import Controller
+from tracim_backend.views.core_api.schemas import ContentIdsQuerySchema
 from tracim_backend.views.core_api.schemas import NoContentSchema
 from tracim_backend.views.core_api.schemas import ReactionPathSchema
 from tracim_backend.views.core_api.schemas import ReactionSchema
+from tracim_backend.views.core_api.schemas import ReactionSummarySchema
 from tracim_backend.views.core_api.schemas import SetReactionSchema
 from tracim_backend.views.core_api.schemas import WorkspaceAndContentIdPathSchema
+from tracim_backend.views.core_api.schemas import WorkspaceIdPathSchema
 from tracim_backend.views.swagger_generic_section import SWAGGER_TAG__CONTENT_ENDPOINTS
 
 SWAGGER_TAG__CONTENT_REACTION_SECTION = "Reactions"
@@ -57,6 +63,54 @@ def content_reactions(
         reaction_lib = ReactionLib(session=request.dbsession)
         return reaction_lib.get_all(content_id=request.current_content.content_id,)
 
+    @hapic.with_api_doc(tags=[SWAGGER_TAG__CONTENT_REACTION_ENDPOINTS])
+    @check_right(is_reader)
+    @hapic.input_path(WorkspaceAndContentIdPathSchema())
+    @hapic.output_body(ReactionSummarySchema(many=True))
+    def content_reaction_summaries(
+        self, context, request: TracimRequest, hapic_data=None
+    ) -> typing.List[ReactionSummary]:
+        """
+        Get reactions of a content aggregated by value, in order of first reaction
+        """
+        reaction_lib = ReactionLib(session=request.dbsession)
+        return reaction_lib.get_summaries(
+            content_ids=[request.current_content.content_id], user_id=request.current_user.user_id
+        )
+
+    @hapic.with_api_doc(tags=[SWAGGER_TAG__CONTENT_REACTION_ENDPOINTS])
+    @check_right(is_reader)
+    @hapic.input_path(WorkspaceIdPathSchema())
+    @hapic.input_query(ContentIdsQuerySchema())
+    @hapic.output_body(ReactionSummarySchema(many=True))
+    def workspace_reaction_summaries(
+        self, context, request: TracimRequest, hapic_data=None
+    ) -> typing.List[ReactionSummary]:
+        """
+        Get reactions of given contents of the space aggregated by value,
+        ordered by content id then in order of first reaction
+        """
+        content_ids = hapic_data.query.content_ids
+        if content_ids:
+            content_api = ContentApi(
+                current_user=request.current_user,
+                session=request.dbsession,
+                config=request.app_config,
+            )
+            # INFO - only keep readable contents of the space
+            content_ids = [
+                content_id
+                for (content_id,) in content_api.get_base_query(
+                    workspaces=[request.current_workspace]
+                )
+                .filter(Content.id.in_(content_ids))
+                .with_entities(Content.id)
+            ]
+        reaction_lib = ReactionLib(session=request.dbsession)
+        return reaction_lib.get_summaries(
+            content_ids=content_ids, user_id=request.current_user.user_id
+        )
+
     @hapic.with_api_doc(tags=[SWAGGER_TAG__CONTENT_REACTION_ENDPOINTS])
     @hapic.handle_exception(UserNotMemberOfWorkspace, HTTPStatus.BAD_REQUEST)
     @hapic.handle_exception(ReactionAlreadyExistError, HTTPStatus.BAD_REQUEST)
@@ -101,6 +155,24 @@ def bind(self, configurator: Configurator):
         )
         configurator.add_view(self.content_reactions, route_name="content_reactions")
 
+        # Get reactions aggregated by value
+        configurator.add_route(
+            "content_reaction_summaries",
+            "/workspaces/{workspace_id}/contents/{content_id}/reaction_summaries",
+            request_method="GET",
+        )
+        configurator.add_view(
+            self.content_reaction_summaries, route_name="content_reaction_summaries"
+        )
+        configurator.add_route(
+            "workspace_reaction_summaries",
+            "/workspaces/{workspace_id}/reaction_summaries",
+            request_method="GET",
+        )
+        configurator.add_view(
+            self.workspace_reaction_summaries, route_name="workspace_reaction_summaries"
+        )
+
         configurator.add_route(
             "content_reaction",
             "/workspaces/{workspace_id}/contents/{content_id}/reactions/{reaction_id}",
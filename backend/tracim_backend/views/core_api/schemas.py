@@ -8,6 +8,7 @@
 from marshmallow.fields import Field
 from marshmallow.fields import String
 from marshmallow.fields import ValidatedField
+from marshmallow.validate import Length
 from marshmallow.validate import OneOf
 
 from tracim_backend.app_models.contents import FILE_TYPE
@@ -55,6 +56,7 @@
 from tracim_backend.models.context_models import ContentCreation
 from tracim_backend.models.context_models import ContentFilter
 from tracim_backend.models.context_models import ContentIdsQuery
+from tracim_backend.models.context_models import ContentsTagsCreation
 from tracim_backend.models.context_models import ContentUpdate
 from tracim_backend.models.context_models import FileCreation
 from tracim_backend.models.context_models import FilePath
@@ -102,6 +104,7 @@
 from tracim_backend.models.context_models import WorkspaceAndUserPath
 from tracim_backend.models.context_models import WorkspaceCreate
 from tracim_backend.models.context_models import WorkspaceMemberInvitation
+from tracim_backend.models.context_models import WorkspaceMembersBulkUpdate
 from tracim_backend.models.context_models import WorkspacePath
 from tracim_backend.models.context_models import WorkspaceUpdate
 from tracim_backend.models.data import ActionDescription
@@ -789,6 +792,46 @@ def make_path_object(self, data: typing.Dict[str, typing.Any]):
         return WorkspaceMemberFilterQuery(**data)
 
 
+class WorkspaceMembersPageQuery(WorkspaceMemberFilterQuery):
+    def __init__(
+        self,
+        count: int,
+        page_token: typing.Optional[str] = None,
+        show_disabled_user: int = 0,
+        roles: str = "",
+        name_filter: typing.Optional[str] = None,
+    ):
+        super().__init__(show_disabled_user=show_disabled_user)
+        self.count = count
+        self.page_token = page_token
+        self.roles = [
+            WorkspaceRoles.get_role_from_slug(slug) for slug in string_to_list(roles, ",", str)
+        ]
+        self.name_filter = name_filter
+
+
+class WorkspaceMembersPageQuerySchema(BasePaginatedQuerySchema, WorkspaceMemberFilterQuerySchema):
+    roles = StrippedString(
+        validate=regex_string_as_list_of_string,
+        example="workspace-manager,contributor",
+        description="comma separated list of role slugs: only members with one of these roles "
+        "are returned",
+    )
+    name_filter = StrippedString(
+        example="john",
+        description="only return members whose public name or username contains this value",
+    )
+
+    @marshmallow.validates("roles")
+    def validate_roles(self, value: str) -> None:
+        for slug in string_to_list(value, ",", str):
+            user_role_validator(slug)
+
+    @post_load
+    def make_path_object(self, data: typing.Dict[str, typing.Any]):
+        return WorkspaceMembersPageQuery(**data)
+
+
 class WorkspaceIdSchema(marshmallow.Schema):
     workspace_id = marshmallow.fields.Int(
         example=4,
@@ -1210,6 +1253,46 @@ def has_user_id_email_or_username(self, data: dict, original_data: dict, **kwarg
             raise marshmallow.ValidationError("user_id, user_email or user_username required")
 
 
+class WorkspaceMembersBulkUpdateMemberSchema(WorkspaceMemberInviteSchema):
+    # INFO - original data given to nested many schemas validators is the whole list
+    @marshmallow.validates_schema
+    def has_user_id_email_or_username(self, data: dict, **kwargs) -> None:
+        if not (data.get("user_email") or data.get("user_username") or data.get("user_id")):
+            raise marshmallow.ValidationError("user_id, user_email or user_username required")
+
+
+class WorkspaceMembersBulkUpdateSchema(marshmallow.Schema):
+    members = marshmallow.fields.Nested(
+        WorkspaceMembersBulkUpdateMemberSchema,
+        many=True,
+        missing=list,
+        description="members to add to the workspace or whose role is updated",
+    )
+    removed_user_ids = marshmallow.fields.List(
+        marshmallow.fields.Int(example=5, validate=strictly_positive_int_validator),
+        missing=list,
+        description="ids of the users removed from the workspace",
+    )
+
+    @post_load
+    def make_workspace_members_bulk_update(
+        self, data: typing.Dict[str, typing.Any]
+    ) -> WorkspaceMembersBulkUpdate:
+        return WorkspaceMembersBulkUpdate(**data)
+
+    @marshmallow.validates_schema(pass_original=True)
+    def has_no_member_both_added_and_removed(
+        self, data: dict, original_data: dict, **kwargs
+    ) -> None:
+        member_ids = {
+            member.get("user_id")
+            for member in original_data.get("members") or []
+            if isinstance(member, dict)
+        }
+        if member_ids.intersection(data.get("removed_user_ids") or []):
+            raise marshmallow.ValidationError("a member can't be both updated and removed")
+
+
 class ResetPasswordRequestSchema(marshmallow.Schema):
     email = TracimEmail(
         example="hello@tracim.fr", default=None, allow_none=True, validate=user_email_validator
@@ -1529,6 +1612,10 @@ class Meta:
         description = "Workspace Member information"
 
 
+class WorkspaceMemberPageSchema(BasePaginatedSchemaPage):
+    items = marshmallow.fields.Nested(WorkspaceMemberSchema, many=True)
+
+
 class WorkspaceMemberCreationSchema(WorkspaceMemberSchema):
     newly_created = marshmallow.fields.Bool(
         exemple=False,
@@ -1542,6 +1629,11 @@ class WorkspaceMemberCreationSchema(WorkspaceMemberSchema):
     )
 
 
+class WorkspaceMembersBulkUpdateResultSchema(marshmallow.Schema):
+    members = marshmallow.fields.Nested(WorkspaceMemberCreationSchema, many=True)
+    removed_user_ids = marshmallow.fields.List(marshmallow.fields.Int(example=5))
+
+
 class TimezoneSchema(marshmallow.Schema):
     name = StrippedString(example="Europe/London")
 
@@ -1569,6 +1661,29 @@ class AboutSchema(marshmallow.Schema):
     website = marshmallow.fields.URL()
 
 
+class DatabasePoolStatisticsSchema(marshmallow.Schema):
+    name = StrippedString(example="web", description="Name of the application using the pool")
+    pool_status = StrippedString(
+        example="Pool size: 5  Connections in pool: 1 Current Overflow: -4 "
+        "Current Checked out connections: 0"
+    )
+    checkouts_count = marshmallow.fields.Int(example=42)
+    checked_out_count = marshmallow.fields.Int(
+        example=1, description="Number of connections currently checked out"
+    )
+    max_checked_out_count = marshmallow.fields.Int(example=3)
+    average_wait_time = marshmallow.fields.Float(
+        example=0.001, description="Average time waited for a connection, in seconds"
+    )
+    max_wait_time = marshmallow.fields.Float(example=0.01)
+    long_holds_count = marshmallow.fields.Int(
+        example=0,
+        description="Number of connections held longer than "
+        "database.connection_hold_warning_threshold",
+    )
+    max_hold_time = marshmallow.fields.Float(example=1.2)
+
+
 class ReservedUsernamesSchema(marshmallow.Schema):
     items = marshmallow.fields.List(String(example="all"), required=True)
 
@@ -1861,12 +1976,28 @@ class ReactionSchema(marshmallow.Schema):
     )
 
 
+class ReactionSummarySchema(marshmallow.Schema):
+    content_id = marshmallow.fields.Int(example=6, validate=strictly_positive_int_validator)
+    value = StrippedString(example="😀")
+    count = marshmallow.fields.Int(
+        example=3, validate=strictly_positive_int_validator, description="number of reactions"
+    )
+    user_reacted = marshmallow.fields.Bool(
+        example=True, description="true if the current user did react with this value"
+    )
+
+
 class TagSchema(marshmallow.Schema):
     tag_id = marshmallow.fields.Int(example=12, validate=strictly_positive_int_validator)
     workspace_id = marshmallow.fields.Int(example=6, validate=strictly_positive_int_validator)
     tag_name = StrippedString(example="todo")
 
 
+class ContentTagSchema(marshmallow.Schema):
+    tag_id = marshmallow.fields.Int(example=12, validate=strictly_positive_int_validator)
+    content_id = marshmallow.fields.Int(example=6, validate=strictly_positive_int_validator)
+
+
 class CommentSchema(marshmallow.Schema):
     content_id = marshmallow.fields.Int(example=6, validate=strictly_positive_int_validator)
     parent_id = marshmallow.fields.Int(example=34, validate=positive_int_validator)
@@ -1912,6 +2043,25 @@ def create_tag(self, data: typing.Dict[str, typing.Any]) -> object:
         return TagCreation(**data)
 
 
+class SetContentsTagsSchema(marshmallow.Schema):
+    content_ids = marshmallow.fields.List(
+        marshmallow.fields.Int(example=6, validate=strictly_positive_int_validator),
+        required=True,
+        validate=Length(min=1),
+        description="ids of the contents to tag",
+    )
+    tag_ids = marshmallow.fields.List(
+        marshmallow.fields.Int(example=12, validate=strictly_positive_int_validator),
+        required=True,
+        validate=Length(min=1),
+        description="ids of the tags to add to each content",
+    )
+
+    @post_load()
+    def create_contents_tags(self, data: typing.Dict[str, typing.Any]) -> object:
+        return ContentsTagsCreation(**data)
+
+
 class ContentModifyAbstractSchema(marshmallow.Schema):
     label = StrippedString(
         required=False,
@@ -12,7 +12,9 @@
 from tracim_backend.lib.core.system import SystemApi
 from tracim_backend.lib.core.user_custom_properties import UserCustomPropertiesApi
 from tracim_backend.lib.utils.authorization import check_right
+from tracim_backend.lib.utils.authorization import is_administrator
 from tracim_backend.lib.utils.authorization import is_user
+from tracim_backend.lib.utils.database_pool import get_database_pools_statistics
 from tracim_backend.lib.utils.request import TracimRequest
 from tracim_backend.lib.utils.utils import get_timezones_list
 from tracim_backend.views.controllers import Controller
@@ -20,6 +22,7 @@
 from tracim_backend.views.core_api.schemas import ApplicationSchema
 from tracim_backend.views.core_api.schemas import ConfigSchema
 from tracim_backend.views.core_api.schemas import ContentTypeSchema
+from tracim_backend.views.core_api.schemas import DatabasePoolStatisticsSchema
 from tracim_backend.views.core_api.schemas import ErrorCodeSchema
 from tracim_backend.views.core_api.schemas import GetUsernameAvailability
 from tracim_backend.views.core_api.schemas import ReservedUsernamesSchema
@@ -125,6 +128,16 @@ def about(self, context, request: TracimRequest, hapic_data=None):
         system_api = SystemApi(app_config, request.dbsession)
         return system_api.get_about()
 
+    @hapic.with_api_doc(tags=[SWAGGER_TAG_SYSTEM_ENDPOINTS])
+    @check_right(is_administrator)
+    @hapic.output_body(DatabasePoolStatisticsSchema(many=True))
+    def database_pools(self, context, request: TracimRequest, hapic_data=None):
+        """
+        Returns connection statistics of the database pools of the tracim process
+        answering the request.
+        """
+        return get_database_pools_statistics()
+
     @hapic.with_api_doc(tags=[SWAGGER_TAG_SYSTEM_ENDPOINTS])
     @hapic.output_body(ConfigSchema())
     def config(self, context, request: TracimRequest, hapic_data=None):
@@ -195,6 +208,10 @@ def bind(self, configurator: Configurator) -> None:
         configurator.add_route("about", "/system/about", request_method="GET")
         configurator.add_view(self.about, route_name="about")
 
+        # Database pools
+        configurator.add_route("database_pools", "/system/database_pools", request_method="GET")
+        configurator.add_view(self.database_pools, route_name="database_pools")
+
         # Config
         configurator.add_route("config", "/system/config", request_method="GET")
         configurator.add_view(self.config, route_name="config")
@@ -5,20 +5,29 @@
 
 from pyramid.config import Configurator
 
+from tracim_backend.exceptions import ContentNotFound
 from tracim_backend.exceptions import TagAlreadyExistsError
 from tracim_backend.exceptions import TagNotFound
 from tracim_backend.exceptions import UserNotMemberOfWorkspace
 from tracim_backend.extensions import hapic
+from tracim_backend.lib.core.content import ContentApi
 from tracim_backend.lib.core.tag import TagLib
 from tracim_backend.lib.utils.authorization import check_right
 from tracim_backend.lib.utils.authorization import is_contributor
 from tracim_backend.lib.utils.authorization import is_reader
 from tracim_backend.lib.utils.request import TracimRequest
 from tracim_backend.lib.utils.utils import generate_documentation_swagger_tag
+from tracim_backend.models.context_models import PaginatedObject
+from tracim_backend.models.data import Content
 from tracim_backend.models.tag import Tag
+from tracim_backend.models.tag import TagOnContent
 from tracim_backend.views.controllers import Controller
+from tracim_backend.views.core_api.schemas import BaseOptionalPaginatedQuerySchema
 from tracim_backend.views.core_api.schemas import ContentTagPathSchema
+from tracim_backend.views.core_api.schemas import ContentTagSchema
 from tracim_backend.views.core_api.schemas import NoContentSchema
+from tracim_backend.views.core_api.schemas import PaginatedContentDigestSchema
+from tracim_backend.views.core_api.schemas import SetContentsTagsSchema
 from tracim_backend.views.core_api.schemas import SetTagByNameSchema
 from tracim_backend.views.core_api.schemas import TagPathSchema
 from tracim_backend.views.core_api.schemas import TagSchema
@@ -108,6 +117,76 @@ def add_content_tag_by_id(self, context, request: TracimRequest, hapic_data=None
             do_save=True,
         )
 
+    @hapic.with_api_doc(tags=[SWAGGER_TAG__TAG_ENDPOINTS])
+    @check_right(is_reader)
+    @hapic.handle_exception(TagNotFound, HTTPStatus.BAD_REQUEST)
+    @hapic.input_path(TagPathSchema())
+    @hapic.input_query(BaseOptionalPaginatedQuerySchema())
+    @hapic.output_body(PaginatedContentDigestSchema())
+    def get_tag_contents(self, context, request: TracimRequest, hapic_data=None) -> PaginatedObject:
+        """
+        Get contents of the space which include the given tag, ordered by content id.
+        """
+        tag_lib = TagLib(session=request.dbsession)
+        tag = tag_lib.get_one(
+            tag_id=hapic_data.path.tag_id, workspace_id=request.current_workspace.workspace_id
+        )
+        content_api = ContentApi(
+            current_user=request.current_user, session=request.dbsession, config=request.app_config,
+        )
+        contents_page = tag_lib.get_contents(
+            tag,
+            content_query=content_api.get_base_query(workspaces=[request.current_workspace]),
+            count=hapic_data.query["count"],
+            page_token=hapic_data.query["page_token"],
+        )
+        contents = [content_api.get_content_in_context(content) for content in contents_page]
+        return PaginatedObject(contents_page, contents)
+
+    @hapic.with_api_doc(tags=[SWAGGER_TAG__TAG_ENDPOINTS])
+    @hapic.handle_exception(TagNotFound, HTTPStatus.BAD_REQUEST)
+    @hapic.handle_exception(ContentNotFound, HTTPStatus.BAD_REQUEST)
+    @check_right(is_contributor)
+    @hapic.input_path(WorkspaceIdPathSchema())
+    @hapic.input_body(SetContentsTagsSchema())
+    @hapic.output_body(ContentTagSchema(many=True))
+    def add_contents_tags(
+        self, context, request: TracimRequest, hapic_data=None
+    ) -> typing.List[TagOnContent]:
+        """
+        Add each given tag to each given content of the space.
+        Tags already on a content are ignored, only created content tags are returned.
+        """
+        tag_ids = set(hapic_data.body.tag_ids)
+        content_ids = set(hapic_data.body.content_ids)
+        tag_lib = TagLib(session=request.dbsession)
+        tags = tag_lib.get_all(
+            workspace_id=request.current_workspace.workspace_id, tag_ids=list(tag_ids)
+        )
+        if len(tags) != len(tag_ids):
+            raise TagNotFound(
+                "Tags {} were not found in space.".format(
+                    sorted(tag_ids - {tag.tag_id for tag in tags})
+                )
+            )
+        content_api = ContentApi(
+            current_user=request.current_user, session=request.dbsession, config=request.app_config,
+        )
+        contents = (
+            content_api.get_base_query(workspaces=[request.current_workspace])
+            .filter(Content.id.in_(content_ids))
+            .all()
+        )
+        if len(contents) != len(content_ids):
+            raise ContentNotFound(
+                "Contents {} were not found in space.".format(
+                    sorted(content_ids - {content.content_id for content in contents})
+                )
+            )
+        return tag_lib.add_tags_to_contents(
+            user=request.current_user, contents=contents, tags=tags, do_save=True
+        )
+
     @hapic.with_api_doc(tags=[SWAGGER_TAG__TAG_ENDPOINTS])
     @hapic.handle_exception(UserNotMemberOfWorkspace, HTTPStatus.BAD_REQUEST)
     @hapic.handle_exception(TagAlreadyExistsError, HTTPStatus.BAD_REQUEST)
@@ -175,6 +254,20 @@ def bind(self, configurator: Configurator):
         )
         configurator.add_view(self.get_tag, route_name="get_tag")
 
+        # Get contents of a tag
+        configurator.add_route(
+            "get_tag_contents",
+            "/workspaces/{workspace_id}/tags/{tag_id}/contents",
+            request_method="GET",
+        )
+        configurator.add_view(self.get_tag_contents, route_name="get_tag_contents")
+
+        # Add tags to contents
+        configurator.add_route(
+            "add_contents_tags", "/workspaces/{workspace_id}/tags/contents", request_method="POST",
+        )
+        configurator.add_view(self.add_contents_tags, route_name="add_contents_tags")
+
         # Add a tag to a workspace
         configurator.add_route(
             "add_workspace_tag", "/workspaces/{workspace_id}/tags", request_method="POST",
@@ -183,7 +183,7 @@ def user_workspace(self, context, request: TracimRequest, hapic_data=None):
             include_with_role=hapic_data.query.show_workspace_with_role,
             parents_ids=hapic_data.query.parent_ids,
         )
-        return [wapi.get_workspace_with_context(workspace) for workspace in workspaces]
+        return wapi.get_workspaces_with_context(workspaces)
 
     @hapic.with_api_doc(tags=[SWAGGER_TAG__USER_CONTENT_ENDPOINTS])
     @hapic.handle_exception(WorkspaceNotFound, HTTPStatus.BAD_REQUEST)
@@ -988,7 +988,7 @@ def get_accessible_workspaces(
         )
 
         workspaces = wapi.get_all_accessible_by_user(request.candidate_user)
-        return [wapi.get_workspace_with_context(workspace) for workspace in workspaces]
+        return wapi.get_workspaces_with_context(workspaces)
 
     @hapic.with_api_doc(tags=[SWAGGER_TAG__USER_SUBSCRIPTIONS_ENDPOINTS])
     @check_right(has_personal_access)
@@ -53,6 +53,7 @@
 from tracim_backend.models.context_models import ListItemsObject
 from tracim_backend.models.context_models import PaginatedObject
 from tracim_backend.models.context_models import UserRoleWorkspaceInContext
+from tracim_backend.models.context_models import WorkspaceMembersBulkUpdateResult
 from tracim_backend.models.data import ActionDescription
 from tracim_backend.models.data import Content
 from tracim_backend.models.data import ContentNamespaces
@@ -80,7 +81,11 @@
 from tracim_backend.views.core_api.schemas import WorkspaceMemberCreationSchema
 from tracim_backend.views.core_api.schemas import WorkspaceMemberFilterQuerySchema
 from tracim_backend.views.core_api.schemas import WorkspaceMemberInviteSchema
+from tracim_backend.views.core_api.schemas import WorkspaceMemberPageSchema
+from tracim_backend.views.core_api.schemas import WorkspaceMembersBulkUpdateResultSchema
+from tracim_backend.views.core_api.schemas import WorkspaceMembersBulkUpdateSchema
 from tracim_backend.views.core_api.schemas import WorkspaceMemberSchema
+from tracim_backend.views.core_api.schemas import WorkspaceMembersPageQuerySchema
 from tracim_backend.views.core_api.schemas import WorkspaceModifySchema
 from tracim_backend.views.core_api.schemas import WorkspaceSchema
 from tracim_backend.views.core_api.schemas import WorkspaceSubscriptionSchema
@@ -157,7 +162,7 @@ def workspaces(self, context, request: TracimRequest, hapic_data=None):
         )
 
         workspaces = wapi.get_all_children(parent_ids=hapic_data.query.parent_ids)
-        return [wapi.get_workspace_with_context(workspace) for workspace in workspaces]
+        return wapi.get_workspaces_with_context(workspaces)
 
     @hapic.with_api_doc(tags=[SWAGGER_TAG__WORKSPACE_ENDPOINTS])
     @hapic.handle_exception(EmptyLabelNotAllowed, HTTPStatus.BAD_REQUEST)
@@ -279,6 +284,37 @@ def workspaces_members(
         roles = rapi.get_all_for_workspace(workspace=request.current_workspace)
         return [rapi.get_user_role_workspace_with_context(user_role) for user_role in roles]
 
+    @hapic.with_api_doc(tags=[SWAGGER_TAG__WORKSPACE_MEMBERS_ENDPOINTS])
+    @check_right(can_see_workspace_information)
+    @hapic.input_path(WorkspaceIdPathSchema())
+    @hapic.input_query(WorkspaceMembersPageQuerySchema())
+    @hapic.output_body(WorkspaceMemberPageSchema())
+    def workspaces_members_page(
+        self, context, request: TracimRequest, hapic_data=None
+    ) -> PaginatedObject:
+        """
+        Returns a page of space members with their role, avatar, etc, ordered by user id.
+        Members can be filtered by role and by name.
+        """
+        app_config = request.registry.settings["CFG"]  # type: CFG
+        rapi = RoleApi(
+            current_user=request.current_user,
+            session=request.dbsession,
+            config=app_config,
+            show_disabled_user=hapic_data.query.show_disabled_user,
+        )
+        roles_page = rapi.get_workspace_members_page(
+            workspace_id=request.current_workspace.workspace_id,
+            roles=hapic_data.query.roles,
+            name_filter=hapic_data.query.name_filter,
+            page_token=hapic_data.query.page_token,
+            count=hapic_data.query.count,
+        )
+        return PaginatedObject(
+            roles_page,
+            [rapi.get_user_role_workspace_with_context(user_role) for user_role in roles_page],
+        )
+
     @hapic.with_api_doc(tags=[SWAGGER_TAG__WORKSPACE_MEMBERS_ENDPOINTS])
     @check_right(can_see_workspace_information)
     @hapic.input_path(WorkspaceAndUserIdPathSchema())
@@ -426,6 +462,118 @@ def create_workspaces_members_role(
             role, newly_created=newly_created, email_sent=email_sent
         )
 
+    @hapic.with_api_doc(tags=[SWAGGER_TAG__WORKSPACE_MEMBERS_ENDPOINTS])
+    @hapic.handle_exception(EmailValidationFailed, HTTPStatus.BAD_REQUEST)
+    @hapic.handle_exception(UserIsNotActive, HTTPStatus.BAD_REQUEST)
+    @hapic.handle_exception(UserIsDeleted, HTTPStatus.BAD_REQUEST)
+    @hapic.handle_exception(UserRoleNotFound, HTTPStatus.BAD_REQUEST)
+    @hapic.handle_exception(LastWorkspaceManagerRoleCantBeModified, HTTPStatus.BAD_REQUEST)
+    @check_right(can_modify_workspace)
+    @hapic.input_path(WorkspaceIdPathSchema())
+    @hapic.input_body(WorkspaceMembersBulkUpdateSchema())
+    @hapic.output_body(WorkspaceMembersBulkUpdateResultSchema())
+    def bulk_update_workspaces_members_role(
+        self, context, request: TracimRequest, hapic_data=None
+    ) -> WorkspaceMembersBulkUpdateResult:
+        """
+        Add members to this workspace, update their role and remove members in one request.
+        Roles are written in bulk and one workspace_member event is created for the whole update.
+        Unknown users are invited like with the member creation endpoint, their invitation email
+        being sent (or queued) once the update is committed.
+        This feature is for workspace managers and administrators.
+        """
+        app_config = request.registry.settings["CFG"]  # type: CFG
+        rapi = RoleApi(
+            current_user=request.current_user, session=request.dbsession, config=app_config
+        )
+        uapi = UserApi(
+            current_user=request.current_user,
+            session=request.dbsession,
+            config=app_config,
+            show_deactivated=True,
+            show_deleted=True,
+        )
+        members = hapic_data.body.members
+        users_by_id = {}
+        users_by_email = {}
+        users_by_username = {}
+        for user in uapi.get_many(
+            user_ids=[member.user_id for member in members if member.user_id],
+            emails=[member.user_email for member in members if member.user_email],
+            usernames=[member.user_username for member in members if member.user_username],
+        ):
+            users_by_id[user.user_id] = user
+            if user.email:
+                users_by_email[user.email] = user
+            if user.username:
+                users_by_username[user.username] = user
+
+        roles = {}  # type: typing.Dict[int, int]
+        newly_created_user_ids = set()
+        invitation_email_sent = (
+            app_config.EMAIL__NOTIFICATION__ACTIVATED
+            and app_config.NEW_USER__INVITATION__DO_NOTIFY
+            and app_config.JOBS__PROCESSING_MODE == app_config.CST.SYNC
+        )
+        for member in members:
+            if member.user_id:
+                user = users_by_id.get(member.user_id)
+            elif member.user_email:
+                user = users_by_email.get(member.user_email.lower())
+            else:
+                user = users_by_username.get(member.user_username)
+            if user is None:
+                if (
+                    member.user_id
+                    or not member.user_email
+                    or not uapi.allowed_to_invite_new_user(member.user_email)
+                ):
+                    raise UserDoesNotExist(
+                        'User "{}" not found in database'.format(
+                            member.user_id or member.user_email or member.user_username
+                        )
+                    )
+                user = uapi.create_user(
+                    auth_type=AuthType.UNKNOWN,
+                    email=member.user_email,
+                    password=password_generator()
+                    if app_config.NEW_USER__INVITATION__DO_NOTIFY
+                    else None,
+                    do_notify=app_config.NEW_USER__INVITATION__DO_NOTIFY,
+                    notify_after_commit=True,
+                    creation_type=UserCreationType.INVITATION,
+                    creation_author=request.current_user,
+                )
+                users_by_email[user.email] = user
+                newly_created_user_ids.add(user.user_id)
+            elif user.is_deleted:
+                raise UserIsDeleted(
+                    "User {} has been deleted. Unable to invite him.".format(user.user_id)
+                )
+            elif not user.is_active:
+                raise UserIsNotActive(
+                    "User {} is not activated. Unable to invite him".format(user.user_id)
+                )
+            roles[user.user_id] = WorkspaceRoles.get_role_from_slug(member.role).level
+
+        updated_roles = rapi.bulk_update_workspace_members(
+            workspace=request.current_workspace,
+            roles=roles,
+            removed_user_ids=hapic_data.body.removed_user_ids,
+            with_notif=app_config.EMAIL__NOTIFICATION__ENABLED_ON_INVITATION,
+        )
+        return WorkspaceMembersBulkUpdateResult(
+            members=[
+                rapi.get_user_role_workspace_with_context(
+                    role,
+                    newly_created=role.user_id in newly_created_user_ids,
+                    email_sent=invitation_email_sent and role.user_id in newly_created_user_ids,
+                )
+                for role in updated_roles
+            ],
+            removed_user_ids=hapic_data.body.removed_user_ids,
+        )
+
     @hapic.with_api_doc(tags=[SWAGGER_TAG__WORKSPACE_SUBSCRIPTION_ENDPOINTS])
     @check_right(can_modify_workspace)
     @hapic.input_path(WorkspaceIdPathSchema())
@@ -816,6 +964,12 @@ def bind(self, configurator: Configurator) -> None:
             "workspace_members", "/workspaces/{workspace_id}/members", request_method="GET"
         )
         configurator.add_view(self.workspaces_members, route_name="workspace_members")
+        configurator.add_route(
+            "workspace_members_page",
+            "/workspaces/{workspace_id}/paginated_members",
+            request_method="GET",
+        )
+        configurator.add_view(self.workspaces_members_page, route_name="workspace_members_page")
         # Workspace Members (Role) Individual
         configurator.add_route(
             "workspace_member_role",
@@ -839,6 +993,15 @@ def bind(self, configurator: Configurator) -> None:
         configurator.add_view(
             self.create_workspaces_members_role, route_name="create_workspace_member"
         )
+        # Add, update and remove Workspace Members roles in bulk
+        configurator.add_route(
+            "bulk_update_workspace_members",
+            "/workspaces/{workspace_id}/members",
+            request_method="PATCH",
+        )
+        configurator.add_view(
+            self.bulk_update_workspaces_members_role, route_name="bulk_update_workspace_members"
+        )
         # Delete Workspace Members roles
         configurator.add_route(
             "delete_workspace_member",